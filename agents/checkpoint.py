@@ -0,0 +1,503 @@
+"""LangGraph 체크포인터 — SQLite(WAL) 디스크 저장 + 인터럽트 시점 압축"""
+
+import json
+import random
+import sqlite3
+import threading
+from collections.abc import AsyncIterator, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+# fork 시 복제하는 pending write — 인터럽트만 (재개 값/완료된 태스크 출력은 제외)
+_INTERRUPT_IDX = WRITES_IDX_MAP["__interrupt__"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    blob BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    thread_id TEXT NOT NULL,
+    chunk_key TEXT NOT NULL,
+    content TEXT NOT NULL,
+    usage TEXT NOT NULL,
+    PRIMARY KEY (thread_id, chunk_key)
+);
+"""
+
+
+class SqliteCheckpointer(BaseCheckpointSaver[str]):
+    """
+    SQLite 체크포인터 (WAL 모드, 프로세스 내 공유 커넥션).
+
+    체크포인트 본문과 채널 값을 분리 저장: 슈퍼스텝마다 버전이 바뀐 채널만
+    blobs에 새 행이 추가되므로 변하지 않은 ko_review_results 등은 재저장되지 않음.
+    prune()으로 인터럽트 이후 이전 체크포인트와 참조되지 않는 blob을 제거하면
+    스레드당 디스크/RAM 사용량이 실행 길이와 무관하게 유지됨.
+    keep으로 고정한 체크포인트(예: ko_approval 인터럽트)는 압축 후에도 남으며,
+    fork_checkpoint()로 새 thread에 복제해 그 시점부터 재개할 수 있음.
+    chunks 테이블은 노드 실행 중 완료된 LLM 청크 응답 저널 (agents.chunk_journal) —
+    노드가 끝나기 전에 프로세스가 죽어도 완료분은 남아 재개 시 재사용됨.
+    HITL 1 대기 중 사전 번역 결과도 "spec:" 접두 키로 같은 테이블에 기록됨.
+    """
+
+    def __init__(self, db_path: str, *, serde=None):
+        super().__init__(serde=serde)
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    # ── 내부 헬퍼 ──
+
+    def _load_blobs(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> dict:
+        values = {}
+        for channel, version in versions.items():
+            row = self.conn.execute(
+                "SELECT type, blob FROM blobs WHERE thread_id=? AND checkpoint_ns=? "
+                "AND channel=? AND version=?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row and row[0] != "empty":
+                values[channel] = self.serde.loads_typed((row[0], row[1]))
+        return values
+
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> list:
+        rows = self.conn.execute(
+            "SELECT task_id, channel, type, blob FROM writes WHERE thread_id=? "
+            "AND checkpoint_ns=? AND checkpoint_id=? ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, ch, self.serde.loads_typed((t, b))) for task_id, ch, t, b in rows]
+
+    def _make_tuple(self, thread_id: str, checkpoint_ns: str, row: tuple) -> CheckpointTuple:
+        checkpoint_id, parent_id, c_type, c_blob, m_type, m_blob = row
+        checkpoint: Checkpoint = self.serde.loads_typed((c_type, c_blob))
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_blobs(
+                    thread_id, checkpoint_ns, checkpoint["channel_versions"]
+                ),
+            },
+            metadata=self.serde.loads_typed((m_type, m_blob)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    # ── BaseCheckpointSaver 구현 ──
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        query = (
+            "SELECT checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, "
+            "metadata FROM checkpoints WHERE thread_id=? AND checkpoint_ns=?"
+        )
+        params: tuple = (thread_id, checkpoint_ns)
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id=?"
+            params += (checkpoint_id,)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self.lock:
+            row = self.conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            return self._make_tuple(thread_id, checkpoint_ns, row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, "
+            "checkpoint, metadata_type, metadata FROM checkpoints WHERE 1=1"
+        )
+        params: tuple = ()
+        if config:
+            query += " AND thread_id=?"
+            params += (config["configurable"]["thread_id"],)
+            if (ns := config["configurable"].get("checkpoint_ns")) is not None:
+                query += " AND checkpoint_ns=?"
+                params += (ns,)
+            if checkpoint_id := get_checkpoint_id(config):
+                query += " AND checkpoint_id=?"
+                params += (checkpoint_id,)
+        if before and (before_id := get_checkpoint_id(before)):
+            query += " AND checkpoint_id<?"
+            params += (before_id,)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        for thread_id, checkpoint_ns, *row in rows:
+            if limit is not None and limit <= 0:
+                break
+            with self.lock:
+                tup = self._make_tuple(thread_id, checkpoint_ns, tuple(row))
+            if filter and not all(tup.metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield tup
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        c = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        blob_rows = []
+        for channel, version in new_versions.items():
+            t, b = (
+                self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b"")
+            )
+            blob_rows.append((thread_id, checkpoint_ns, channel, str(version), t, b))
+        c_type, c_blob = self.serde.dumps_typed(c)
+        m_type, m_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", blob_rows
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id, checkpoint_ns, checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    c_type, c_blob, m_type, m_blob,
+                ),
+            )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            t, b = self.serde.dumps_typed(value)
+            rows.append((
+                thread_id, checkpoint_ns, checkpoint_id, task_id,
+                WRITES_IDX_MAP.get(channel, idx), channel, t, b, task_path,
+            ))
+        # 특수 채널(ERROR/INTERRUPT 등, idx<0)은 덮어쓰기, 일반 쓰기는 최초 1회만
+        with self.lock, self.conn:
+            for row in rows:
+                verb = "INSERT OR REPLACE" if row[4] < 0 else "INSERT OR IGNORE"
+                self.conn.execute(f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self.lock, self.conn:
+            for table in ("checkpoints", "blobs", "writes", "chunks"):
+                self.conn.execute(f"DELETE FROM {table} WHERE thread_id=?", (thread_id,))
+
+    def prune(
+        self,
+        thread_ids: Sequence[str],
+        *,
+        strategy: str = "keep_latest",
+        keep: Sequence[str] = (),
+    ) -> None:
+        """
+        스레드 압축. "keep_latest": 네임스페이스별 최신 체크포인트와 그 pending
+        writes(인터럽트 포함), 그리고 남은 체크포인트가 참조하는 blob만 남김.
+        keep에 지정한 checkpoint_id는 최신이 아니어도 함께 보존 (fork 기준점용).
+        "delete": 스레드 전체 삭제.
+        """
+        if strategy == "delete":
+            for thread_id in thread_ids:
+                self.delete_thread(thread_id)
+            return
+
+        with self.lock, self.conn:
+            for thread_id in thread_ids:
+                latest_rows = self.conn.execute(
+                    "SELECT checkpoint_ns, MAX(checkpoint_id) FROM checkpoints "
+                    "WHERE thread_id=? GROUP BY checkpoint_ns",
+                    (thread_id,),
+                ).fetchall()
+                for checkpoint_ns, latest_id in latest_rows:
+                    keep_ids = {latest_id, *keep}
+                    marks = ",".join("?" * len(keep_ids))
+                    scope = (thread_id, checkpoint_ns)
+                    kept = self.conn.execute(
+                        "SELECT type, checkpoint FROM checkpoints WHERE thread_id=? "
+                        f"AND checkpoint_ns=? AND checkpoint_id IN ({marks})",
+                        (*scope, *keep_ids),
+                    ).fetchall()
+                    referenced = {
+                        (ch, str(ver))
+                        for c_type, c_blob in kept
+                        for ch, ver in self.serde.loads_typed((c_type, c_blob))[
+                            "channel_versions"
+                        ].items()
+                    }
+                    self.conn.execute(
+                        "DELETE FROM checkpoints WHERE thread_id=? AND checkpoint_ns=? "
+                        f"AND checkpoint_id NOT IN ({marks})",
+                        (*scope, *keep_ids),
+                    )
+                    self.conn.execute(
+                        "DELETE FROM writes WHERE thread_id=? AND checkpoint_ns=? "
+                        f"AND checkpoint_id NOT IN ({marks})",
+                        (*scope, *keep_ids),
+                    )
+                    live = self.conn.execute(
+                        "SELECT channel, version FROM blobs WHERE thread_id=? AND checkpoint_ns=?",
+                        scope,
+                    ).fetchall()
+                    stale = [
+                        (thread_id, checkpoint_ns, ch, ver)
+                        for ch, ver in live
+                        if (ch, ver) not in referenced
+                    ]
+                    self.conn.executemany(
+                        "DELETE FROM blobs WHERE thread_id=? AND checkpoint_ns=? "
+                        "AND channel=? AND version=?",
+                        stale,
+                    )
+
+    def fork_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_id: str,
+        new_thread_id: str,
+        checkpoint_ns: str = "",
+    ) -> RunnableConfig:
+        """
+        체크포인트 1개를 새 thread로 복제 (본문 + 인터럽트 write + 참조 blob).
+        값은 역직렬화하지 않고 SQL로 그대로 복사하므로 노드 재실행 없이 즉시 완료.
+        원 thread에서 이미 재개된 뒤라도 resume 값/태스크 출력 write는 복사하지 않으므로
+        새 thread는 인터럽트 대기 상태 그대로 시작됨 (복제된 체크포인트가 루트).
+        """
+        src = (thread_id, checkpoint_ns, checkpoint_id)
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT type, checkpoint FROM checkpoints WHERE thread_id=? "
+                "AND checkpoint_ns=? AND checkpoint_id=?",
+                src,
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Checkpoint not found: {thread_id}/{checkpoint_id}")
+            versions = self.serde.loads_typed(row)["channel_versions"]
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints SELECT ?, checkpoint_ns, checkpoint_id, "
+                "NULL, type, checkpoint, metadata_type, metadata FROM checkpoints "
+                "WHERE thread_id=? AND checkpoint_ns=? AND checkpoint_id=?",
+                (new_thread_id, *src),
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO writes SELECT ?, checkpoint_ns, checkpoint_id, "
+                "task_id, idx, channel, type, blob, task_path FROM writes "
+                "WHERE thread_id=? AND checkpoint_ns=? AND checkpoint_id=? AND idx=?",
+                (new_thread_id, *src, _INTERRUPT_IDX),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO blobs SELECT ?, checkpoint_ns, channel, version, "
+                "type, blob FROM blobs WHERE thread_id=? AND checkpoint_ns=? "
+                "AND channel=? AND version=?",
+                [
+                    (new_thread_id, thread_id, checkpoint_ns, ch, str(ver))
+                    for ch, ver in versions.items()
+                ],
+            )
+        return {
+            "configurable": {
+                "thread_id": new_thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    # ── 청크 저널 ──
+
+    def get_chunk(self, thread_id: str, chunk_key: str) -> Optional[tuple[str, dict]]:
+        """저널에 기록된 청크 응답 (content, usage). 없으면 None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT content, usage FROM chunks WHERE thread_id=? AND chunk_key=?",
+                (thread_id, chunk_key),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put_chunk(self, thread_id: str, chunk_key: str, content: str, usage: dict) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?)",
+                (thread_id, chunk_key, content, json.dumps(usage)),
+            )
+
+    def list_chunks(self, thread_id: str, prefix: str) -> Sequence[tuple[str, str, dict]]:
+        """chunk_key가 prefix로 시작하는 기록 전체 [(chunk_key, content, usage)]"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT chunk_key, content, usage FROM chunks "
+                "WHERE thread_id=? AND substr(chunk_key, 1, ?)=? ORDER BY chunk_key",
+                (thread_id, len(prefix), prefix),
+            ).fetchall()
+        return [(key, content, json.loads(usage)) for key, content, usage in rows]
+
+    def count_chunks(self, thread_id: str) -> int:
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM chunks WHERE thread_id=?", (thread_id,)
+            ).fetchone()[0]
+
+    def clear_chunks(self, thread_id: str) -> None:
+        """phase 완료(인터럽트 도달) 후 저널 정리 — 완료된 노드 출력은 체크포인트에 있음"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM chunks WHERE thread_id=?", (thread_id,))
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ── async (동기 구현 위임) ──
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self.delete_thread(thread_id)
+
+    async def aprune(
+        self,
+        thread_ids: Sequence[str],
+        *,
+        strategy: str = "keep_latest",
+        keep: Sequence[str] = (),
+    ) -> None:
+        self.prune(thread_ids, strategy=strategy, keep=keep)
+
+
+_checkpointer: Optional[SqliteCheckpointer] = None
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> SqliteCheckpointer:
+    """프로세스 공용 SQLite 체크포인터 (lazy init)"""
+    global _checkpointer
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            from backend.config import get_checkpoint_db_path
+
+            _checkpointer = SqliteCheckpointer(get_checkpoint_db_path())
+        return _checkpointer
@@ -0,0 +1,82 @@
+"""청크 저널 — 노드 실행 중 완료된 LLM 청크 응답을 즉시 디스크에 기록 (크래시 재개용)"""
+
+import hashlib
+import logging
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agents import llm
+
+logger = logging.getLogger("devlocal.journal")
+
+
+class ChunkJournal:
+    """
+    노드 실행(슈퍼스텝) 1회 범위의 청크 응답 저널.
+
+    노드 결과는 노드가 반환될 때만 체크포인트에 기록되므로, 긴 번역 도중
+    프로세스가 죽으면 완료된 청크도 모두 사라진다. 저널은 청크마다 LLM 응답
+    원문 + 사용량을 체크포인터(chunks 테이블)에 기록하고, 같은 체크포인트에서
+    재개된 노드는 동일 프롬프트의 청크를 LLM 호출 없이 재사용한다 (누락분만 과금).
+
+    키 = (thread_id, langgraph_step, 노드명, 모델, 프롬프트) 해시 — 재시도 라운드는
+    step이 달라 서로 섞이지 않음. config["configurable"]["chunk_journal"]이
+    없으면 (Streamlit 등) 비활성 — completion()은 llm.completion과 동일하게 동작.
+    """
+
+    def __init__(self, config: Optional[RunnableConfig]):
+        configurable = (config or {}).get("configurable", {})
+        metadata = (config or {}).get("metadata", {})
+        self._store = configurable.get("chunk_journal")
+        self._thread_id = configurable.get("thread_id", "")
+        self._scope = f"{metadata.get('langgraph_step', '')}:{metadata.get('langgraph_node', '')}"
+        self._pending: Optional[tuple[str, str, dict]] = None
+        # 저널에서 복원한 청크 수 (노드 로그용)
+        self.replayed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._store is not None and bool(self._thread_id)
+
+    def _key(self, kwargs: dict) -> str:
+        h = hashlib.sha256(self._scope.encode("utf-8"))
+        h.update(str(kwargs.get("model", "")).encode("utf-8"))
+        for message in kwargs.get("messages", []):
+            h.update(b"\0")
+            h.update(str(message.get("content", "")).encode("utf-8"))
+        return h.hexdigest()
+
+    def completion(self, cancel_token=None, **kwargs) -> tuple[str, dict]:
+        """
+        저널에 같은 청크가 있으면 기록된 (content, usage) 반환, 없으면 LLM 호출.
+        새 응답은 commit()을 호출해야 저널에 기록됨 (파싱 성공 후 확정).
+        """
+        self._pending = None
+        if not self.enabled:
+            response = llm.completion(cancel_token, **kwargs)
+            return response.choices[0].message.content, llm.usage_of(response)
+
+        key = self._key(kwargs)
+        recorded = self._store.get_chunk(self._thread_id, key)
+        if recorded is not None:
+            self.replayed += 1
+            return recorded
+
+        response = llm.completion(cancel_token, **kwargs)
+        content = response.choices[0].message.content
+        usage = llm.usage_of(response)
+        self._pending = (key, content, usage)
+        return content, usage
+
+    def commit(self):
+        """직전 completion()의 새 응답을 저널에 기록 (재사용된 청크/비활성 시 no-op)"""
+        if self._pending is None:
+            return
+        key, content, usage = self._pending
+        self._pending = None
+        try:
+            self._store.put_chunk(self._thread_id, key, content, usage)
+        except Exception as e:
+            # 저널 기록 실패는 실행을 막지 않음 (재개 시 해당 청크만 재호출)
+            logger.warning("Chunk journal write failed (thread=%s): %s", self._thread_id, e)
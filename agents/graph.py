@@ -2,8 +2,10 @@
 
 import re
 import json
-import litellm
+import threading
 from langchain_core.runnables import RunnableConfig
+from agents import llm
+from agents.chunk_journal import ChunkJournal
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.types import interrupt
@@ -16,6 +18,7 @@ from agents.nodes.translator import translator_node
 from utils.drip_feed import drip_feed_emit
 from agents.nodes.reviewer import reviewer_node
 from agents.nodes.writer import writer_node
+from utils.row_table import get_row_table
 from backend.config import get_xai_api_key
 from config.constants import LLM_MODEL, REQUIRED_COLUMNS, CHUNK_SIZE, TAG_PATTERNS
 
@@ -27,8 +30,8 @@ def ko_review_node(state: LocalizationState, config: RunnableConfig) -> dict:
     한국어 맞춤법/띄어쓰기 검수 — AI 분석만 수행.
     interrupt는 별도 ko_approval_node에서 처리.
     """
-    original_data = state.get("original_data", [])
-    logs = list(state.get("logs", []))
+    table = get_row_table(state.get("row_table_id", ""))
+    logs = []
     total_input_tokens = state.get("total_input_tokens", 0)
     total_output_tokens = state.get("total_output_tokens", 0)
     total_reasoning_tokens = state.get("total_reasoning_tokens", 0)
@@ -36,13 +39,16 @@ def ko_review_node(state: LocalizationState, config: RunnableConfig) -> dict:
 
     # 청크별 이벤트 emitter (없으면 무시)
     emitter = config.get("configurable", {}).get("event_emitter") if config else None
+    # 취소 토큰 (없으면 취소 불가 — Streamlit 등)
+    cancel_token = config.get("configurable", {}).get("cancel_token") if config else None
+    # 완료 청크 저널 (크래시 후 같은 체크포인트에서 재개 시 완료분 재사용)
+    journal = ChunkJournal(config)
 
-    # ── Fast path: Cancel 복귀 시 캐시된 결과 재사용 (LLM 스킵) ──
+    # ── Fast path: state에 검수 결과가 미리 주입된 경우 재사용 (LLM 스킵) ──
     existing_results = state.get("ko_review_results", [])
     if existing_results:
         logs.append(f"[한국어 검수] 캐시 결과 사용: {len(existing_results)}행 (스킵)")
         return {
-            "ko_review_results": existing_results,
             "total_input_tokens": total_input_tokens,
             "total_output_tokens": total_output_tokens,
             "total_reasoning_tokens": total_reasoning_tokens,
@@ -52,14 +58,12 @@ def ko_review_node(state: LocalizationState, config: RunnableConfig) -> dict:
 
     api_key = get_xai_api_key()
 
-    # 한국어 원문 수집
-    ko_rows = []
-    for row in original_data:
-        key = row.get(REQUIRED_COLUMNS["key"], "")
-        ko_text = row.get(REQUIRED_COLUMNS["korean"], "")
-        row_index = row.get("_row_index")
-        if ko_text:
-            ko_rows.append({"key": key, REQUIRED_COLUMNS["korean"]: ko_text, "_row_index": row_index})
+    # 한국어 원문 수집 — (row_index, key, korean) 튜플 (행 dict 복사 없음)
+    ko_rows = [
+        (ri, key, ko_text)
+        for ri, key, ko_text in table.iter_rows(REQUIRED_COLUMNS["key"], REQUIRED_COLUMNS["korean"])
+        if ko_text
+    ]
 
     logs.append(f"[한국어 검수] 대상: {len(ko_rows)}행")
 
@@ -69,24 +73,28 @@ def ko_review_node(state: LocalizationState, config: RunnableConfig) -> dict:
     total_ko_rows = len(ko_rows)
     processed_count = 0
     # 태그 검증용 원문 맵 (per-chunk 검증에 사용)
-    original_map = {r["key"]: r[REQUIRED_COLUMNS["korean"]] for r in ko_rows}
+    original_map = {key: ko_text for _, key, ko_text in ko_rows}
     # row_index 맵 (순서 기반 — 중복 Key 대응)
     key_to_row_indices: dict[str, list[int]] = {}
-    for r in ko_rows:
-        key_to_row_indices.setdefault(r["key"], []).append(r.get("_row_index"))
+    for ri, key, _ in ko_rows:
+        key_to_row_indices.setdefault(key, []).append(ri)
     # 전역 소비 카운터 (청크 간 연속)
     key_consume_counter: dict[str, int] = {}
     restored_count = 0
 
     for chunk_start in range(0, len(ko_rows), CHUNK_SIZE):
+        # 청크 사이 취소 확인
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
         chunk = ko_rows[chunk_start:chunk_start + CHUNK_SIZE]
         user_content = "\n\n".join(
-            f"Key: {r['key']}\nKorean: {r[REQUIRED_COLUMNS['korean']]}"
-            for r in chunk
+            f"Key: {key}\nKorean: {ko_text}"
+            for _, key, ko_text in chunk
         )
 
         try:
-            response = litellm.completion(
+            content, usage = journal.completion(
+                cancel_token,
                 model=LLM_MODEL,
                 api_key=api_key,
                 messages=[
@@ -96,20 +104,17 @@ def ko_review_node(state: LocalizationState, config: RunnableConfig) -> dict:
                 timeout=120,
             )
 
-            total_input_tokens += getattr(response.usage, "prompt_tokens", 0)
-            total_output_tokens += getattr(
-                response.usage, "completion_tokens", 0
-            )
-            if hasattr(response.usage, "completion_tokens_details") and response.usage.completion_tokens_details:
-                total_reasoning_tokens += getattr(response.usage.completion_tokens_details, "reasoning_tokens", 0) or 0
-            if hasattr(response.usage, "prompt_tokens_details") and response.usage.prompt_tokens_details:
-                total_cached_tokens += getattr(response.usage.prompt_tokens_details, "cached_tokens", 0) or 0
+            total_input_tokens += usage["input_tokens"]
+            total_output_tokens += usage["output_tokens"]
+            total_reasoning_tokens += usage["reasoning_tokens"]
+            total_cached_tokens += usage["cached_tokens"]
 
-            content = response.choices[0].message.content.strip()
+            content = content.strip()
             if content.startswith("```"):
                 content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
 
             items = json.loads(content)
+            journal.commit()
             # LLM 필드 변환: changes → comment, has_issue 추가 + row_index 매칭
             for item in items:
                 item["comment"] = item.pop("changes", "")
@@ -154,10 +159,14 @@ def ko_review_node(state: LocalizationState, config: RunnableConfig) -> dict:
                     total=total_ko_rows,
                 )
 
+        except llm.PipelineCancelled:
+            raise
         except Exception as e:
             processed_count += len(chunk)
             logs.append(f"[한국어 검수] 오류: {e}")
 
+    if journal.replayed:
+        logs.append(f"[한국어 검수] 저널에서 완료 청크 {journal.replayed}개 복원 (LLM 재호출 생략)")
     if restored_count:
         logs.append(
             f"[한국어 검수] 태그 손상 수정 {restored_count}건 원본 복원"
@@ -181,7 +190,7 @@ def ko_approval_node(state: LocalizationState) -> dict:
     한국어 검수 결과를 사용자에게 보여주고 승인 대기 (HITL 1).
     """
     ko_review_results = state.get("ko_review_results", [])
-    logs = list(state.get("logs", []))
+    logs = []
 
     # HITL 1 — 사용자 승인 대기
     approval = interrupt({
@@ -206,7 +215,7 @@ def final_approval_node(state: LocalizationState) -> dict:
     """
     review_results = state.get("review_results", [])
     failed_rows = state.get("failed_rows", [])
-    logs = list(state.get("logs", []))
+    logs = []
 
     logs.append(
         f"[최종 승인 대기] 번역 완료: {len(review_results)}건, "
@@ -246,8 +255,11 @@ def should_write(state: LocalizationState) -> str:
 
 # ── 그래프 빌드 ───────────────────────────────────────────────────────
 
-def build_graph():
-    """LangGraph StateGraph 구성 및 컴파일"""
+def build_graph(checkpointer=None):
+    """
+    LangGraph StateGraph 구성 및 컴파일.
+    checkpointer 미지정 시 MemorySaver (Streamlit 단일 세션용).
+    """
     workflow = StateGraph(LocalizationState)
 
     # 노드 등록
@@ -274,8 +286,35 @@ def build_graph():
     workflow.add_conditional_edges("final_approval", should_write)
     workflow.add_edge("writer", END)
 
-    # 체크포인터 (MemorySaver — 세션 내 유지)
-    checkpointer = MemorySaver()
+    if checkpointer is None:
+        checkpointer = MemorySaver()
     graph = workflow.compile(checkpointer=checkpointer)
 
     return graph, checkpointer
+
+
+# ── 공용 컴파일 그래프 (FastAPI 세션 공유) ───────────────────────────
+
+_shared_graph = None
+_shared_checkpointer = None
+_shared_graph_lock = threading.Lock()
+
+
+def get_graph(checkpointer=None):
+    """
+    프로세스 공용 컴파일 그래프 — 세션은 thread_id로만 격리.
+    checkpointer 미지정 시 공용 SQLite 체크포인터 사용 (최초 1회 컴파일).
+    다른 checkpointer를 넘기면 그 saver로 한 번 재컴파일해 교체 (저장소 교체용).
+    반환: (graph, checkpointer)
+    """
+    global _shared_graph, _shared_checkpointer
+    with _shared_graph_lock:
+        if checkpointer is None:
+            if _shared_graph is not None:
+                return _shared_graph, _shared_checkpointer
+            from agents.checkpoint import get_checkpointer
+
+            checkpointer = get_checkpointer()
+        if _shared_graph is None or checkpointer is not _shared_checkpointer:
+            _shared_graph, _shared_checkpointer = build_graph(checkpointer)
+        return _shared_graph, _shared_checkpointer
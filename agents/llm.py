@@ -0,0 +1,143 @@
+"""LLM 호출 래퍼 — 협조적 취소(CancellationToken) + 사용량 집계"""
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError as FutureCancelledError
+from typing import Optional
+
+import litellm
+
+from utils.job_scheduler import job_scheduler
+
+
+class PipelineCancelled(Exception):
+    """사용자 취소로 파이프라인 실행 중단"""
+
+
+class CancellationToken:
+    """
+    실행(run) 단위 취소 토큰 — config["configurable"]["cancel_token"]으로 노드에 전달.
+
+    - 노드는 청크 사이마다 raise_if_cancelled()로 확인
+    - completion()은 진행 중인 HTTP 요청을 즉시 중단
+    - 완료된 응답의 토큰 사용량을 누적 (취소되어 state에 반영되지 않은 비용 보고용)
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list = []
+        self.usage = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "reasoning_tokens": 0,
+            "cached_tokens": 0,
+            "requests": 0,
+            "aborted_requests": 0,
+        }
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for cb in callbacks:
+            cb()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise PipelineCancelled("Cancelled by user")
+
+    def wait(self, timeout: float) -> bool:
+        return self._event.wait(timeout)
+
+    def add_callback(self, cb) -> bool:
+        """취소 시 호출할 콜백 등록. 이미 취소된 경우 False."""
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self._callbacks.append(cb)
+            return True
+
+    def remove_callback(self, cb):
+        with self._lock:
+            if cb in self._callbacks:
+                self._callbacks.remove(cb)
+
+    def _record(self, response):
+        usage = usage_of(response)
+        with self._lock:
+            self.usage["requests"] += 1
+            for k, v in usage.items():
+                self.usage[k] += v
+
+
+def usage_of(response) -> dict:
+    """응답의 토큰 사용량 dict (input/output/reasoning/cached — 없는 항목은 0)"""
+    usage = getattr(response, "usage", None)
+    result = {"input_tokens": 0, "output_tokens": 0, "reasoning_tokens": 0, "cached_tokens": 0}
+    if usage is None:
+        return result
+    result["input_tokens"] = getattr(usage, "prompt_tokens", 0) or 0
+    result["output_tokens"] = getattr(usage, "completion_tokens", 0) or 0
+    details = getattr(usage, "completion_tokens_details", None)
+    if details:
+        result["reasoning_tokens"] = getattr(details, "reasoning_tokens", 0) or 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    if details:
+        result["cached_tokens"] = getattr(details, "cached_tokens", 0) or 0
+    return result
+
+
+# ── 전용 이벤트 루프 (취소 가능한 async 요청용) ─────────────────────
+# litellm async 클라이언트는 루프에 묶여 캐시되므로 프로세스당 루프 1개를 유지.
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="llm-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def completion(cancel_token: Optional[CancellationToken] = None, **kwargs):
+    """
+    litellm.completion 대체. 스케줄러 작업 안에서는 LLM 슬롯(우선순위 + 세션 공정 분배)을
+    확보한 뒤 호출. cancel_token이 있으면 전용 루프에서 acompletion을 실행하고,
+    취소 시 진행 중인 요청을 중단한 뒤 PipelineCancelled를 발생시킴.
+    """
+    with job_scheduler.llm_slot(cancel_token):
+        return _completion(cancel_token, **kwargs)
+
+
+def _completion(cancel_token: Optional[CancellationToken], **kwargs):
+    if cancel_token is None:
+        return litellm.completion(**kwargs)
+
+    cancel_token.raise_if_cancelled()
+    future = asyncio.run_coroutine_threadsafe(litellm.acompletion(**kwargs), _get_loop())
+    abort = future.cancel
+    if not cancel_token.add_callback(abort):
+        future.cancel()
+    try:
+        response = future.result()
+    except FutureCancelledError:
+        with cancel_token._lock:
+            cancel_token.usage["aborted_requests"] += 1
+        raise PipelineCancelled("Cancelled by user") from None
+    finally:
+        cancel_token.remove_callback(abort)
+    cancel_token._record(response)
+    return response
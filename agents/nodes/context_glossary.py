@@ -11,7 +11,7 @@ def context_glossary_node(state: LocalizationState) -> dict:
     """
     target_languages = state.get("target_languages", [])
     tone_and_manner = state.get("tone_and_manner", "")
-    logs = list(state.get("logs", []))
+    logs = []
 
     logs.append(f"[Node 2] 컨텍스트 셋업 — 타겟 언어: {target_languages}")
     logs.append(f"[Node 2] 게임 시놉시스 로드 완료")
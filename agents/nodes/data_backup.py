@@ -1,23 +1,20 @@
 """Node 1: 데이터 로드 & 백업 (LLM 미사용 유틸리티)"""
 
 from agents.state import LocalizationState
+from utils.row_table import get_row_table
 
 
 def data_backup_node(state: LocalizationState) -> dict:
     """
     시트 데이터 로드 + 백업 생성.
-    실제 시트 로드/백업은 app.py에서 사전 수행되어 state에 주입됨.
-    이 노드는 state의 데이터를 확인하고 로그를 남김.
+    실제 시트 로드/백업은 app.py에서 사전 수행되어 RowTable로 등록됨 (state에는 id만).
+    이 노드는 등록된 데이터를 확인하고 로그를 남김 (데이터 채널은 재기록하지 않음).
     """
-    original_data = state.get("original_data", [])
-    backup_data = state.get("backup_data", [])
-    logs = list(state.get("logs", []))
+    table = get_row_table(state.get("row_table_id", ""))
 
-    logs.append(f"[Node 1] 데이터 로드 완료: {len(original_data)}행")
-    logs.append(f"[Node 1] 백업 생성 완료: {len(backup_data)}행")
+    logs = [
+        f"[Node 1] 데이터 로드 완료: {len(table)}행",
+        f"[Node 1] 백업 스냅샷 확인: {len(table.columns)}개 컬럼 (불변 RowTable)",
+    ]
 
-    return {
-        "original_data": original_data,
-        "backup_data": backup_data,
-        "logs": logs,
-    }
+    return {"logs": logs}
@@ -1,8 +1,9 @@
 """Node 4: 검수 (LLM + Regex) — 태그 검증, Glossary 후처리, AI 품질 검증 (청크 배치)"""
 
 import json
-import litellm
 from langchain_core.runnables import RunnableConfig
+from agents import llm
+from agents.chunk_journal import ChunkJournal
 from backend.config import get_xai_api_key
 from agents.state import LocalizationState
 from agents.prompts import build_reviewer_prompt
@@ -14,6 +15,7 @@ from config.constants import (
     SUPPORTED_LANGUAGES,
 )
 from utils.drip_feed import drip_feed_emit
+from utils.row_table import get_row_table, with_row_context
 from config.glossary import format_glossary_text
 from utils.validation import (
     apply_glossary_postprocess,
@@ -23,15 +25,17 @@ from utils.validation import (
 
 
 
-def _build_review_prompt_batch(items_for_review: list[dict]) -> str:
-    """여러 번역 항목을 하나의 프롬프트로 결합"""
+def _build_review_prompt_batch(items_for_review: list[dict], table) -> str:
+    """여러 번역 항목을 하나의 프롬프트로 결합 (원문/기존 번역은 RowTable에서 조회)"""
     parts = []
     for item in items_for_review:
+        ri = item.get("row_index")
+        lang_col = SUPPORTED_LANGUAGES.get(item["lang"], "")
         part = (
             f"Key: {item['key']}\n"
-            f"Korean (원문): {item['source_ko']}\n"
+            f"Korean (원문): {table.value(ri, REQUIRED_COLUMNS['korean'])}\n"
             f"Translation ({item['lang']}): {item['translated']}\n"
-            f"기존 번역: {item['old_translation']}"
+            f"기존 번역: {table.value(ri, lang_col)}"
         )
         parts.append(part)
     return "\n\n---\n\n".join(parts)
@@ -50,16 +54,23 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
     """
     # 청크별 이벤트 emitter (없으면 무시)
     emitter = config.get("configurable", {}).get("event_emitter") if config else None
-
-    original_data = state.get("original_data", [])
-    translation_results = list(state.get("translation_results", []))
-
-    # 이전 라운드의 통과 결과를 보존 (재시도 시 누적)
-    prev_review_results = list(state.get("review_results", []))
-
-    failed_rows = list(state.get("failed_rows", []))
-    retry_count = dict(state.get("retry_count", {}))
-    logs = list(state.get("logs", []))
+    # 취소 토큰 (없으면 취소 불가 — Streamlit 등)
+    cancel_token = config.get("configurable", {}).get("cancel_token") if config else None
+    # 완료 청크 저널 (크래시 후 같은 체크포인트에서 재개 시 완료분 재사용)
+    journal = ChunkJournal(config)
+
+    table = get_row_table(state.get("row_table_id", ""))
+    translation_results = state.get("translation_results", [])
+
+    # 이전 라운드까지의 누적 결과 (읽기 전용 — reducer가 새 결과를 append)
+    prev_review_count = len(state.get("review_results", []))
+    prev_failed_count = len(state.get("failed_rows", []))
+    retry_count = state.get("retry_count", {})
+
+    # 이번 라운드에서 새로 생긴 항목만 반환
+    failed_rows = []
+    retry_updates = {}
+    logs = []
     total_input_tokens = state.get("total_input_tokens", 0)
     total_output_tokens = state.get("total_output_tokens", 0)
     total_reasoning_tokens = state.get("total_reasoning_tokens", 0)
@@ -68,11 +79,10 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
     game_synopsis = state.get("game_synopsis", "")
     tone_and_manner = state.get("tone_and_manner", "")
 
-    # 원본 데이터 맵 구축
-    original_map = {}
-    for row in original_data:
-        key = row.get(REQUIRED_COLUMNS["key"], "")
-        original_map[key] = row
+    # Key → row_index (row_index 없는 결과용 fallback, 마지막 행 우선 — 기존 동작 유지)
+    key_to_ri = {
+        key: ri for ri, key in table.iter_rows(REQUIRED_COLUMNS["key"])
+    }
 
     api_key = get_xai_api_key()
 
@@ -98,8 +108,8 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
         if not translated:
             continue
 
-        original_row = original_map.get(key, {})
-        source_ko = original_row.get(REQUIRED_COLUMNS["korean"], "")
+        source_ri = row_index if row_index in table else key_to_ri.get(key)
+        source_ko = table.value(source_ri, REQUIRED_COLUMNS["korean"])
 
         # Glossary 후처리
         translated = apply_glossary_postprocess(translated, lang)
@@ -112,15 +122,10 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
             current = retry_count.get(count_key, 0)
 
             if current < MAX_RETRY_COUNT:
-                retry_count[count_key] = current + 1
-                shared_comments = original_row.get(
-                    REQUIRED_COLUMNS["shared_comments"], ""
-                )
+                retry_updates[count_key] = current + 1
                 needs_retry_items.append({
                     "key": key,
                     "lang": lang,
-                    "source_ko": source_ko,
-                    "shared_comments": shared_comments,
                     "translated": translated,
                     "feedback": tag_result["errors"],
                     "row_index": row_index,
@@ -154,17 +159,13 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
                 f"{'; '.join(glossary_result['violations'])}"
             )
 
-        lang_col = SUPPORTED_LANGUAGES.get(lang, "")
-        old_translation = original_row.get(lang_col, "")
-
+        # 원문/기존 번역은 복사하지 않음 — row_index로 RowTable 참조
         validated_items.append({
             "key": key,
             "lang": lang,
             "translated": translated,
-            "source_ko": source_ko,
-            "old_translation": old_translation,
             "warnings": warnings,
-            "row_index": row_index,
+            "row_index": source_ri,
         })
 
     logs.append(
@@ -178,22 +179,22 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
         lang_groups.setdefault(item["lang"], []).append(item)
 
     # 전체 진행률 기준 (초기 신호 + 청크별 emit 모두 동일 total 사용)
-    progress_total = len(prev_review_results) + len(validated_items) + len(needs_retry_items)
+    progress_total = prev_review_count + len(validated_items) + len(needs_retry_items)
     if progress_total == 0:
-        progress_total = max(len(prev_review_results) + len(failed_rows), 1)
+        progress_total = max(prev_review_count + prev_failed_count + len(failed_rows), 1)
 
     # 초기 진행률 신호 — LLM 호출 전 즉시 발행하여 프론트엔드 agentPhase 전환
     if emitter:
         emitter("review_chunk", {
             "chunk_results": [],
             "progress": {
-                "done": len(prev_review_results),
+                "done": prev_review_count,
                 "total": progress_total,
             },
         })
 
     new_review_results = []
-    cumulative_done = len(prev_review_results)
+    cumulative_done = prev_review_count
 
     for lang, items in lang_groups.items():
         glossary_text = format_glossary_text(lang)
@@ -201,11 +202,14 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
         total_chunks = (len(items) + CHUNK_SIZE - 1) // CHUNK_SIZE
 
         for chunk_idx in range(total_chunks):
+            # 청크 사이 취소 확인
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
             start = chunk_idx * CHUNK_SIZE
             end = min(start + CHUNK_SIZE, len(items))
             chunk = items[start:end]
 
-            user_prompt = _build_review_prompt_batch(chunk)
+            user_prompt = _build_review_prompt_batch(chunk, table)
             user_prompt += (
                 "\n\n위 번역들을 각각 검수하고, "
                 "기존 번역 대비 변경 사유를 포함하여 JSON 배열로 출력하세요."
@@ -219,7 +223,8 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
             # LLM 호출
             chunk_ai_map: dict[str, dict] = {}
             try:
-                response = litellm.completion(
+                content, usage = journal.completion(
+                    cancel_token,
                     model=LLM_MODEL,
                     api_key=api_key,
                     messages=[
@@ -229,25 +234,24 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
                     timeout=120,
                 )
 
-                total_input_tokens += getattr(response.usage, "prompt_tokens", 0)
-                total_output_tokens += getattr(
-                    response.usage, "completion_tokens", 0
-                )
-                if hasattr(response.usage, "completion_tokens_details") and response.usage.completion_tokens_details:
-                    total_reasoning_tokens += getattr(response.usage.completion_tokens_details, "reasoning_tokens", 0) or 0
-                if hasattr(response.usage, "prompt_tokens_details") and response.usage.prompt_tokens_details:
-                    total_cached_tokens += getattr(response.usage.prompt_tokens_details, "cached_tokens", 0) or 0
+                total_input_tokens += usage["input_tokens"]
+                total_output_tokens += usage["output_tokens"]
+                total_reasoning_tokens += usage["reasoning_tokens"]
+                total_cached_tokens += usage["cached_tokens"]
 
-                content = response.choices[0].message.content.strip()
+                content = content.strip()
                 if content.startswith("```"):
                     content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
 
                 review_items = json.loads(content)
+                journal.commit()
                 if isinstance(review_items, list):
                     for ri in review_items:
                         ri_key = ri.get("key", "")
                         chunk_ai_map[ri_key] = ri
 
+            except llm.PipelineCancelled:
+                raise
             except Exception as e:
                 logs.append(
                     f"[Node 4] AI 검수 오류 (청크 {chunk_idx + 1}): {e}"
@@ -278,47 +282,47 @@ def reviewer_node(state: LocalizationState, config: RunnableConfig) -> dict:
                     "key": key,
                     "lang": lang,
                     "translated": item["translated"],
-                    "old_translation": item["old_translation"],
-                    "original_ko": item["source_ko"],
                     "reason": reason,
                     "row_index": item.get("row_index"),
                 })
 
             new_review_results.extend(chunk_results)
 
-            # 청크별 drip-feed emit
+            # 청크별 drip-feed emit (표시용 원문/기존 번역은 emit 시점에만 보강)
             if emitter and chunk_results:
                 drip_feed_emit(
                     emitter,
                     "review_chunk",
-                    chunk_results,
+                    with_row_context(chunk_results, table),
                     progress_base=cumulative_done,
                     total=progress_total,
                 )
                 cumulative_done += len(chunk_results)
 
-    all_review_results = prev_review_results + new_review_results
+    total_review_count = prev_review_count + len(new_review_results)
 
     # validated_items가 비어있을 때도 progress 이벤트 보장 (엣지 케이스)
     if emitter and not new_review_results:
         emitter("review_chunk", {
             "chunk_results": [],
             "progress": {
-                "done": len(all_review_results),
+                "done": total_review_count,
                 "total": progress_total,
             },
         })
 
+    if journal.replayed:
+        logs.append(f"[Node 4] 저널에서 완료 청크 {journal.replayed}개 복원 (LLM 재호출 생략)")
     logs.append(
-        f"[Node 4] 검수 완료: 누적 통과 {len(all_review_results)}건, "
-        f"실패 {len(failed_rows)}건, 재시도 대기 {len(needs_retry_items)}건"
+        f"[Node 4] 검수 완료: 누적 통과 {total_review_count}건, "
+        f"실패 {prev_failed_count + len(failed_rows)}건, 재시도 대기 {len(needs_retry_items)}건"
     )
 
     return {
-        "review_results": all_review_results,
+        "review_results": new_review_results,
         "failed_rows": failed_rows,
         "_needs_retry": needs_retry_items,
-        "retry_count": retry_count,
+        "retry_count": retry_updates,
         "total_input_tokens": total_input_tokens,
         "total_output_tokens": total_output_tokens,
         "total_reasoning_tokens": total_reasoning_tokens,
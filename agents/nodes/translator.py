@@ -1,8 +1,9 @@
 """Node 3: 번역 (LLM) — 청크 단위 번역, Shared Comments 컨텍스트 주입"""
 
 import json
-import litellm
 from langchain_core.runnables import RunnableConfig
+from agents import llm
+from agents.chunk_journal import ChunkJournal
 from backend.config import get_xai_api_key
 from agents.state import LocalizationState
 from agents.prompts import build_translator_prompt
@@ -14,17 +15,14 @@ from config.constants import (
     SUPPORTED_LANGUAGES,
 )
 from utils.drip_feed import drip_feed_emit
+from utils.row_table import RowTable, get_row_table
 from config.glossary import format_glossary_text
 
 
-def _build_translation_prompt(rows: list[dict], lang: str) -> str:
-    """번역 대상 행들을 프롬프트 메시지로 변환"""
+def _build_translation_prompt(rows: list[tuple], lang: str) -> str:
+    """번역 대상 행들을 프롬프트 메시지로 변환 — rows: (row_index, key, korean, shared_comments)"""
     items = []
-    for row in rows:
-        key = row.get(REQUIRED_COLUMNS["key"], "")
-        ko_text = row.get(REQUIRED_COLUMNS["korean"], "")
-        shared_comments = row.get(REQUIRED_COLUMNS["shared_comments"], "")
-
+    for _, key, ko_text, shared_comments in rows:
         item = f"Key: {key}\nKorean: {ko_text}"
         if shared_comments:
             item += f"\nShared Comments (참고): {shared_comments}"
@@ -33,13 +31,16 @@ def _build_translation_prompt(rows: list[dict], lang: str) -> str:
     return "\n\n---\n\n".join(items)
 
 
-def _build_retry_prompt(items: list[dict], lang: str) -> str:
-    """재번역 프롬프트 — 이전 번역 실패 피드백 포함"""
+def _build_retry_prompt(items: list[dict], table: RowTable) -> str:
+    """재번역 프롬프트 — 이전 번역 실패 피드백 포함 (원문/코멘트는 RowTable에서 조회)"""
     parts = []
     for item in items:
-        part = f"Key: {item['key']}\nKorean: {item['source_ko']}"
-        if item.get("shared_comments"):
-            part += f"\nShared Comments (참고): {item['shared_comments']}"
+        ri = item.get("row_index")
+        source_ko = table.value(ri, REQUIRED_COLUMNS["korean"])
+        shared_comments = table.value(ri, REQUIRED_COLUMNS["shared_comments"])
+        part = f"Key: {item['key']}\nKorean: {source_ko}"
+        if shared_comments:
+            part += f"\nShared Comments (참고): {shared_comments}"
         part += f"\n이전 번역 (오류 있음): {item['translated']}"
         part += f"\n오류: {'; '.join(item['feedback'])}"
         part += (
@@ -51,10 +52,101 @@ def _build_retry_prompt(items: list[dict], lang: str) -> str:
     return "\n\n---\n\n".join(parts)
 
 
-def _translate_retry(state: LocalizationState, needs_retry: list[dict]) -> dict:
+def _collect_target_rows(
+    table: RowTable,
+    lang_col: str,
+    mode: str,
+    ko_revised_by_ri: dict,
+    ko_revised_by_key: dict,
+) -> list[tuple]:
+    """모드에 따른 대상 행 필터링 (교정문 오버레이 적용) — [(row_index, key, korean, shared_comments)]"""
+    target_rows = []
+    for ri, key, ko_text, shared_comments, existing in table.iter_rows(
+        REQUIRED_COLUMNS["key"],
+        REQUIRED_COLUMNS["korean"],
+        REQUIRED_COLUMNS["shared_comments"],
+        lang_col,
+    ):
+        if ri in ko_revised_by_ri:
+            ko_text = ko_revised_by_ri[ri]
+        elif key in ko_revised_by_key:
+            ko_text = ko_revised_by_key[key]
+
+        if not ko_text:
+            continue
+
+        if mode == "B":
+            if existing and existing.strip():
+                continue
+
+        target_rows.append((ri, key, ko_text, shared_comments))
+    return target_rows
+
+
+def _translate_chunk(
+    chunk: list[tuple],
+    lang: str,
+    system_prompt: str,
+    api_key: str,
+    cancel_token,
+    journal: ChunkJournal,
+) -> tuple[list[dict], dict]:
+    """청크 1개 번역 — 반환: (결과 [{key, lang, translated, row_index}], 토큰 사용량)"""
+    content, usage = journal.completion(
+        cancel_token,
+        model=LLM_MODEL,
+        api_key=api_key,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": _build_translation_prompt(chunk, lang)},
+        ],
+        timeout=120,
+    )
+
+    content = content.strip()
+    # JSON 파싱 — 코드블록 제거
+    if content.startswith("```"):
+        content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+
+    translated_items = json.loads(content)
+    journal.commit()
+
+    # 청크 소스 행의 key→row_index 매핑 (순서 기반, 중복 Key 대응)
+    chunk_key_to_ri: dict[str, list[int]] = {}
+    for src_ri, sk, _, _ in chunk:
+        chunk_key_to_ri.setdefault(sk, []).append(src_ri)
+    chunk_key_counter: dict[str, int] = {}
+
+    results = []
+    for item in translated_items:
+        translated_text = item.get("translated", "")
+        # Fix: LLM이 JSON에서 \n을 실제 개행으로 출력하는 문제 보정
+        translated_text = translated_text.replace('\n', '\\n')
+        translated_text = translated_text.replace('\t', '\\t')
+        ikey = item["key"]
+        cidx = chunk_key_counter.get(ikey, 0)
+        chunk_key_counter[ikey] = cidx + 1
+        ri_list = chunk_key_to_ri.get(ikey, [])
+        ri = ri_list[cidx] if cidx < len(ri_list) else None
+        results.append({
+            "key": ikey,
+            "lang": lang,
+            "translated": translated_text,
+            "row_index": ri,
+        })
+    return results, usage
+
+
+def _translate_retry(
+    state: LocalizationState,
+    needs_retry: list[dict],
+    cancel_token=None,
+    journal: ChunkJournal = None,
+) -> dict:
     """재시도 모드: 실패한 항목만 재번역"""
-    retry_count = dict(state.get("retry_count", {}))
-    logs = list(state.get("logs", []))
+    journal = journal or ChunkJournal(None)
+    table = get_row_table(state.get("row_table_id", ""))
+    logs = []
     total_input_tokens = state.get("total_input_tokens", 0)
     total_output_tokens = state.get("total_output_tokens", 0)
     total_reasoning_tokens = state.get("total_reasoning_tokens", 0)
@@ -82,18 +174,22 @@ def _translate_retry(state: LocalizationState, needs_retry: list[dict]) -> dict:
         )
 
         for chunk_idx in range(total_chunks):
+            # 청크 사이 취소 확인
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
             start = chunk_idx * CHUNK_SIZE
             end = min(start + CHUNK_SIZE, len(items))
             chunk = items[start:end]
 
-            user_prompt = _build_retry_prompt(chunk, lang)
+            user_prompt = _build_retry_prompt(chunk, table)
             logs.append(
                 f"[Node 3] {lang.upper()} 재번역 청크 "
                 f"{chunk_idx + 1}/{total_chunks} ({len(chunk)}건) 처리 중..."
             )
 
             try:
-                response = litellm.completion(
+                content, usage = journal.completion(
+                    cancel_token,
                     model=LLM_MODEL,
                     api_key=api_key,
                     messages=[
@@ -103,22 +199,17 @@ def _translate_retry(state: LocalizationState, needs_retry: list[dict]) -> dict:
                     timeout=120,
                 )
 
-                total_input_tokens += getattr(
-                    response.usage, "prompt_tokens", 0
-                )
-                total_output_tokens += getattr(
-                    response.usage, "completion_tokens", 0
-                )
-                if hasattr(response.usage, "completion_tokens_details") and response.usage.completion_tokens_details:
-                    total_reasoning_tokens += getattr(response.usage.completion_tokens_details, "reasoning_tokens", 0) or 0
-                if hasattr(response.usage, "prompt_tokens_details") and response.usage.prompt_tokens_details:
-                    total_cached_tokens += getattr(response.usage.prompt_tokens_details, "cached_tokens", 0) or 0
+                total_input_tokens += usage["input_tokens"]
+                total_output_tokens += usage["output_tokens"]
+                total_reasoning_tokens += usage["reasoning_tokens"]
+                total_cached_tokens += usage["cached_tokens"]
 
-                content = response.choices[0].message.content.strip()
+                content = content.strip()
                 if content.startswith("```"):
                     content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
 
                 translated_items = json.loads(content)
+                journal.commit()
 
                 # 재시도 청크의 key→row_index 매핑
                 retry_key_to_ri: dict[str, list] = {}
@@ -142,6 +233,8 @@ def _translate_retry(state: LocalizationState, needs_retry: list[dict]) -> dict:
                         "row_index": ri,
                     })
 
+            except llm.PipelineCancelled:
+                raise
             except Exception as e:
                 logs.append(
                     f"[Node 3] 재번역 오류 (청크 {chunk_idx + 1}): {e}"
@@ -155,6 +248,9 @@ def _translate_retry(state: LocalizationState, needs_retry: list[dict]) -> dict:
                         "row_index": item.get("row_index"),
                     })
 
+    if journal.replayed:
+        logs.append(f"[Node 3] 저널에서 완료 청크 {journal.replayed}개 복원 (LLM 재호출 생략)")
+
     return {
         "translation_results": all_results,
         "_needs_retry": [],
@@ -162,35 +258,131 @@ def _translate_retry(state: LocalizationState, needs_retry: list[dict]) -> dict:
         "total_output_tokens": total_output_tokens,
         "total_reasoning_tokens": total_reasoning_tokens,
         "total_cached_tokens": total_cached_tokens,
-        "retry_count": retry_count,
         "logs": logs,
     }
 
 
+# ── 사전 번역 (HITL 1 대기 중, opt-in) ─────────────────────────────
+
+# 체크포인터 chunks 테이블의 사전 번역 기록 키 접두사 — spec:{lang}:{첫 row_index}
+SPECULATIVE_PREFIX = "spec:"
+
+
+def load_speculative_translations(store, thread_id: str) -> tuple[dict, dict]:
+    """
+    사전 번역 기록 로드.
+    반환: ({(lang, row_index): (번역 당시 원문, 번역문)}, 사전 번역에 쓴 토큰 사용량 합계)
+    """
+    translations: dict = {}
+    usage_total = {"input_tokens": 0, "output_tokens": 0, "reasoning_tokens": 0, "cached_tokens": 0}
+    for chunk_key, content, usage in store.list_chunks(thread_id, SPECULATIVE_PREFIX):
+        lang = chunk_key[len(SPECULATIVE_PREFIX):].split(":", 1)[0]
+        for row in json.loads(content):
+            translations[(lang, row["row_index"])] = (row["ko"], row["translated"])
+        for k in usage_total:
+            usage_total[k] += usage.get(k, 0)
+    return translations, usage_total
+
+
+def speculative_translate(state: LocalizationState, config: RunnableConfig) -> dict:
+    """
+    KR 검수 승인 대기 중 사전 번역.
+
+    검수에서 바뀌지 않은 행(has_issue=False)은 승인/거부와 무관하게 같은 원문이 번역되므로
+    사람이 검수하는 동안 미리 번역해 청크별로 체크포인터(chunks 테이블)에 기록한다.
+    승인 후 translator_node가 원문이 같은 행은 그대로 재사용하고 나머지만 번역한다.
+    이미 기록된 행은 건너뛰므로 중단 후 다시 호출하면 남은 행만 번역.
+    반환: {"rows": 새로 번역한 행 수, "chunks": LLM 호출 수}
+    """
+    configurable = config["configurable"]
+    store = configurable["chunk_journal"]
+    thread_id = configurable["thread_id"]
+    cancel_token = configurable.get("cancel_token")
+
+    table = get_row_table(state.get("row_table_id", ""))
+    mode = state.get("mode", "A")
+    custom_prompt = state.get("custom_prompt", "")
+    game_synopsis = state.get("game_synopsis", "")
+    tone_and_manner = state.get("tone_and_manner", "")
+    unchanged = {
+        r["row_index"] for r in state.get("ko_review_results", [])
+        if not r.get("has_issue") and r.get("row_index") is not None
+    }
+    done, _ = load_speculative_translations(store, thread_id)
+    # 사전 번역은 LLM 호출만 수행 (저널 비활성 — 기록은 행 단위로 직접)
+    no_journal = ChunkJournal(None)
+    api_key = get_xai_api_key()
+    stats = {"rows": 0, "chunks": 0}
+
+    for lang in state.get("target_languages", []):
+        lang_col = SUPPORTED_LANGUAGES.get(lang, "")
+        if not lang_col:
+            continue
+        rows = [
+            row for row in _collect_target_rows(table, lang_col, mode, {}, {})
+            if row[0] in unchanged and (lang, row[0]) not in done
+        ]
+        glossary_text = format_glossary_text(lang)
+        system_prompt = build_translator_prompt(lang, glossary_text, synopsis=game_synopsis, tone=tone_and_manner, custom_prompt=custom_prompt)
+
+        for start in range(0, len(rows), CHUNK_SIZE):
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            chunk = rows[start:start + CHUNK_SIZE]
+            try:
+                results, usage = _translate_chunk(
+                    chunk, lang, system_prompt, api_key, cancel_token, no_journal
+                )
+            except llm.PipelineCancelled:
+                raise
+            except Exception:
+                # 실패한 청크는 승인 후 translator_node가 정상 경로로 번역
+                continue
+            ko_by_ri = {ri: ko_text for ri, _, ko_text, _ in chunk}
+            payload = [
+                {"row_index": r["row_index"], "ko": ko_by_ri[r["row_index"]], "translated": r["translated"]}
+                for r in results if r["row_index"] in ko_by_ri
+            ]
+            store.put_chunk(
+                thread_id,
+                f"{SPECULATIVE_PREFIX}{lang}:{chunk[0][0]}",
+                json.dumps(payload, ensure_ascii=False),
+                usage,
+            )
+            stats["rows"] += len(payload)
+            stats["chunks"] += 1
+
+    return stats
+
+
 def translator_node(state: LocalizationState, config: RunnableConfig) -> dict:
     """
     청크 단위 번역 수행.
     _needs_retry가 있으면 해당 항목만 재번역 (retry 모드).
-    없으면 정상 번역:
+    없으면 정상 번역 (HITL 1 대기 중 사전 번역된 행은 재사용):
       모드 A: 전체 행 번역
       모드 B: 타겟 언어 빈칸인 행만 번역
+      모드 C: 증분 — /start에서 지문이 바뀐 행만 선별되므로 전체 번역
     """
     # 청크별 이벤트 emitter (없으면 무시)
     emitter = config.get("configurable", {}).get("event_emitter") if config else None
+    # 취소 토큰 (없으면 취소 불가 — Streamlit 등)
+    cancel_token = config.get("configurable", {}).get("cancel_token") if config else None
+    # 완료 청크 저널 (크래시 후 같은 체크포인트에서 재개 시 완료분 재사용)
+    journal = ChunkJournal(config)
 
     # 재시도 모드 확인
     needs_retry = state.get("_needs_retry", [])
     if needs_retry:
-        return _translate_retry(state, needs_retry)
+        return _translate_retry(state, needs_retry, cancel_token, journal)
 
     # ── 정상 번역 모드 ──
-    original_data = state.get("original_data", [])
+    table = get_row_table(state.get("row_table_id", ""))
     mode = state.get("mode", "A")
     target_languages = state.get("target_languages", [])
     ko_approval_result = state.get("ko_approval_result", "approved")
     ko_review_results = state.get("ko_review_results", [])
-    retry_count = dict(state.get("retry_count", {}))
-    logs = list(state.get("logs", []))
+    logs = []
     total_input_tokens = state.get("total_input_tokens", 0)
     total_output_tokens = state.get("total_output_tokens", 0)
     total_reasoning_tokens = state.get("total_reasoning_tokens", 0)
@@ -199,120 +391,97 @@ def translator_node(state: LocalizationState, config: RunnableConfig) -> dict:
     game_synopsis = state.get("game_synopsis", "")
     tone_and_manner = state.get("tone_and_manner", "")
 
-    # 한국어 검수 승인 시, 수정된 텍스트 적용
-    working_data = []
-    ko_revised_map = {}
+    # 한국어 검수 승인 시, 수정된 텍스트 적용 — 행 복사 대신 교정문 오버레이
+    ko_revised_by_ri = {}
+    ko_revised_by_key = {}
     if ko_approval_result == "approved" and ko_review_results:
         for r in ko_review_results:
-            ko_revised_map[r["key"]] = r["revised"]
-
-    for row in original_data:
-        row_copy = dict(row)
-        key = row_copy.get(REQUIRED_COLUMNS["key"], "")
-        if key in ko_revised_map:
-            row_copy[REQUIRED_COLUMNS["korean"]] = ko_revised_map[key]
-        working_data.append(row_copy)
+            if r.get("row_index") is not None:
+                ko_revised_by_ri[r["row_index"]] = r["revised"]
+            else:
+                ko_revised_by_key[r["key"]] = r["revised"]
 
     # 번역 결과 저장
     all_results = []
 
     api_key = get_xai_api_key()
 
+    # HITL 1 대기 중 사전 번역 결과 — 사용량은 재사용 여부와 무관하게 이미 발생했으므로 합산
+    speculative: dict = {}
+    if journal.enabled:
+        store = config["configurable"]["chunk_journal"]
+        speculative, spec_usage = load_speculative_translations(
+            store, config["configurable"]["thread_id"]
+        )
+        total_input_tokens += spec_usage["input_tokens"]
+        total_output_tokens += spec_usage["output_tokens"]
+        total_reasoning_tokens += spec_usage["reasoning_tokens"]
+        total_cached_tokens += spec_usage["cached_tokens"]
+
     for lang in target_languages:
         lang_col = SUPPORTED_LANGUAGES.get(lang, "")
         if not lang_col:
             logs.append(f"[Node 3] 지원하지 않는 언어: {lang}")
             continue
 
-        # 모드에 따른 대상 행 필터링
-        target_rows = []
-        for row in working_data:
-            key = row.get(REQUIRED_COLUMNS["key"], "")
-            ko_text = row.get(REQUIRED_COLUMNS["korean"], "")
-
-            if not ko_text:
-                continue
-
-            if mode == "B":
-                existing = row.get(lang_col, "")
-                if existing and existing.strip():
-                    continue
-
-            target_rows.append(row)
+        # 모드에 따른 대상 행 필터링 — (row_index, key, korean, shared_comments)
+        target_rows = _collect_target_rows(
+            table, lang_col, mode, ko_revised_by_ri, ko_revised_by_key
+        )
+        progress_total = len(target_rows) * len(target_languages)
 
         logs.append(f"[Node 3] {lang.upper()} 번역 대상: {len(target_rows)}행")
 
+        # HITL 1 대기 중 사전 번역된 행 재사용 — 원문이 같을 때만 (수정된 행은 새로 번역)
+        if speculative:
+            reused, remaining = [], []
+            for row in target_rows:
+                hit = speculative.get((lang, row[0]))
+                if hit is not None and hit[0] == row[2]:
+                    reused.append({
+                        "key": row[1], "lang": lang, "translated": hit[1], "row_index": row[0],
+                    })
+                else:
+                    remaining.append(row)
+            if reused:
+                logs.append(f"[Node 3] {lang.upper()} 사전 번역 재사용: {len(reused)}행")
+                all_results.extend(reused)
+                if emitter:
+                    emitter("translation_chunk", {
+                        "chunk_results": reused,
+                        "progress": {"done": len(all_results), "total": progress_total},
+                        "lang": lang,
+                    })
+            target_rows = remaining
+
         # 청크 단위 처리
         glossary_text = format_glossary_text(lang)
         system_prompt = build_translator_prompt(lang, glossary_text, synopsis=game_synopsis, tone=tone_and_manner, custom_prompt=custom_prompt)
         total_chunks = (len(target_rows) + CHUNK_SIZE - 1) // CHUNK_SIZE
 
         for chunk_idx in range(total_chunks):
+            # 청크 사이 취소 확인
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
             start = chunk_idx * CHUNK_SIZE
             end = min(start + CHUNK_SIZE, len(target_rows))
             chunk = target_rows[start:end]
 
-            user_prompt = _build_translation_prompt(chunk, lang)
             logs.append(
                 f"[Node 3] {lang.upper()} 청크 {chunk_idx + 1}/{total_chunks} "
                 f"({len(chunk)}행) 번역 중..."
             )
 
             try:
-                response = litellm.completion(
-                    model=LLM_MODEL,
-                    api_key=api_key,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    timeout=120,
-                )
-
-                total_input_tokens += getattr(
-                    response.usage, "prompt_tokens", 0
+                chunk_results, usage = _translate_chunk(
+                    chunk, lang, system_prompt, api_key, cancel_token, journal
                 )
-                total_output_tokens += getattr(
-                    response.usage, "completion_tokens", 0
-                )
-                if hasattr(response.usage, "completion_tokens_details") and response.usage.completion_tokens_details:
-                    total_reasoning_tokens += getattr(response.usage.completion_tokens_details, "reasoning_tokens", 0) or 0
-                if hasattr(response.usage, "prompt_tokens_details") and response.usage.prompt_tokens_details:
-                    total_cached_tokens += getattr(response.usage.prompt_tokens_details, "cached_tokens", 0) or 0
-
-                content = response.choices[0].message.content.strip()
-                # JSON 파싱 — 코드블록 제거
-                if content.startswith("```"):
-                    content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
 
-                translated_items = json.loads(content)
-
-                # 청크 소스 행의 key→row_index 매핑 (순서 기반, 중복 Key 대응)
-                chunk_key_to_ri: dict[str, list[int]] = {}
-                for src_row in chunk:
-                    sk = src_row.get(REQUIRED_COLUMNS["key"], "")
-                    chunk_key_to_ri.setdefault(sk, []).append(src_row.get("_row_index"))
-                chunk_key_counter: dict[str, int] = {}
-
-                chunk_results = []
-                for item in translated_items:
-                    translated_text = item.get("translated", "")
-                    # Fix: LLM이 JSON에서 \n을 실제 개행으로 출력하는 문제 보정
-                    translated_text = translated_text.replace('\n', '\\n')
-                    translated_text = translated_text.replace('\t', '\\t')
-                    ikey = item["key"]
-                    cidx = chunk_key_counter.get(ikey, 0)
-                    chunk_key_counter[ikey] = cidx + 1
-                    ri_list = chunk_key_to_ri.get(ikey, [])
-                    ri = ri_list[cidx] if cidx < len(ri_list) else None
-                    result_item = {
-                        "key": ikey,
-                        "lang": lang,
-                        "translated": translated_text,
-                        "row_index": ri,
-                    }
-                    all_results.append(result_item)
-                    chunk_results.append(result_item)
+                total_input_tokens += usage["input_tokens"]
+                total_output_tokens += usage["output_tokens"]
+                total_reasoning_tokens += usage["reasoning_tokens"]
+                total_cached_tokens += usage["cached_tokens"]
+                all_results.extend(chunk_results)
 
                 # 청크별 부분 결과를 1행씩 drip-feed 전송
                 if emitter and chunk_results:
@@ -321,22 +490,26 @@ def translator_node(state: LocalizationState, config: RunnableConfig) -> dict:
                         "translation_chunk",
                         chunk_results,
                         progress_base=len(all_results) - len(chunk_results),
-                        total=len(target_rows) * len(target_languages),
+                        total=progress_total,
                         lang=lang,
                     )
 
+            except llm.PipelineCancelled:
+                raise
             except Exception as e:
                 logs.append(f"[Node 3] 번역 오류 (청크 {chunk_idx + 1}): {e}")
-                for row in chunk:
-                    key = row.get(REQUIRED_COLUMNS["key"], "")
+                for src_ri, key, _, _ in chunk:
                     all_results.append({
                         "key": key,
                         "lang": lang,
                         "translated": "",
                         "error": str(e),
-                        "row_index": row.get("_row_index"),
+                        "row_index": src_ri,
                     })
 
+    if journal.replayed:
+        logs.append(f"[Node 3] 저널에서 완료 청크 {journal.replayed}개 복원 (LLM 재호출 생략)")
+
     return {
         "translation_results": all_results,
         "current_chunk_index": total_chunks if target_languages else 0,
@@ -345,6 +518,5 @@ def translator_node(state: LocalizationState, config: RunnableConfig) -> dict:
         "total_output_tokens": total_output_tokens,
         "total_reasoning_tokens": total_reasoning_tokens,
         "total_cached_tokens": total_cached_tokens,
-        "retry_count": retry_count,
         "logs": logs,
     }
@@ -1,25 +1,34 @@
 """Node 5: 시트 업데이트 (유틸리티) — HITL 2 승인 후 Batch Update 실행"""
 
 from agents.state import LocalizationState
-from config.constants import REQUIRED_COLUMNS, SUPPORTED_LANGUAGES, Status, TOOL_STATUS_COLUMN
+from config.constants import (
+    REQUIRED_COLUMNS,
+    SUPPORTED_LANGUAGES,
+    Status,
+    TOOL_FINGERPRINT_COLUMN,
+    TOOL_STATUS_COLUMN,
+)
+from utils.fingerprint import row_fingerprint
+from utils.row_table import get_row_table
 
 
 def writer_node(state: LocalizationState) -> dict:
     """
     최종 승인된 번역 데이터를 시트에 일괄 업데이트할 업데이트 목록 생성.
-    실제 시트 쓰기는 app.py에서 batch_update_sheet()를 호출하여 수행.
+    실제 시트 쓰기는 승인 처리 쪽(backend routes._commit_final, app.py)에서 인터럽트 시점
+    state로 이 함수를 먼저 호출해 verify_updates_before_commit → commit_updates로 수행.
     """
     review_results = state.get("review_results", [])
     failed_rows = state.get("failed_rows", [])
-    original_data = state.get("original_data", [])
-    logs = list(state.get("logs", []))
+    table = get_row_table(state.get("row_table_id", ""))
+    logs = []
 
     # 원본 데이터의 Key → row_index 매핑 (fallback용)
+    # row_index는 RowTable에서 직접 조회 (범위 지정/증분 실행 시 비연속)
     key_to_index = {}
-    for idx, row in enumerate(original_data):
-        key = row.get(REQUIRED_COLUMNS["key"], "")
+    for ri, key in table.iter_rows(REQUIRED_COLUMNS["key"]):
         if key not in key_to_index:  # 첫 번째만 (중복 Key fallback)
-            key_to_index[key] = idx
+            key_to_index[key] = ri
 
     # 검수실패 row_index 집합 먼저 수집 (Tool_Status 충돌 방지)
     failed_indices = set()
@@ -51,7 +60,7 @@ def writer_node(state: LocalizationState) -> dict:
             continue
 
         # 원본 값과 비교 — 실제로 변경된 경우만 업데이트 & 컬러링
-        original_value = original_data[row_idx].get(lang_col, "") if row_idx < len(original_data) else ""
+        original_value = table.value(row_idx, lang_col)
         if translated != original_value:
             updates.append({
                 "row_index": row_idx,
@@ -70,6 +79,14 @@ def writer_node(state: LocalizationState) -> dict:
                 "value": Status.COMPLETED,
                 "change_type": "completed",
             })
+            # 증분 실행용 지문 기록 (서식 없음, "fp:" 접두사로 숫자 변환 방지)
+            if row_idx in table:
+                updates.append({
+                    "row_index": row_idx,
+                    "column_name": TOOL_FINGERPRINT_COLUMN,
+                    "value": row_fingerprint(table.row(row_idx)),
+                    "change_type": "fingerprint",
+                })
 
     # 검수실패 행 마킹
     for fail in failed_rows:
@@ -1,21 +1,26 @@
 """LangGraph State 정의 — LocalizationState TypedDict"""
 
-from typing import Optional, TypedDict
+import operator
+from typing import Annotated, Optional, TypedDict
+
+
+def merge_dict(left: dict, right: dict) -> dict:
+    """dict 채널 reducer — 노드는 변경된 항목만 반환"""
+    return {**left, **right}
 
 
 class LocalizationState(TypedDict):
     # 작업 설정
     sheet_name: str
-    mode: str  # "A" or "B"
+    mode: str  # "A" (전체), "B" (빈칸만), "C" (증분 — 변경 행만)
     target_languages: list[str]
 
     # 데이터
-    original_data: list[dict]       # 원본 시트 데이터
-    backup_data: list[dict]         # 백업용
+    row_table_id: str               # 원본 시트 데이터 (utils.row_table 레지스트리 id, 불변)
     ko_review_results: list[dict]   # 한국어 검수 결과
-    translation_results: list[dict] # 번역 결과
-    review_results: list[dict]      # 검수 결과
-    failed_rows: list[dict]         # 검수실패 행 목록
+    translation_results: list[dict] # 번역 결과 (라운드별 교체 — reviewer 입력)
+    review_results: Annotated[list[dict], operator.add]  # 검수 결과 (append — 재시도 라운드 누적)
+    failed_rows: Annotated[list[dict], operator.add]     # 검수실패 행 목록 (append)
 
     # 리포트
     diff_report_ko: Optional[str]            # 한국어 변경 리포트 (CSV 경로)
@@ -30,7 +35,7 @@ class LocalizationState(TypedDict):
     # 진행 상태
     current_chunk_index: int
     total_chunks: int
-    retry_count: dict  # {row_key: retry_count}
+    retry_count: Annotated[dict, merge_dict]  # {row_key: retry_count} (merge)
 
     # 비용 추적
     total_input_tokens: int
@@ -38,8 +43,8 @@ class LocalizationState(TypedDict):
     total_reasoning_tokens: int
     total_cached_tokens: int
 
-    # 로그
-    logs: list[str]
+    # 로그 (append — 노드는 새 로그 줄만 반환)
+    logs: Annotated[list[str], operator.add]
 
     # 사용자 커스텀 지침 (시트별)
     custom_prompt: str
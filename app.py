@@ -35,6 +35,7 @@ def _save_config(data: dict):
         pass
 
 from agents.graph import build_graph
+from agents.nodes.writer import writer_node
 from config.constants import (
     LLM_PRICING,
     REQUIRED_COLUMNS,
@@ -43,19 +44,29 @@ from config.constants import (
     TOOL_STATUS_COLUMN,
 )
 from utils.sheets import (
-    batch_format_cells,
+    PartialCommitError,
     batch_update_sheet,
+    commit_updates,
     connect_to_sheet,
     create_backup_csv,
     ensure_tool_status_column,
+    get_worksheet,
     get_worksheet_names,
     load_sheet_data,
     save_backup_to_folder,
+    verify_updates_before_commit,
 )
 from utils.diff_report import (
     generate_ko_diff_report,
     generate_translation_diff_report,
 )
+from utils.row_table import (
+    RowTable,
+    get_row_table,
+    register_row_table,
+    release_row_table,
+    with_row_context,
+)
 from utils.ui_components import (
     inject_custom_css,
     render_header,
@@ -122,6 +133,17 @@ if "graph" not in st.session_state:
     st.session_state.graph = graph
 
 
+def _release_run_table():
+    """
+    이전 실행의 RowTable 해제 (레지스트리 + 디스크 파일).
+    새 실행 시작 / 작업 취소 / 새 작업 시작 시 호출 — 번역 취소(한국어 검수 복귀)는 같은 테이블 재사용
+    """
+    init_state = st.session_state.get("_initial_state")
+    if init_state and init_state.get("row_table_id"):
+        release_row_table(init_state["row_table_id"])
+    st.session_state._initial_state = None
+
+
 # ── 헬퍼: 번역 phase 스트리밍 실행 ───────────────────────────────────
 
 _PROGRESS_NODES = ["translator", "reviewer", "final_approval"]
@@ -151,10 +173,10 @@ def _run_translation_streaming(resume_value: str, config: dict, indicator_slot=N
             node_name = list(event.keys())[0]
             node_output = event[node_name]
 
-            # 로그 업데이트 (각 노드는 누적 로그 전체를 반환)
+            # 로그 업데이트 (각 노드는 새로 추가된 로그만 반환)
             node_logs = node_output.get("logs", [])
             if node_logs:
-                graph_logs = node_logs
+                graph_logs += node_logs
 
             # 파이프라인 상태 업데이트 (내부 추적용)
             if node_name in _PROGRESS_NODES:
@@ -195,7 +217,10 @@ def _process_translation_result(result: dict):
     """번역 결과를 세션 상태에 저장 (리포트, 비용 등)"""
     st.session_state.graph_result = result
 
-    review_results = result.get("review_results", [])
+    # state에는 row_index만 있음 — 기존 번역은 RowTable에서 보강
+    review_results = with_row_context(
+        result.get("review_results", []), get_row_table(result.get("row_table_id", ""))
+    )
     if review_results:
         old_trans = []
         new_trans = []
@@ -203,7 +228,7 @@ def _process_translation_result(result: dict):
             old_trans.append({
                 "Key": r["key"],
                 "lang": r["lang"],
-                "old": r.get("old_translation", ""),
+                "old": r["old_translation"],
             })
             new_trans.append({
                 "Key": r["key"],
@@ -404,13 +429,14 @@ if start_button:
         graph, checkpointer = build_graph()
         st.session_state.graph = graph
 
+    _release_run_table()
     st.session_state.current_step = "loading"
     st.session_state.thread_id = str(uuid.uuid4())
     st.session_state.logs = []
     st.session_state.pipeline_status = {}
 
     try:
-        ws = st.session_state.spreadsheet.worksheet(selected_sheet)
+        ws = get_worksheet(st.session_state.spreadsheet, selected_sheet)
         df = load_sheet_data(ws)
         df = ensure_tool_status_column(ws, df)
 
@@ -449,8 +475,7 @@ if start_button:
             "sheet_name": selected_sheet,
             "mode": mode,
             "target_languages": target_langs,
-            "original_data": df.to_dict("records"),
-            "backup_data": df.to_dict("records"),
+            "row_table_id": register_row_table(RowTable.from_dataframe(df)),
             "ko_review_results": [],
             "translation_results": [],
             "review_results": [],
@@ -508,7 +533,7 @@ if start_button:
             # 로그 수집
             node_logs = node_output.get("logs", [])
             if node_logs:
-                graph_logs = node_logs
+                graph_logs += node_logs
 
             # 파이프라인 내부 상태 업데이트 (추적용)
             if node_name in _INIT_NODES:
@@ -574,6 +599,7 @@ if start_button:
 # ── 작업 취소 처리 ────────────────────────────────────────────────────
 
 if cancel_button:
+    _release_run_table()
     for key in [
         "worksheet", "df", "backup_csv", "backup_filename",
         "ko_report_df", "ko_report_csv",
@@ -824,36 +850,58 @@ if st.session_state.current_step == "final_review":
             })
             with st.spinner("시트 업데이트 중..."):
                 try:
-                    result = st.session_state.graph.invoke(
-                        Command(resume="approved"), config=config
-                    )
-                    st.session_state.graph_result = result
-                    st.session_state.logs.extend(result.get("logs", []))
-
-                    updates = result.get("_updates", [])
+                    # 시트 반영 후 그래프 종료 — 검증/커밋 실패 시 final_approval 인터럽트에
+                    # 남아 다시 승인 가능 (API 경로와 동일)
+                    updates = writer_node(
+                        st.session_state.graph.get_state(config).values
+                    )["_updates"]
                     if (
                         updates
                         and st.session_state.worksheet
                         and st.session_state.df is not None
                     ):
-                        batch_update_sheet(
+                        # 이전 시도에서 일부만 반영된 행 (같은 thread 한정)
+                        partial = st.session_state.get("committed_rows", {})
+                        done_rows = partial.get(st.session_state.thread_id, [])
+                        updates, verify_report = verify_updates_before_commit(
                             st.session_state.worksheet,
                             updates,
                             st.session_state.df,
+                            committed_rows=done_rows,
                         )
-                        # 변경된 셀 하이라이트 적용
+                        if verify_report["skipped_rows"]:
+                            st.session_state.logs.append(
+                                f"로드 이후 수정된 행 스킵: {len(verify_report['skipped_rows'])}건"
+                            )
+                        # 값 + 서식을 행 단위 batchUpdate로 반영
+                        bar = st.progress(0.0, text="시트에 쓰는 중...")
                         try:
-                            batch_format_cells(
+                            report = commit_updates(
                                 st.session_state.worksheet,
                                 updates,
                                 st.session_state.df,
+                                on_progress=lambda done, total: bar.progress(
+                                    done / total if total else 1.0,
+                                    text=f"{done}/{total} 셀 반영",
+                                ),
                             )
-                        except Exception:
-                            pass  # 포맷팅 실패는 무시 (데이터 업데이트는 이미 완료)
+                        except PartialCommitError as e:
+                            st.session_state.committed_rows = {
+                                st.session_state.thread_id:
+                                    sorted(set(done_rows) | set(e.committed_rows))
+                            }
+                            raise
+                        st.session_state.committed_rows = {}
                         st.session_state.logs.append(
-                            f"시트 업데이트 완료: {len(updates)}건"
+                            f"시트 업데이트 완료: {report['cells']}건"
                         )
 
+                    result = st.session_state.graph.invoke(
+                        Command(resume="approved"), config=config
+                    )
+                    st.session_state.graph_result = result
+                    st.session_state.logs.extend(result.get("logs", []))
+
                     st.session_state.pipeline_status.update({
                         "writer": "done",
                         "writer_text": "완료",
@@ -882,12 +930,11 @@ if st.session_state.current_step == "final_review":
             ):
                 _ws = st.session_state.worksheet
                 _df = st.session_state.df
-                backup_data = st.session_state.graph_result.get("backup_data", []) if st.session_state.graph_result else []
+                table_id = st.session_state.graph_result.get("row_table_id", "") if st.session_state.graph_result else ""
+                backup_table = get_row_table(table_id) if table_id else RowTable({}, [])
                 revert_updates = []
                 for i in range(len(_df)):
-                    original_status = ""
-                    if i < len(backup_data):
-                        original_status = backup_data[i].get(TOOL_STATUS_COLUMN, "")
+                    original_status = backup_table.value(i, TOOL_STATUS_COLUMN)
                     revert_updates.append({
                         "row_index": i,
                         "column_name": TOOL_STATUS_COLUMN,
@@ -997,6 +1044,7 @@ if st.session_state.current_step == "done":
     st.markdown("<div style='height: 16px'></div>", unsafe_allow_html=True)
 
     if st.button("새 작업 시작", use_container_width=True):
+        _release_run_table()
         for key in [
             "current_step", "worksheet", "df",
             "backup_csv", "backup_filename", "ko_report_df", "ko_report_csv",
@@ -0,0 +1,102 @@
+"""응답 압축 — Accept-Encoding 협상 (br > gzip), SSE 스트림 제외"""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # 선택 의존성 — 없으면 gzip만 사용
+    import brotli
+except ImportError:
+    brotli = None
+
+# 이 크기 미만 응답은 압축하지 않음 (헤더/CPU 비용이 더 큼)
+COMPRESS_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def _accepts(headers: Headers, encoding: str) -> bool:
+    for part in headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == encoding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+class CompressionMiddleware:
+    """
+    REST/다운로드 응답 압축.
+
+    - brotli 설치 + 클라이언트가 br 허용 → br, 그 외 gzip 허용 → gzip (Starlette GZipMiddleware)
+    - EventSource 요청 (Accept: text/event-stream)은 그대로 통과 — 압축 버퍼링이 이벤트 전달을 지연시킴
+    - 이미 Content-Encoding이 있는 응답 (사전 압축된 이벤트 blob)과 작은 응답은 그대로
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=GZIP_LEVEL)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if "text/event-stream" in headers.get("accept", ""):
+            await self.app(scope, receive, send)
+        elif brotli is not None and _accepts(headers, "br"):
+            await _BrotliResponder(self.app, self.minimum_size)(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
+class _BrotliResponder:
+    """응답 1건의 br 압축 — 첫 body 청크를 보고 압축 여부 결정, 스트리밍 응답은 청크 단위로 압축"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or "text/event-stream" in headers.get("content-type", "")
+            )
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            self.compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = "br"
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            await self.send(start)
+
+        if self.passthrough:
+            await self.send(message)
+            return
+        chunk = self.compressor.process(body)
+        chunk += self.compressor.finish() if not more_body else self.compressor.flush()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
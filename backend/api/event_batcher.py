@@ -0,0 +1,129 @@
+"""SSE 이벤트 배처 — 행 단위 청크 이벤트를 flush 창마다 한 프레임으로 합침"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable
+
+from config.constants import SSE_BATCH_MAX_ROWS, SSE_FLUSH_SECONDS
+
+logger = logging.getLogger("devlocal.events")
+
+# 합칠 수 있는 이벤트 — data = {"chunk_results": [...], "progress": {...}, ["lang"]}
+BATCHED_EVENTS = frozenset({"ko_review_chunk", "translation_chunk", "review_chunk"})
+
+
+class EventBatcher:
+    """
+    세션별 이벤트 배처 (노드 emitter → 세션 저장소 publish 사이).
+
+    - 배치 이벤트: 같은 (이벤트, 언어)가 이어지면 chunk_results를 이어 붙이고
+      progress는 최신값으로 덮어씀 → 한 프레임 = publish/직렬화/SSE 전송 1회
+    - adaptive flush: 유휴 상태의 첫 이벤트는 즉시 전송 (지연 없음), 이후 flush 창
+      동안 들어온 이벤트는 모아서 창 끝에 전송. 모은 행이 max_rows에 도달하면 즉시 전송
+    - 그 외 이벤트 (node_update, done 등): 대기 중 배치를 먼저 내보낸 뒤 바로 전송 (순서 보장)
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[str, dict], None],
+        window: float = SSE_FLUSH_SECONDS,
+        max_rows: int = SSE_BATCH_MAX_ROWS,
+    ):
+        self._publish = publish
+        self._window = window
+        self._max_rows = max_rows
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, dict]] = []
+        self._rows = 0
+        # 현재 flush 창 종료 시각 (monotonic) — 지났고 대기 배치가 없으면 유휴
+        self._window_end = 0.0
+        self._scheduled = False
+
+    def emit(self, event_type: str, data: dict):
+        with self._lock:
+            if event_type in BATCHED_EVENTS and isinstance(data.get("chunk_results"), list):
+                now = time.monotonic()
+                if not self._pending and now >= self._window_end:
+                    self._window_end = now + self._window
+                    self._send(event_type, data)
+                    return
+                self._append(event_type, data)
+                if self._rows >= self._max_rows:
+                    self._flush_locked()
+                elif not self._scheduled:
+                    self._scheduled = True
+                    _flusher.schedule(max(self._window_end, now), self)
+                return
+            self._flush_locked()
+            self._send(event_type, data)
+
+    def flush(self):
+        """대기 중 배치 즉시 전송 (phase 종료/Cancel 전)"""
+        with self._lock:
+            self._flush_locked()
+
+    def _on_timer(self):
+        with self._lock:
+            self._scheduled = False
+            self._flush_locked()
+
+    def _append(self, event_type: str, data: dict):
+        rows = data["chunk_results"]
+        if self._pending:
+            last_type, last = self._pending[-1]
+            if last_type == event_type and last.get("lang") == data.get("lang"):
+                last["chunk_results"].extend(rows)
+                last["progress"] = data.get("progress", last.get("progress"))
+                self._rows += len(rows)
+                return
+        # 호출자 dict/list를 변경하지 않도록 복사본에 누적
+        self._pending.append((event_type, {**data, "chunk_results": list(rows)}))
+        self._rows += len(rows)
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._rows = 0
+        for event_type, data in pending:
+            self._send(event_type, data)
+        self._window_end = time.monotonic() + self._window
+
+    def _send(self, event_type: str, data: dict):
+        try:
+            self._publish(event_type, data)
+        except Exception as e:
+            logger.warning("Event publish failed (event=%s): %s", event_type, e)
+
+
+class _Flusher:
+    """모든 배처의 flush 타이머를 처리하는 단일 데몬 스레드 (배처마다 스레드/타이머 생성 없음)"""
+
+    def __init__(self):
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def schedule(self, deadline: float, batcher: EventBatcher):
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), batcher))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="sse-flusher", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+                _, _, batcher = heapq.heappop(self._heap)
+            batcher._on_timer()
+
+
+_flusher = _Flusher()
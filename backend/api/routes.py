@@ -1,18 +1,20 @@
 """API 라우트 — REST + SSE endpoints"""
 
 import asyncio
-import io
+import gzip
 import json
 import logging
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger("devlocal.api")
 
+import numpy as np
 import pandas as pd
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from langgraph.types import Command
 from sse_starlette.sse import EventSourceResponse
 
@@ -24,30 +26,51 @@ from backend.api.schemas import (
     StartRequest,
     StartResponse,
 )
-from backend.api.session_manager import session_manager
+from backend.api.session_manager import SessionManager, session_manager
+from backend.api.session_store import WORKER_ID
+from agents.llm import CancellationToken, PipelineCancelled
+from agents.nodes.translator import speculative_translate
+from agents.nodes.writer import writer_node
 from config.constants import (
+    CHUNK_SIZE,
     LLM_PRICING,
     REQUIRED_COLUMNS,
+    SSE_POLL_SECONDS,
+    STATE_PAGE_MAX_ROWS,
     SUPPORTED_LANGUAGES,
     Status,
     TOOL_STATUS_COLUMN,
 )
-from utils.diff_report import generate_ko_diff_report, generate_translation_diff_report
+from utils.diff_report import (
+    KO_REPORT_COLUMNS,
+    TRANSLATION_REPORT_COLUMNS,
+    ko_diff_frame,
+    translation_diff_frame,
+)
+from utils.export import EXPORT_FORMATS, XLSX_AVAILABLE, iter_export, iter_lines
+from utils.fingerprint import select_changed_rows
+from utils.row_table import RowTable, get_row_table, register_row_table, with_row_context
 from utils.sheets import (
-    batch_format_cells,
-    batch_update_sheet,
+    PartialCommitError,
+    commit_updates,
     connect_to_sheet,
-    create_backup_csv,
+    backup_filename,
+    ensure_fingerprint_column,
     ensure_tool_status_column,
     extract_project_name,
     get_bot_email,
+    get_worksheet,
     get_worksheet_names,
     load_sheet_data,
     save_backup_to_folder,
+    verify_updates_before_commit,
 )
+from utils.job_scheduler import Priority, QueueFull, classify_priority, job_scheduler
+from utils.sheets_scheduler import sheets_scheduler
 
 router = APIRouter()
-executor = ThreadPoolExecutor(max_workers=4)
+# Cancel 시 취소된 워커 종료 대기 상한 (초) — 진행 중 요청은 즉시 중단되므로 보통 수 ms
+CANCEL_WAIT_SECONDS = 10
 
 # ── 로컬 설정 파일 ──────────────────────────────────────────────────
 _CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / ".app_config.json"
@@ -80,7 +103,8 @@ def _save_config(data: dict):
 def api_connect(req: ConnectRequest):
     """시트 연결 + 시트 목록 반환"""
     try:
-        spreadsheet = connect_to_sheet(req.sheet_url)
+        # 명시적 연결 — 최신 시트 목록 재조회 후 캐시 (/start에서 재사용)
+        spreadsheet = connect_to_sheet(req.sheet_url, refresh=True)
         sheet_names = get_worksheet_names(spreadsheet)
         bot_email = get_bot_email()
         project_name = extract_project_name(spreadsheet)
@@ -97,10 +121,22 @@ def api_connect(req: ConnectRequest):
 @router.post("/start", response_model=StartResponse)
 def api_start(req: StartRequest):
     """번역 파이프라인 시작 — 세션 생성 + 데이터 준비"""
+    # admission control — 대기열이 가득 차면 세션/시트 로드 전에 거절
+    try:
+        queue_depth = job_scheduler.admit()
+    except QueueFull as e:
+        logger.warning("Start rejected: job queue full (%d waiting)", e.depth)
+        raise HTTPException(
+            status_code=503,
+            detail=f"작업 대기열이 가득 찼습니다 (대기 {e.depth}건). 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": "30", "X-Queue-Depth": str(e.depth)},
+        )
     session = session_manager.create()
     try:
+        # /connect에서 캐시한 메타데이터 재사용 (추가 조회 없음)
+        session.sheet_url = req.sheet_url
         session.spreadsheet = connect_to_sheet(req.sheet_url)
-        ws = session.spreadsheet.worksheet(req.sheet_name)
+        ws = get_worksheet(session.spreadsheet, req.sheet_name)
         df = load_sheet_data(ws)
 
         # 필수 컬럼 검증 — 누락 시 그래프 실행 전 즉시 실패
@@ -111,19 +147,26 @@ def api_start(req: StartRequest):
             )
 
         df = ensure_tool_status_column(ws, df)
+        df = ensure_fingerprint_column(ws, df)
 
         if req.row_start > 0 and req.row_end > 0:
             df = df.iloc[req.row_start - 1 : req.row_end]
         elif req.row_end > 0:
             df = df.head(req.row_end)
 
+        # 모드 C (증분): 지문이 없거나 바뀐 행만 처리
+        if req.mode == "C":
+            total_loaded = len(df)
+            df = select_changed_rows(df)
+            logger.info("Incremental mode: %d/%d rows changed", len(df), total_loaded)
+
+        # 로드 시점 스냅샷을 불변 RowTable로 등록 — state/세션은 id만 참조
+        table = RowTable.from_dataframe(df)
         session.worksheet = ws
-        session.df = df
+        session.row_table_id = register_row_table(table)
 
-        # in-memory 백업 (다운로드 엔드포인트용 — 시트에는 Write하지 않음)
-        filename, csv_bytes = create_backup_csv(df, req.sheet_name)
-        session.backup_filename = filename
-        session.backup_csv = csv_bytes
+        # 백업 다운로드는 RowTable(로드 시점 스냅샷)에서 요청 시 생성 — 파일명만 고정
+        session.backup_filename = backup_filename(req.sheet_name)
 
         # 게임 설정 로드 (커스텀 프롬프트, 시놉시스, 톤앤매너)
         from config.glossary import get_game_synopsis, get_tone_and_manner
@@ -133,19 +176,16 @@ def api_start(req: StartRequest):
         custom_prompt = custom_prompts.get(req.sheet_name, "")
         game_synopsis = app_cfg.get("game_synopsis") or get_game_synopsis()
         tone_and_manner = app_cfg.get("tone_and_manner") or get_tone_and_manner()
+        session.speculative = bool(app_cfg.get("speculative_translation", False))
 
         # 초기 state 저장
-        # 각 행에 _row_index 부여 (중복 Key 구분용)
-        records = df.to_dict("records")
-        for idx, rec in enumerate(records):
-            rec["_row_index"] = idx
-
+        # 행은 RowTable의 _row_index로 참조 (중복 Key 구분용)
+        # DataFrame 인덱스 = 시트 행 - 2 → 범위 지정/증분 필터 후에도 시트 위치 유지
         session.initial_state = {
             "sheet_name": req.sheet_name,
             "mode": req.mode,
             "target_languages": req.target_languages,
-            "original_data": records,
-            "backup_data": df.to_dict("records"),
+            "row_table_id": session.row_table_id,
             "ko_review_results": [],
             "translation_results": [],
             "review_results": [],
@@ -171,9 +211,11 @@ def api_start(req: StartRequest):
             "tone_and_manner": tone_and_manner,
         }
         session.current_step = "loading"
+        # 재시작 후 /resume으로 재구성할 수 있도록 manifest 기록
+        session.save_manifest()
         logger.info("Pipeline started: session=%s, sheet=%s, mode=%s",
                      session.id, req.sheet_name, req.mode)
-        return StartResponse(session_id=session.id)
+        return StartResponse(session_id=session.id, queue_depth=queue_depth)
     except Exception as e:
         session_manager.delete(session.id)
         logger.error("Pipeline start failed: %s", e)
@@ -183,39 +225,296 @@ def api_start(req: StartRequest):
 # ── SSE Stream ───────────────────────────────────────────────────────
 
 def _make_emitter(session):
-    """노드에서 호출할 수 있는 이벤트 emitter 클로저 생성"""
-    def emit(event_type: str, data: dict):
-        try:
-            asyncio.run_coroutine_threadsafe(
-                session.event_queue.put((event_type, data)),
-                session._loop,
-            )
-        except Exception:
-            pass
-    return emit
+    """
+    노드에서 호출할 수 있는 이벤트 emitter 반환.
+    세션 배처를 거쳐 저장소에 발행 — 청크 이벤트는 flush 창 단위로 한 프레임으로 합쳐지고,
+    어느 워커의 SSE 연결이든 수신.
+    """
+    return session.event_batcher.emit
 
 
 def _make_config_with_emitter(session):
-    """event emitter가 주입된 그래프 config 반환"""
+    """event emitter + 현재 실행의 취소 토큰 + 청크 저널이 주입된 그래프 config 반환"""
     emitter = _make_emitter(session)
     return {
         **session.config,
         "configurable": {
             **session.config.get("configurable", {}),
             "event_emitter": emitter,
+            "cancel_token": session.cancel_token,
+            # 완료 청크를 즉시 기록 — 크래시 후 /resume 시 완료분 재사용
+            "chunk_journal": session.checkpointer,
         },
     }
 
 
+def _submit_phase(session, phase, *args, priority: Optional[Priority] = None):
+    """
+    phase를 작업 스케줄러에 제출. 우선순위는 지정하지 않으면 예상 LLM 청크 수로 분류
+    (작은 시트 먼저), 대기 순번 변경은 SSE queue 이벤트로 전달 (position=0 → 실행 시작).
+    """
+    rows = len(get_row_table(session.row_table_id))
+    chunks = (rows + CHUNK_SIZE - 1) // CHUNK_SIZE
+    if phase is _run_translation_phase:
+        # 번역 + 검수 — 언어별로 각각 청크 호출
+        languages = len((session.initial_state or {}).get("target_languages", [])) or 1
+        chunks *= 2 * languages
+    emitter = _make_emitter(session)
+
+    def on_queue(position: int, depth: int):
+        emitter("queue", {"position": position, "depth": depth})
+
+    job_scheduler.submit(
+        session.id, phase, session, *args,
+        priority=priority if priority is not None else classify_priority(chunks),
+        on_queue=on_queue,
+    )
+
+
+def _begin_run(session, rollback_step: Optional[str] = None) -> Optional[CancellationToken]:
+    """
+    백그라운드 phase 시작 — 실행 lease 획득 + 새 취소 토큰 발급 + 실행 중 표시.
+    이 워커의 이전 실행이 아직 lease를 쥐고 있으면 (Cancel 대기 시간 초과, 막 시작된
+    사전 번역 등) 해제까지 기다렸다가 다시 시도.
+    lease를 얻지 못했거나, 제출 이후 다른 워커가 세션을 바꿨으면 (Cancel 등) None.
+
+    rollback_step: 사용자 요청으로 제출한 phase (승인) — lease를 얻지 못하면 조용히 건너뛰지 않고
+    error 이벤트 발행 + 단계를 되돌려 다시 요청할 수 있게 함
+    """
+    claimed = session_manager.claim(session)
+    if not claimed and session_manager.store.lease_owner(session.id) == WORKER_ID:
+        logger.info("Phase waiting: session %s is still running on this worker", session.id)
+        if session_manager.wait_released(session.id, CANCEL_WAIT_SECONDS):
+            claimed = session_manager.claim(session)
+    if not claimed:
+        owner = session_manager.store.lease_owner(session.id)
+        if rollback_step is None:
+            logger.info("Phase skipped: session %s is running on %s", session.id, owner)
+        else:
+            logger.warning("Phase rejected: session %s is running on %s (step → %s)",
+                           session.id, owner, rollback_step)
+            with session.lock:
+                session.current_step = rollback_step
+            _make_emitter(session)("error", {
+                "message": "이전 작업이 아직 실행 중이라 요청을 처리하지 못했습니다. 잠시 후 다시 시도하세요.",
+            })
+        session.run_done.set()
+        return None
+    if session_manager.store.version(session.id) != session.version:
+        logger.info("Phase skipped: session %s was changed by another worker", session.id)
+        session_manager.release(session)
+        session.run_done.set()
+        return None
+    token = CancellationToken()
+    with session.lock:
+        session.cancel_token = token
+        session.run_done.clear()
+    return token
+
+
+def _end_run(session, run_thread_id: str, token: CancellationToken, record_cancelled: bool = True):
+    """
+    phase 종료 — 취소된 실행의 사용량을 세션에 누적 (비용 보고용, record_cancelled),
+    Cancel로 thread가 바뀌었으면 취소 후 늦게 기록된 체크포인트 정리, lease 해제.
+    """
+    try:
+        if token.cancelled and record_cancelled:
+            with session.lock:
+                for k, v in token.usage.items():
+                    session.cancelled_usage[k] = session.cancelled_usage.get(k, 0) + v
+            session.save_manifest()
+        if session.thread_id != run_thread_id:
+            session.checkpointer.delete_thread(run_thread_id)
+    finally:
+        # 남은 청크 이벤트를 lease 해제 전에 발행 (Cancel의 미소비 이벤트 폐기 대상에 포함되도록)
+        session.event_batcher.flush()
+        session_manager.release(session)
+        session.run_done.set()
+
+
+def _stop_running_phase(session) -> Optional[dict]:
+    """
+    세션의 대기/실행 중 phase 중단 후 워커 반환까지 대기.
+    반환: 이 워커에서 실행 중이던 phase의 취소 토큰 사용량 (없거나 다른 워커면 None)
+    """
+    # 아직 시작 전인(스케줄러 대기 중) phase 제거
+    job_scheduler.cancel(session.id)
+
+    # 토큰 취소 → 진행 중 HTTP 요청 즉시 중단, 노드는 다음 청크 전에 종료.
+    # 워커 반환 시 _end_run이 취소된 실행의 사용량을 세션에 누적함.
+    store = session_manager.store
+    token = session.cancel_token
+    if token is not None and not session.run_done.is_set():
+        token.cancel()
+        if not session.run_done.wait(CANCEL_WAIT_SECONDS):
+            logger.warning("Cancel: worker still running after %ss (session=%s)",
+                           CANCEL_WAIT_SECONDS, session.id)
+        return dict(token.usage)
+    if store.lease_owner(session.id) is not None:
+        # 다른 워커에서 실행 중 — 저장소로 취소 요청, lease 해제(워커 반환)까지 대기 후 다시 읽음
+        store.request_cancel(session.id)
+        if not session_manager.wait_released(
+            session.id, CANCEL_WAIT_SECONDS + SessionManager.HEARTBEAT_SECONDS
+        ):
+            logger.warning("Cancel: remote worker still running after %ss (session=%s)",
+                           CANCEL_WAIT_SECONDS, session.id)
+        loaded = store.load(session.id)
+        if loaded is not None:
+            session.refresh(*loaded)
+    return None
+
+
+def _compact_checkpoints(session):
+    """
+    인터럽트/종료 직후 이전 체크포인트 제거 — 최신 + ko_approval 고정 체크포인트만 유지.
+    phase가 끝났으므로 청크 저널도 정리 (노드 출력은 체크포인트에 반영됨).
+    """
+    try:
+        keep = [session.ko_checkpoint_id] if session.ko_checkpoint_id else []
+        session.checkpointer.prune([session.thread_id], keep=keep)
+        session.checkpointer.clear_chunks(session.thread_id)
+    except Exception as e:
+        logger.warning("Checkpoint prune failed for session %s: %s", session.id, e)
+
+
+def _ordered_ko_results(session, result: dict) -> list:
+    """ko_review 결과를 시트 행 순서로 정렬 (결과 없는 행은 원문 그대로)"""
+    ko_results_raw = result.get("ko_review_results", [])
+    # row_index 기반 매핑 (중복 Key 대응)
+    ko_result_by_ri = {r.get("row_index"): r for r in ko_results_raw if r.get("row_index") is not None}
+    # key 기반 fallback (row_index 없는 경우)
+    ko_result_by_key: dict[str, list] = {}
+    for r in ko_results_raw:
+        if r.get("row_index") is None:
+            ko_result_by_key.setdefault(r["key"], []).append(r)
+    key_consume: dict[str, int] = {}
+
+    table = get_row_table(session.row_table_id)
+    ko_results = []
+    for ri, key, ko_text in table.iter_rows(
+        REQUIRED_COLUMNS["key"], REQUIRED_COLUMNS["korean"]
+    ):
+        if ri in ko_result_by_ri:
+            ko_results.append(ko_result_by_ri[ri])
+        elif key in ko_result_by_key:
+            idx = key_consume.get(key, 0)
+            items = ko_result_by_key[key]
+            if idx < len(items):
+                ko_results.append(items[idx])
+                key_consume[key] = idx + 1
+            else:
+                ko_results.append({
+                    "key": key, "original": ko_text, "revised": ko_text,
+                    "comment": "", "has_issue": False, "row_index": ri,
+                })
+        else:
+            ko_results.append({
+                "key": key, "original": ko_text, "revised": ko_text,
+                "comment": "", "has_issue": False, "row_index": ri,
+            })
+
+    return ko_results
+
+
+def _ko_report_frame(table: RowTable, ko_rows: list) -> pd.DataFrame:
+    """KR diff 리포트 — 시트 순서 ko 결과(행마다 1개)의 교정 컬럼을 RowTable 원문 컬럼과 한 번에 비교"""
+    revised = np.empty(len(ko_rows), dtype=object)
+    revised[:] = [r.get("revised", r.get("original", "")) for r in ko_rows]
+    return ko_diff_frame(
+        table.array(REQUIRED_COLUMNS["key"]), table.array(REQUIRED_COLUMNS["korean"]), revised
+    )
+
+
+def _translation_report_frame(table: RowTable, review_results: list) -> pd.DataFrame:
+    """번역 diff 리포트 — 결과의 row_index를 RowTable 위치로 바꿔 언어별 기존 번역 컬럼에서 일괄 조회"""
+    n = len(review_results)
+    pos = table.positions(r.get("row_index") for r in review_results)
+    found = pos >= 0
+    langs = np.empty(n, dtype=object)
+    langs[:] = [r.get("lang", "") for r in review_results]
+    old = np.full(n, "", dtype=object)
+    for lang in set(langs.tolist()):
+        column = SUPPORTED_LANGUAGES.get(lang)
+        mask = found & (langs == lang)
+        if column and mask.any():
+            old[mask] = table.array(column)[pos[mask]]
+    return translation_diff_frame(
+        [r.get("key", "") for r in review_results],
+        langs,
+        old,
+        [r.get("translated", "") for r in review_results],
+        [r.get("reason", "") for r in review_results],
+    )
+
+
+def _step_view(session, name: str) -> dict:
+    """
+    단계 view — graph_result 기준으로 한 번만 만들어 SSE/state/다운로드가 공유.
+    Session.graph_result가 교체되면 (phase 완료, Cancel, 복원) 무효화되어 다음 조회 시 재생성.
+
+    - original: {"rows": [{key, korean}, ...]} — 시트 행 순서
+    - ko_review: {"rows": 시트 행 순서 ko 결과 (결과 없는 행은 원문), "report": KR diff DataFrame | None}
+    - final_review: {"rows": 원문/기존 번역 보강 review 결과, "failed": failed_rows, "report": DataFrame | None}
+    """
+    # views를 먼저 잡음 — 그 사이 graph_result가 바뀌면 버려질 dict에 저장되어 stale view가 남지 않음
+    views = session.views
+    view = views.get(name)
+    if view is not None:
+        return view
+    result = session.graph_result or {}
+    table = get_row_table(session.row_table_id)
+    if name == "original":
+        view = {"rows": [
+            {"key": key, "korean": ko_text}
+            for _, key, ko_text in table.iter_rows(
+                REQUIRED_COLUMNS["key"], REQUIRED_COLUMNS["korean"]
+            )
+        ]}
+    elif name == "ko_review":
+        rows = _ordered_ko_results(session, result)
+        report = _ko_report_frame(table, rows) if result.get("ko_review_results") else None
+        view = {"rows": rows, "report": report}
+    elif name == "final_review":
+        raw_results = result.get("review_results", [])
+        view = {
+            # state에는 row_index만 있음 — 원문/기존 번역은 RowTable에서 보강
+            "rows": with_row_context(raw_results, table),
+            "failed": result.get("failed_rows", []),
+            "report": _translation_report_frame(table, raw_results) if raw_results else None,
+        }
+    else:
+        raise ValueError(f"Unknown view: {name}")
+    views[name] = view
+    return view
+
+
+def _build_ko_review(session) -> tuple[list, Optional[list]]:
+    """ko_review 표시 데이터 + KR diff 리포트 (이벤트 전송용)"""
+    view = _step_view(session, "ko_review")
+    report = view["report"]
+    return view["rows"], report.to_dict("records") if report is not None else None
+
+
 def _run_initial_phase(session):
-    """초기 phase 실행 (data_backup → context_glossary → ko_review → ko_approval interrupt)"""
+    """
+    초기 phase 실행 (data_backup → context_glossary → ko_review → ko_approval interrupt).
+    thread에 진행 중 체크포인트가 있으면 (/resume) 처음부터가 아니라 그 지점부터 이어서 실행.
+    """
     emitter = _make_emitter(session)
+    token = _begin_run(session)
+    if token is None:
+        return
+    run_thread_id = session.thread_id
+    reached_ko_review = False
     try:
         config = _make_config_with_emitter(session)
         node_emitter = config["configurable"]["event_emitter"]
+        graph_input = (
+            None if session.graph.get_state(session.config).next else session.initial_state
+        )
 
         for event in session.graph.stream(
-            session.initial_state, config=config, stream_mode="updates"
+            graph_input, config=config, stream_mode="updates"
         ):
             if "__interrupt__" in event:
                 emitter("interrupt", {})
@@ -227,13 +526,13 @@ def _run_initial_phase(session):
 
             # data_backup 완료 시 원본 데이터를 프론트엔드에 전송
             if node_name == "data_backup":
-                orig_data = node_output.get("original_data", [])
-                if orig_data:
+                table = get_row_table(session.row_table_id)
+                if len(table):
                     rows = [
-                        {"key": r.get(REQUIRED_COLUMNS["key"], ""),
-                         "korean": r.get(REQUIRED_COLUMNS["korean"], ""),
-                         "row_index": r.get("_row_index", i)}
-                        for i, r in enumerate(orig_data)
+                        {"key": key, "korean": ko_text, "row_index": ri}
+                        for ri, key, ko_text in table.iter_rows(
+                            REQUIRED_COLUMNS["key"], REQUIRED_COLUMNS["korean"]
+                        )
                     ]
                     node_emitter("original_data", {"rows": rows})
 
@@ -246,136 +545,200 @@ def _run_initial_phase(session):
         # ko_review 결과 수집
         state_snapshot = session.graph.get_state(session.config)
         result = state_snapshot.values
-        ko_results_raw = result.get("ko_review_results", [])
-
+        # ko_approval 인터럽트 체크포인트 고정 — Cancel 시 이 시점을 fork
+        session.ko_checkpoint_id = state_snapshot.config["configurable"]["checkpoint_id"]
+        session.save_manifest()
+        _compact_checkpoints(session)
         with session.lock:
             session.graph_result = result
             session.logs = result.get("logs", [])
             session.current_step = "ko_review"
-            # Cancel 복구용 캐시 저장
-            session.cached_ko_review_results = ko_results_raw
-            session.cached_ko_tokens = (
-                result.get("total_input_tokens", 0),
-                result.get("total_output_tokens", 0),
-                result.get("total_reasoning_tokens", 0),
-                result.get("total_cached_tokens", 0),
-            )
-        # row_index 기반 매핑 (중복 Key 대응)
-        ko_result_by_ri = {r.get("row_index"): r for r in ko_results_raw if r.get("row_index") is not None}
-        # key 기반 fallback (row_index 없는 경우)
-        ko_result_by_key: dict[str, list] = {}
-        for r in ko_results_raw:
-            if r.get("row_index") is None:
-                ko_result_by_key.setdefault(r["key"], []).append(r)
-        key_consume: dict[str, int] = {}
-
-        original_data = result.get("original_data", [])
-        ko_results = []
-        for row in original_data:
-            key = row.get(REQUIRED_COLUMNS["key"], "")
-            ko_text = row.get(REQUIRED_COLUMNS["korean"], "")
-            ri = row.get("_row_index")
-            if ri is not None and ri in ko_result_by_ri:
-                ko_results.append(ko_result_by_ri[ri])
-            elif key in ko_result_by_key:
-                idx = key_consume.get(key, 0)
-                items = ko_result_by_key[key]
-                if idx < len(items):
-                    ko_results.append(items[idx])
-                    key_consume[key] = idx + 1
-                else:
-                    ko_results.append({
-                        "key": key, "original": ko_text, "revised": ko_text,
-                        "comment": "", "has_issue": False, "row_index": ri,
-                    })
-            else:
-                ko_results.append({
-                    "key": key, "original": ko_text, "revised": ko_text,
-                    "comment": "", "has_issue": False, "row_index": ri,
-                })
-
-        # KR diff 리포트 생성
-        ko_report_data = None
-        if ko_results_raw and session.df is not None:
-            original_rows = [
-                {"Key": r.get(REQUIRED_COLUMNS["key"], ""),
-                 "Korean(ko)": r.get(REQUIRED_COLUMNS["korean"], "")}
-                for _, r in session.df.iterrows()
-            ]
-            revised_rows = [
-                {"Key": r["key"],
-                 "Korean(ko)": r.get("revised", r.get("original", ""))}
-                for r in ko_results
-            ]
-            report_df, report_csv = generate_ko_diff_report(original_rows, revised_rows)
-            session.ko_report_df = report_df
-            session.ko_report_csv = report_csv
-            ko_report_data = report_df.to_dict("records")
+        ko_results, ko_report_data = _build_ko_review(session)
 
         emitter("ko_review_ready", {
             "results": ko_results,
             "count": len(ko_results),
             "report": ko_report_data,
         })
+        reached_ko_review = True
+    except PipelineCancelled:
+        logger.info("Initial phase cancelled: session=%s", session.id)
     except Exception as e:
         logger.error("Initial phase error for session %s: %s", session.id, e, exc_info=True)
         emitter("error", {"message": str(e)})
+    finally:
+        _end_run(session, run_thread_id, token)
+        # HITL 대기 진입 — 메모리 예산 초과 시 다른 유휴 세션 spill
+        session_manager.rebalance(keep=session)
+    # lease 해제 후 제출해야 사전 번역 phase가 실행 권한을 얻음
+    if reached_ko_review and session.speculative:
+        _submit_phase(session, _run_speculative_phase, priority=Priority.BULK)
+
+
+def _run_speculative_phase(session):
+    """
+    HITL 1 대기 중 사전 번역 phase (opt-in) — 검수에서 바뀌지 않은 행을 미리 번역해 저장.
+    KR 승인/Cancel 시 중단되며, 완료된 청크는 승인 후 translator_node가 재사용.
+    실패해도 세션에는 영향 없음 (승인 후 정상 경로로 번역).
+    """
+    token = _begin_run(session)
+    if token is None:
+        return
+    run_thread_id = session.thread_id
+    try:
+        if session.current_step != "ko_review":
+            return
+        config = _make_config_with_emitter(session)
+        values = session.graph.get_state(session.config).values
+        stats = speculative_translate(values, config)
+        logger.info("Speculative translation done: session=%s, rows=%d, chunks=%d",
+                    session.id, stats["rows"], stats["chunks"])
+    except PipelineCancelled:
+        logger.info("Speculative translation stopped: session=%s, spent=%s",
+                    session.id, token.usage)
+    except Exception as e:
+        logger.warning("Speculative translation failed for session %s: %s", session.id, e)
+    finally:
+        # 완료 청크의 사용량은 기록과 함께 저장되어 translator_node가 합산 — 중복 누적 금지
+        _end_run(session, run_thread_id, token, record_cancelled=False)
 
 
 @router.get("/stream/{session_id}")
-async def api_stream(session_id: str):
-    """SSE 스트림 — 파이프라인 실시간 이벤트"""
+async def api_stream(session_id: str, request: Request, last_event_id: Optional[int] = None):
+    """
+    SSE 스트림 — 파이프라인 실시간 이벤트.
+
+    모든 이벤트에 seq id를 붙여 전송. 재연결 시 Last-Event-ID 헤더 (또는 last_event_id
+    쿼리 — 수동 재연결용)를 보내면 그 이후 이벤트만 재전송. 재전송 버퍼 범위를 벗어났으면
+    resync 이벤트로 /state 전체 동기화를 요청.
+    """
     session = session_manager.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    logger.info("SSE stream opened: %s (step=%s)", session_id, session.current_step)
+    header_id = request.headers.get("last-event-id")
+    if last_event_id is None and header_id and header_id.isdigit():
+        last_event_id = int(header_id)
 
-    loop = asyncio.get_event_loop()
-    with session.lock:
-        session._loop = loop
-        # 이전 SSE 연결 무효화 — generation counter 증가
-        session._sse_generation += 1
-        current_gen = session._sse_generation
-        # Queue: 없을 때만 새로 생성 (SSE 재연결 시 기존 Queue 유지)
-        if session.event_queue is None:
-            session.event_queue = asyncio.Queue()
-        should_start = session.current_step == "loading"
-
-    # loading 상태일 때만 초기 phase 실행 (재연결 시 재실행 방지)
+    logger.info(
+        "SSE stream opened: %s (step=%s, last_event_id=%s)",
+        session_id, session.current_step, last_event_id,
+    )
+
+    store = session_manager.store
+    # 이전 SSE 연결 무효화 (어느 워커의 연결이든) — 미소비 이벤트는 유지되어 재연결 시 전달
+    generation = store.open_stream(session_id)
+    should_start = session.current_step == "loading"
+
+    # loading 상태일 때만 초기 phase 실행 (재연결/다른 워커의 중복 실행은 lease로 방지)
     if should_start:
-        executor.submit(_run_initial_phase, session)
+        _submit_phase(session, _run_initial_phase)
 
     async def event_generator():
-        while session._sse_generation == current_gen:
+        # 같은 워커의 발행은 즉시 깨우고, 다른 워커의 발행은 SSE_POLL_SECONDS 주기로 폴링
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def notify():
             try:
-                event_type, data = await asyncio.wait_for(
-                    session.event_queue.get(), timeout=300
-                )
-                if event_type == "_sse_close":
-                    break
-                yield {"event": event_type, "data": json.dumps(data, ensure_ascii=False)}
-                if event_type in ("done", "error"):
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass
+
+        # Last-Event-ID 재연결: 클라이언트가 받은 지점부터 (소비 커서와 무관하게) 재전송
+        resume_from = last_event_id
+        if resume_from is not None and resume_from < store.replay_floor(session_id):
+            resume_from = store.latest_seq(session_id)
+            yield {"id": str(resume_from), "event": "resync", "data": "{}"}
+
+        unsubscribe = store.subscribe(session_id, notify)
+        idle = 0.0
+        try:
+            while True:
+                wake.clear()
+                cursor, current = store.sse_state(session_id)
+                if current != generation:
                     break
-            except asyncio.TimeoutError:
-                yield {"event": "ping", "data": "{}"}
+                if resume_from is not None:
+                    cursor = resume_from
+                # 읽은 배치는 즉시 소비 처리 — 이후 발행이 전송 중인 이벤트에 합쳐지지 않도록
+                events = store.read_events(session_id, cursor, claim=True)
+                for seq, event_type, data in events:
+                    if resume_from is not None:
+                        resume_from = seq
+                    yield {"id": str(seq), "event": event_type, "data": data}
+                    if event_type in ("done", "error"):
+                        return
+                if events:
+                    idle = 0.0
+                    continue
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=SSE_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    idle += SSE_POLL_SECONDS
+                    if idle >= 300:
+                        idle = 0.0
+                        yield {"event": "ping", "data": "{}"}
+        finally:
+            unsubscribe()
 
     return EventSourceResponse(event_generator())
 
 
+@router.get("/events/{session_id}/blobs/{blob_id}")
+def api_event_blob(session_id: str, blob_id: str, request: Request):
+    """큰 SSE 이벤트 본문 (gzip 사전 압축 JSON) — 이벤트 data의 {"blob": id} 참조로 조회"""
+    data = session_manager.store.read_blob(session_id, blob_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Event payload expired")
+    if "gzip" not in request.headers.get("accept-encoding", ""):
+        return Response(content=gzip.decompress(data), media_type="application/json")
+    return Response(
+        content=data,
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+    )
+
+
 # ── HITL 1: KR Approval ─────────────────────────────────────────────
 
-def _run_translation_phase(session, resume_value: str):
-    """번역 phase 실행 (translator → reviewer → final_approval interrupt)"""
+def _build_final_review(session, result: dict) -> tuple[list, Optional[list], dict]:
+    """최종 검수 표시 데이터 + 번역 diff 리포트 (이벤트 전송용) + 비용 요약"""
+    view = _step_view(session, "final_review")
+    review_results = view["rows"]
+    report_data = view["report"].to_dict("records") if view["report"] is not None else None
+
+    cost_summary = {
+        "input_tokens": result.get("total_input_tokens", 0),
+        "output_tokens": result.get("total_output_tokens", 0),
+        "reasoning_tokens": result.get("total_reasoning_tokens", 0),
+        "cached_tokens": result.get("total_cached_tokens", 0),
+    }
+    return review_results, report_data, cost_summary
+
+
+def _run_translation_phase(session, resume_value: Optional[str]):
+    """
+    번역 phase 실행 (translator → reviewer → final_approval interrupt).
+    resume_value=None이면 마지막 체크포인트부터 이어서 실행 (/resume — 완료 청크는 저널에서 재사용).
+    """
     emitter = _make_emitter(session)
+    # KR 승인으로 제출된 경우만 되돌림 (/resume 재개는 다른 실행이 이미 진행 중)
+    token = _begin_run(session, rollback_step="ko_review" if resume_value is not None else None)
+    if token is None:
+        return
+    run_thread_id = session.thread_id
     try:
         config = _make_config_with_emitter(session)
+        graph_input = Command(resume=resume_value) if resume_value is not None else None
 
         for event in session.graph.stream(
-            Command(resume=resume_value), config, stream_mode="updates"
+            graph_input, config, stream_mode="updates"
         ):
             if "__interrupt__" in event:
                 break
+            # 노드 경계에서도 취소 확인 (LLM 호출 없는 노드 직후)
+            token.raise_if_cancelled()
 
             node_name = list(event.keys())[0]
             node_output = event[node_name]
@@ -387,34 +750,18 @@ def _run_translation_phase(session, resume_value: str):
                 "logs": node_logs,
             })
 
-        # 결과 수집
+        # 결과 수집 (취소됐으면 Cancel이 세션 상태를 복구하므로 건드리지 않음)
+        token.raise_if_cancelled()
         state_snapshot = session.graph.get_state(session.config)
         result = state_snapshot.values
+        _compact_checkpoints(session)
         with session.lock:
+            token.raise_if_cancelled()
             session.graph_result = result
             session.logs = result.get("logs", [])
             session.current_step = "final_review"
 
-        # Translation diff report
-        review_results = result.get("review_results", [])
-        report_data = None
-        if review_results:
-            old_trans = [{"Key": r["key"], "lang": r["lang"],
-                         "old": r.get("old_translation", "")} for r in review_results]
-            new_trans = [{"Key": r["key"], "lang": r["lang"],
-                         "new": r["translated"], "reason": r.get("reason", "")}
-                        for r in review_results]
-            report_df, report_csv = generate_translation_diff_report(old_trans, new_trans)
-            session.translation_report_df = report_df
-            session.translation_report_csv = report_csv
-            report_data = report_df.to_dict("records")
-
-        cost_summary = {
-            "input_tokens": result.get("total_input_tokens", 0),
-            "output_tokens": result.get("total_output_tokens", 0),
-            "reasoning_tokens": result.get("total_reasoning_tokens", 0),
-            "cached_tokens": result.get("total_cached_tokens", 0),
-        }
+        review_results, report_data, cost_summary = _build_final_review(session, result)
 
         emitter("final_review_ready", {
             "review_results": review_results,
@@ -422,9 +769,16 @@ def _run_translation_phase(session, resume_value: str):
             "report": report_data,
             "cost": cost_summary,
         })
+    except PipelineCancelled:
+        logger.info(
+            "Translation phase cancelled: session=%s, spent=%s", session.id, token.usage
+        )
     except Exception as e:
         logger.error("Translation phase error for session %s: %s", session.id, e, exc_info=True)
         emitter("error", {"message": str(e)})
+    finally:
+        _end_run(session, run_thread_id, token)
+        session_manager.rebalance(keep=session)
 
 
 @router.post("/approve-ko/{session_id}")
@@ -436,88 +790,164 @@ async def api_approve_ko(session_id: str, req: ApprovalRequest):
 
     logger.info("KR approval: session=%s, decision=%s", session_id, req.decision)
 
-    loop = asyncio.get_event_loop()
+    # 사전 번역 중이면 중단 — 완료된 청크는 저장되어 있어 translator_node가 재사용
+    await run_in_threadpool(_stop_running_phase, session)
+
     with session.lock:
         session.ko_resume_value = req.decision
         session.current_step = "translating"
-        session._loop = loop
-        # Cancel 후 재진입 시 SSE 재연결 전에 호출될 수 있으므로 queue 확보
-        if session.event_queue is None:
-            session.event_queue = asyncio.Queue()
 
     # 백그라운드에서 번역 실행 (시트에는 Write하지 않음 — 최종 컨펌 시점에서 일괄 반영)
-    executor.submit(_run_translation_phase, session, req.decision)
+    _submit_phase(session, _run_translation_phase, req.decision)
 
     return {"status": "translating"}
 
 
-def _emit_done(session):
-    """SSE done 이벤트 전송 — EventSource 정상 종료용"""
-    try:
-        if session.event_queue and session._loop:
-            asyncio.run_coroutine_threadsafe(
-                session.event_queue.put(("done", {})),
-                session._loop,
-            )
-    except Exception:
-        pass
+def _emit_done(session, data: Optional[dict] = None):
+    """SSE done 이벤트 전송 — EventSource 정상 종료용 (최종 승인 결과 포함)"""
+    _make_emitter(session)("done", data or {})
 
 
 # ── HITL 2: Final Approval ───────────────────────────────────────────
 
-@router.post("/approve-final/{session_id}")
-async def api_approve_final(session_id: str, req: ApprovalRequest):
-    """HITL 2: 최종 승인 → 시트 업데이트 / 거부 → 원복"""
-    session = session_manager.get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+def _commit_final(session, emitter) -> dict:
+    """
+    최종 승인 반영 — 백업 → 업데이트 목록 생성/동시성 검증 → 시트 커밋 → 그래프 종료.
+    그래프는 시트 반영이 끝난 뒤에 resume — 검증/커밋이 실패하면 thread가 final_approval
+    인터럽트에 남아 있어 같은 세션으로 다시 승인할 수 있음.
+    진행은 commit_progress 이벤트 (stage, done, total) — backup, writing (배치마다 누적 셀 수).
+    일부 배치만 반영된 채 실패하면 반영된 행을 session.committed_rows에 기록 — 재시도 시
+    그 행은 동시성 충돌로 세지 않고 제외.
+    반환: done 이벤트 data
+    """
+    def progress(stage: str, done: int = 0, total: int = 0):
+        emitter("commit_progress", {"stage": stage, "done": done, "total": total})
+
+    # 최종 컨펌 직전 백업 생성 (시트 Write 전 안전장치)
+    # 로드 시점 DataFrame은 RowTable에서 필요할 때만 재구성
+    loaded_df = (
+        get_row_table(session.row_table_id).to_dataframe()
+        if session.row_table_id else None
+    )
+    if loaded_df is not None:
+        sheet_name = (session.initial_state or {}).get("sheet_name", "unknown")
+        backup_folder = _load_config().get("backup_folder", "./backups")
+        save_backup_to_folder(loaded_df, sheet_name, folder=backup_folder)
+        progress("backup")
+
+    # 다른 워커/재시작 후 재구성된 세션이면 워크시트 재연결
+    _ensure_worksheet(session)
+    # 업데이트 목록은 writer 노드와 같은 함수로 인터럽트 시점 state에서 미리 생성 (그래프 진행 없음)
+    updates = writer_node(session.graph.get_state(session.config).values)["_updates"]
+    commit_report = None
+    if updates and session.worksheet and loaded_df is not None:
+        # 로드 이후 사람이 수정한 행은 재매핑하거나 스킵 (Key 컬럼 + 대상 셀만 조회)
+        updates, verify_report = verify_updates_before_commit(
+            session.worksheet, updates, loaded_df, committed_rows=session.committed_rows
+        )
+        # 값 + 서식을 행 단위 batchUpdate로 나눠 반영 — 배치마다 진행률
+        try:
+            commit_report = commit_updates(
+                session.worksheet, updates, loaded_df,
+                on_progress=lambda done, total: progress("writing", done, total),
+            )
+        except PartialCommitError as e:
+            session.committed_rows = sorted(set(session.committed_rows) | set(e.committed_rows))
+            session.save_manifest()
+            e.report["concurrency"] = verify_report
+            raise
+        commit_report["concurrency"] = verify_report
+    if session.committed_rows:
+        session.committed_rows = []
+        session.save_manifest()
+
+    result = session.graph.invoke(Command(resume="approved"), config=session.config)
+    _compact_checkpoints(session)
+    with session.lock:
+        session.graph_result = result
+        session.logs = result.get("logs", [])
 
-    logger.info("Final approval: session=%s, decision=%s", session_id, req.decision)
+    return {
+        "status": "done",
+        "updates_count": commit_report["cells"] if commit_report else 0,
+        "translations_applied": True,
+        "commit": commit_report,
+    }
 
-    config = session.config
 
-    if req.decision == "approved":
+def _run_commit_phase(session, decision: str):
+    """
+    최종 승인/거부 반영 (백그라운드). 결과는 done 이벤트, 실패는 error 이벤트로 전달.
+    요청 시 pin한 세션은 여기서 해제.
+    """
+    emitter = _make_emitter(session)
+    try:
+        token = _begin_run(session, rollback_step="final_review")
+        if token is None:
+            return
+        run_thread_id = session.thread_id
         try:
-            # 최종 컨펌 직전 백업 생성 (시트 Write 전 안전장치)
-            if session.df is not None:
-                sheet_name = (session.initial_state or {}).get("sheet_name", "unknown")
-                backup_folder = _load_config().get("backup_folder", "./backups")
-                save_backup_to_folder(session.df, sheet_name, folder=backup_folder)
-
-            result = session.graph.invoke(Command(resume="approved"), config=config)
-            with session.lock:
-                session.graph_result = result
-                session.logs = result.get("logs", [])
-
-            updates = result.get("_updates", [])
-            if updates and session.worksheet and session.df is not None:
-                batch_update_sheet(session.worksheet, updates, session.df)
+            if decision == "approved":
+                summary = _commit_final(session, emitter)
+            else:
+                # 거부: 중간 Write가 없으므로 원복 불필요 — 세션 정리만 수행
                 try:
-                    batch_format_cells(session.worksheet, updates, session.df)
+                    session.graph.invoke(Command(resume="rejected"), config=session.config)
                 except Exception as e:
-                    logger.warning("Cell formatting failed (non-critical): %s", e)
+                    logger.warning("Rejected graph invoke failed (non-critical): %s", e)
+                summary = {"status": "done", "translations_applied": False}
 
             with session.lock:
                 session.current_step = "done"
-            _emit_done(session)
-            return {
-                "status": "done",
-                "updates_count": len(updates),
-                "translations_applied": True,
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
-    else:
-        # 거부: 중간 Write가 없으므로 원복 불필요 — 세션 정리만 수행
-        try:
-            session.graph.invoke(Command(resume="rejected"), config=config)
+            _emit_done(session, summary)
         except Exception as e:
-            logger.warning("Rejected graph invoke failed (non-critical): %s", e)
+            logger.error("Final commit error for session %s: %s", session.id, e, exc_info=True)
+            # partial_write: 시트에 일부 행이 이미 반영됨 (재승인 시 나머지만 반영)
+            partial = isinstance(e, PartialCommitError)
+            emitter("error", {
+                "message": str(e),
+                "partial_write": partial,
+                "commit": e.report if partial else None,
+            })
+        finally:
+            _end_run(session, run_thread_id, token)
+    finally:
+        session.busy = False
+        session_manager.rebalance()
+
+
+@router.post("/approve-final/{session_id}")
+async def api_approve_final(session_id: str, req: ApprovalRequest):
+    """
+    HITL 2: 최종 승인 → 시트 업데이트 / 거부 → 원복.
+    반영은 작업 스케줄러에서 실행 — 즉시 반환하고 진행/결과는 SSE
+    (commit_progress → done, 실패 시 error)로 전달
+    """
+    # pin: 커밋 중 spill/삭제 금지 (커밋 작업이 끝날 때 해제)
+    session = await run_in_threadpool(session_manager.get, session_id, True)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
 
+    logger.info("Final approval: session=%s, decision=%s", session_id, req.decision)
+    try:
+        # 다른 워커/요청이 같은 세션을 실행/커밋 중이면 거절 (시트 중복 반영 방지)
+        running = await run_in_threadpool(session_manager.store.lease_owner, session.id)
         with session.lock:
-            session.current_step = "done"
-        _emit_done(session)
-        return {"status": "done", "translations_applied": False}
+            if running or not session.run_done.is_set():
+                raise HTTPException(status_code=409, detail="이 세션은 다른 요청에서 처리 중입니다")
+            if session.current_step != "final_review":
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"최종 승인 단계가 아닙니다 (current_step={session.current_step})",
+                )
+            # 작업 시작 전 중복 승인 방지
+            session.run_done.clear()
+    except HTTPException:
+        session.busy = False
+        raise
+
+    _submit_phase(session, _run_commit_phase, req.decision, priority=Priority.INTERACTIVE)
+    return {"status": "committing"}
 
 
 # ── Cancel ───────────────────────────────────────────────────────────
@@ -525,100 +955,221 @@ async def api_approve_final(session_id: str, req: ApprovalRequest):
 @router.post("/cancel/{session_id}")
 def api_cancel(session_id: str):
     """번역 취소 → ko_review로 복귀"""
-    session = session_manager.get(session_id)
+    # pin: Cancel 처리 중 spill/삭제 금지 (finally에서 해제)
+    session = session_manager.get(session_id, pin=True)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    logger.info("Cancel: session=%s", session_id)
+    try:
+        logger.info("Cancel: session=%s", session_id)
 
-    # ── 이전 SSE 즉시 종료 ──
-    # old queue에 _sse_close를 넣어 블로킹된 get()을 깨우고,
-    # generation을 증가시켜 event_generator 루프를 종료시킴
-    with session.lock:
-        old_queue = session.event_queue
-        old_loop = session._loop
-        session._sse_generation += 1
-        session.event_queue = None
-    if old_queue and old_loop:
-        try:
-            asyncio.run_coroutine_threadsafe(
-                old_queue.put(("_sse_close", {})),
-                old_loop,
-            )
-        except Exception:
-            pass
+        # ── 대기/진행 중인 LLM 작업 중단 ──
+        # 워커 반환을 기다린 뒤 fork해야 취소된 실행의 사용량이 확정됨.
+        cancelled_usage = _stop_running_phase(session)
 
-    from agents.graph import build_graph
+        # ── 이전 SSE 즉시 종료 ──
+        # 연결 세대를 올려 (어느 워커의) event_generator를 종료시키고 미소비 이벤트는 버림
+        session_manager.store.open_stream(session.id, drop_pending=True)
 
-    # 그래프 재생성
-    session.graph, session.checkpointer = build_graph()
-    session.thread_id = str(uuid.uuid4())
-    session.config = {"configurable": {"thread_id": session.thread_id}}
+        if session.ko_checkpoint_id:
+            try:
+                # ko_approval 인터럽트 체크포인트를 새 thread로 fork — 노드 재실행 없음
+                old_thread_id = session.thread_id
+                new_thread_id = str(uuid.uuid4())
+                session.checkpointer.fork_checkpoint(
+                    old_thread_id, session.ko_checkpoint_id, new_thread_id
+                )
+                session.thread_id = new_thread_id
+                session.config = {"configurable": {"thread_id": new_thread_id}}
+                # 재번역 후 커밋은 새 번역 기준 — 이전 부분 커밋 행은 동시성 검증 대상으로 되돌림
+                session.committed_rows = []
+                session.save_manifest()
+                session.checkpointer.delete_thread(old_thread_id)
+
+                # 세션 복구용 상태 갱신
+                state_snapshot = session.graph.get_state(session.config)
+                with session.lock:
+                    session.graph_result = state_snapshot.values
+                    session.logs = session.graph_result.get("logs", [])
+                    session.current_step = "ko_review"
+                return {"status": "ko_review", "cancelled_usage": cancelled_usage}
+            except Exception as e:
+                with session.lock:
+                    session.current_step = "idle"
+                raise HTTPException(status_code=500, detail=str(e))
 
-    if session.initial_state:
-        try:
-            # 캐시된 ko_review 결과 주입 → ko_review_node가 LLM 호출 건너뜀
-            cancel_state = {**session.initial_state}
-            if session.cached_ko_review_results:
-                cancel_state["ko_review_results"] = session.cached_ko_review_results
-                cancel_state["total_input_tokens"] = session.cached_ko_tokens[0]
-                cancel_state["total_output_tokens"] = session.cached_ko_tokens[1]
-                cancel_state["total_reasoning_tokens"] = session.cached_ko_tokens[2] if len(session.cached_ko_tokens) > 2 else 0
-                cancel_state["total_cached_tokens"] = session.cached_ko_tokens[3] if len(session.cached_ko_tokens) > 3 else 0
-                # logs는 비워둠 — data_backup/context_glossary가 새로 쌓고,
-                # ko_review_node는 캐시 히트 로그 1줄만 추가
-
-            for ev in session.graph.stream(
-                cancel_state, config=session.config, stream_mode="updates"
-            ):
-                if "__interrupt__" in ev:
-                    break
+        with session.lock:
+            session.current_step = "idle"
+        return {"status": "idle"}
+    finally:
+        session.busy = False
+        session_manager.rebalance()
+
+
+# ── Resume (크래시/재시작 후 재개) ─────────────────────────────────
+
+# 초기 phase 노드 — 여기서 멈췄으면 initial phase를, 그 외는 translation phase를 재개
+_INITIAL_NODES = ("data_backup", "context_glossary", "ko_review")
+
+
+def _restore_session_state(session) -> tuple:
+    """
+    체크포인트로 세션 상태 판정 + 메모리 상태(결과/리포트/백업/워크시트) 재구성.
+    반환: (step, next_nodes)
+    """
+    snapshot = session.graph.get_state(session.config)
+    values = snapshot.values or {}
+    next_nodes = snapshot.next
+
+    if not values:
+        step = "loading"
+    elif not next_nodes:
+        step = "done"
+    elif next_nodes[0] == "ko_approval":
+        step = "ko_review"
+    elif next_nodes[0] == "final_approval":
+        step = "final_review"
+    elif next_nodes[0] in _INITIAL_NODES:
+        step = "loading"
+    else:
+        step = "translating"
 
-            # 세션 복구용 상태 갱신
-            state_snapshot = session.graph.get_state(session.config)
-            with session.lock:
-                session.graph_result = state_snapshot.values
-                session.logs = session.graph_result.get("logs", [])
-                session.current_step = "ko_review"
-            return {"status": "ko_review"}
+    with session.lock:
+        session.graph_result = values or None
+        session.logs = list(values.get("logs", []))
+
+    if step != "done":
+        _ensure_worksheet(session)
+    return step, next_nodes
+
+
+def _ensure_worksheet(session):
+    """워크시트 핸들 재연결 — 다른 워커/재시작 후 저장소에서 재구성된 세션용"""
+    if session.worksheet is None and session.sheet_url:
+        sheet_name = (session.initial_state or {}).get("sheet_name", "")
+        session.spreadsheet = connect_to_sheet(session.sheet_url)
+        session.worksheet = get_worksheet(session.spreadsheet, sheet_name)
+
+
+@router.post("/resume/{session_id}")
+async def api_resume(session_id: str):
+    """
+    중단된 세션 재개 — 프로세스 재시작/인스턴스 교체 후에도 manifest로 세션을 재구성하고
+    마지막 체크포인트부터 이어서 실행. 진행 중이던 노드의 완료 청크는 저널에서 재사용되어
+    누락된 청크만 LLM을 다시 호출함. HITL 대기 단계면 상태만 복원.
+    """
+    # pin: 재구성 중 spill/삭제 금지 (finally에서 해제)
+    session = await run_in_threadpool(session_manager.get, session_id, True)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    try:
+        # 이미 (이 워커 또는 다른 워커에서) 실행 중이면 재시작하지 않음
+        if not session.run_done.is_set() or session_manager.store.lease_owner(session.id):
+            return {"status": session.current_step, "resumed": False}
+
+        try:
+            step, next_nodes = await run_in_threadpool(_restore_session_state, session)
         except Exception as e:
-            with session.lock:
-                session.current_step = "idle"
-            raise HTTPException(status_code=500, detail=str(e))
+            logger.error("Resume failed for session %s: %s", session_id, e, exc_info=True)
+            raise HTTPException(status_code=400, detail=str(e))
 
-    with session.lock:
-        session.current_step = "idle"
-    return {"status": "idle"}
+        journaled = session.checkpointer.count_chunks(session.thread_id)
+        logger.info("Resume: session=%s, step=%s, next=%s, journaled_chunks=%d",
+                    session_id, step, next_nodes, journaled)
+
+        with session.lock:
+            session.current_step = step
+            if step == "translating":
+                # 워커 시작 전 중복 /resume 방지
+                session.run_done.clear()
+
+        # loading은 SSE 연결 시 api_stream이 initial phase를 (체크포인트부터) 시작
+        if step == "translating":
+            _submit_phase(session, _run_translation_phase, None)
+        elif step == "ko_review" and session.speculative:
+            # 사전 번역 재개 — 이미 기록된 행은 건너뜀
+            _submit_phase(session, _run_speculative_phase, priority=Priority.BULK)
+
+        return {"status": step, "resumed": True, "journaled_chunks": journaled}
+    finally:
+        session.busy = False
+        session_manager.rebalance()
 
 
 # ── State Query ──────────────────────────────────────────────────────
 
+def _state_etag(session) -> str:
+    return f'"{session.version}"'
+
+
+def _parse_state_cursor(cursor: str, version: int) -> int:
+    """페이지 커서 "<version>.<offset>" → offset (다른 버전의 커서면 409 — 처음부터 다시 조회)"""
+    try:
+        cursor_version, offset = (int(part) for part in cursor.split(".", 1))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_version != version or offset < 0:
+        raise HTTPException(status_code=409, detail="Session state changed — restart pagination")
+    return offset
+
+
 @router.get("/state/{session_id}", response_model=SessionStateResponse)
-def api_state(session_id: str):
-    """세션 상태 조회"""
+def api_state(
+    session_id: str,
+    request: Request,
+    response: Response,
+    since: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=STATE_PAGE_MAX_ROWS),
+):
+    """
+    세션 상태 조회.
+
+    - ETag = 상태 버전 (세션 저장소 manifest 버전 — 단계/결과 변경 시 증가).
+      If-None-Match가 같으면 본문 없이 304
+    - since=<version>: 그 버전 이후 변경된 행만 (delta=True). 이 워커가 응답한 적 없는
+      버전이면 전체 응답 (delta=False)
+    - limit/cursor: 로그·목록을 같은 offset 단위로 페이지 분할 (next_cursor로 이어서 조회)
+    """
     session = session_manager.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    etag = _state_etag(session)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    version = session.version
+    offset = _parse_state_cursor(cursor, version) if cursor else 0
+
     ko_count = 0
     review_count = 0
     fail_count = 0
     cost_summary = None
     total_rows = 0
-    ko_review_results = None
-    review_results_data = None
-    failed_rows_data = None
-    original_rows_data = None
+    lists: dict[str, Optional[list]] = {
+        "logs": session.logs,
+        "ko_review_results": None,
+        "review_results": None,
+        "failed_rows": None,
+        "original_rows": None,
+    }
 
     if session.graph_result:
         ko_count = len(session.graph_result.get("ko_review_results", []))
         review_count = len(session.graph_result.get("review_results", []))
         fail_count = len(session.graph_result.get("failed_rows", []))
-        total_rows = len(session.graph_result.get("original_data", []))
-        input_t = session.graph_result.get("total_input_tokens", 0)
-        output_t = session.graph_result.get("total_output_tokens", 0)
-        reasoning_t = session.graph_result.get("total_reasoning_tokens", 0)
-        cached_t = session.graph_result.get("total_cached_tokens", 0)
+        table = get_row_table(session.row_table_id)
+        total_rows = len(table)
+        # 취소된 실행에서 이미 소비한 토큰도 비용에 포함 (state에는 남지 않음)
+        cancelled = session.cancelled_usage
+        input_t = session.graph_result.get("total_input_tokens", 0) + cancelled.get("input_tokens", 0)
+        output_t = session.graph_result.get("total_output_tokens", 0) + cancelled.get("output_tokens", 0)
+        reasoning_t = session.graph_result.get("total_reasoning_tokens", 0) + cancelled.get("reasoning_tokens", 0)
+        cached_t = session.graph_result.get("total_cached_tokens", 0) + cancelled.get("cached_tokens", 0)
         non_cached_input = max(input_t - cached_t, 0)
         cost = (non_cached_input * LLM_PRICING["input"]) + (cached_t * LLM_PRICING["cached_input"]) + ((output_t + reasoning_t) * LLM_PRICING["output"])
         cost_summary = {
@@ -628,35 +1179,38 @@ def api_state(session_id: str):
             "cached_tokens": cached_t,
             "estimated_cost_usd": round(cost, 4),
         }
+        if cancelled:
+            cost_summary["cancelled"] = dict(cancelled)
 
         # 세션 복원용: 테이블 표시를 위한 original_rows (loading/translating 포함)
-        orig = session.graph_result.get("original_data", [])
-        if orig:
-            original_rows_data = [
-                {"key": r.get(REQUIRED_COLUMNS["key"], ""),
-                 "korean": r.get(REQUIRED_COLUMNS["korean"], "")}
-                for r in orig
-            ]
-
-        # 세션 복원용: HITL 대기 단계일 때 실제 데이터 포함
+        # + HITL 대기 단계일 때 실제 데이터 — SSE/다운로드와 같은 단계 view를 그대로 사용
+        if total_rows:
+            lists["original_rows"] = _step_view(session, "original")["rows"]
         if session.current_step == "ko_review":
-            ko_results_raw = session.graph_result.get("ko_review_results", [])
-            ko_result_map = {r["key"]: r for r in ko_results_raw}
-            original_data = session.graph_result.get("original_data", [])
-            ko_review_results = []
-            for row in original_data:
-                key = row.get(REQUIRED_COLUMNS["key"], "")
-                ko_text = row.get(REQUIRED_COLUMNS["korean"], "")
-                if key in ko_result_map:
-                    ko_review_results.append(ko_result_map[key])
-                else:
-                    ko_review_results.append({
-                        "key": key, "original": ko_text,
-                        "revised": ko_text, "comment": "", "has_issue": False,
-                    })
+            lists["ko_review_results"] = _step_view(session, "ko_review")["rows"]
         elif session.current_step == "final_review":
-            review_results_data = session.graph_result.get("review_results", [])
-            failed_rows_data = session.graph_result.get("failed_rows", [])
+            view = _step_view(session, "final_review")
+            lists["review_results"] = view["rows"]
+            lists["failed_rows"] = view["failed"]
+
+    # 버전별 1회 행 digest 비교 → since 이후 변경 행만 추림
+    session.state_delta.observe(version, lists)
+    delta = session.state_delta.changes(since, lists) if since is not None else None
+    changed = removed = None
+    if delta is not None:
+        lists, changed, removed = delta
+
+    next_cursor = None
+    if limit is not None:
+        end = offset + limit
+        if any(rows is not None and len(rows) > end for rows in lists.values()):
+            next_cursor = f"{version}.{end}"
+        lists = {
+            name: rows[offset:end] if rows is not None else None
+            for name, rows in lists.items()
+        }
+        if changed is not None:
+            changed = {name: ids[offset:end] for name, ids in changed.items()}
 
     return SessionStateResponse(
         session_id=session.id,
@@ -665,60 +1219,109 @@ def api_state(session_id: str):
         review_count=review_count,
         fail_count=fail_count,
         cost_summary=cost_summary,
-        logs=session.logs,
-        ko_review_results=ko_review_results,
-        review_results=review_results_data,
-        failed_rows=failed_rows_data,
-        original_rows=original_rows_data,
+        logs=lists["logs"],
+        ko_review_results=lists["ko_review_results"],
+        review_results=lists["review_results"],
+        failed_rows=lists["failed_rows"],
+        original_rows=lists["original_rows"],
         total_rows=total_rows,
+        version=version,
+        next_cursor=next_cursor,
+        delta=delta is not None,
+        changed=changed,
+        removed=removed,
     )
 
 
 # ── Downloads ────────────────────────────────────────────────────────
 
+def _export_source(session, file_type: str) -> Optional[tuple[str, tuple, object]]:
+    """다운로드 원본 → (기본 파일명, 컬럼, 행 iterator). 데이터가 없으면 None"""
+    values = session.graph_result or {}
+    if file_type == "backup":
+        if not session.row_table_id:
+            return None
+        table = get_row_table(session.row_table_id)
+        sheet_name = (session.initial_state or {}).get("sheet_name", "")
+        name = getattr(session, "backup_filename", None) or backup_filename(sheet_name)
+        rows = (values[1:] for values in table.iter_rows(*table.columns))
+        return name, table.columns, rows
+    if file_type == "ko_report":
+        if not values.get("ko_review_results"):
+            return None
+        df = _step_view(session, "ko_review")["report"]
+        return "ko_review_report.csv", KO_REPORT_COLUMNS, df.itertuples(index=False, name=None)
+    if file_type == "translation_report":
+        if not values.get("review_results"):
+            return None
+        df = _step_view(session, "final_review")["report"]
+        return "translation_diff_report.csv", TRANSLATION_REPORT_COLUMNS, df.itertuples(index=False, name=None)
+    if file_type == "failed":
+        failed = values.get("failed_rows", [])
+        if not failed:
+            return None
+        columns = tuple(dict.fromkeys(col for r in failed for col in r))
+        rows = (tuple(r.get(col, "") for col in columns) for r in failed)
+        return "review_failed_rows.csv", columns, rows
+    raise HTTPException(status_code=400, detail=f"Unknown file type: {file_type}")
+
+
 @router.get("/download/{session_id}/{file_type}")
-def api_download(session_id: str, file_type: str):
-    """CSV 다운로드"""
+def api_download(session_id: str, file_type: str, format: str = "csv"):
+    """
+    리포트/백업/로그 다운로드 — 결과 state와 RowTable에서 요청 시점에 청크 단위로 생성.
+    format=xlsx는 openpyxl이 설치된 경우에만 (logs는 항상 텍스트).
+    """
     session = session_manager.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
+    if format == "xlsx" and not XLSX_AVAILABLE:
+        raise HTTPException(status_code=400, detail="XLSX export requires openpyxl on the server")
+
+    if file_type == "logs":
+        if not session.logs:
+            raise HTTPException(status_code=404, detail="No data available")
+        return StreamingResponse(
+            iter_lines(list(session.logs)),
+            media_type="text/plain",
+            headers={"Content-Disposition": 'attachment; filename="execution_log.txt"'},
+        )
 
-    if file_type == "backup":
-        data = getattr(session, "backup_csv", None)
-        name = getattr(session, "backup_filename", "backup.csv")
-    elif file_type == "ko_report":
-        data = getattr(session, "ko_report_csv", None)
-        name = "ko_review_report.csv"
-    elif file_type == "translation_report":
-        data = getattr(session, "translation_report_csv", None)
-        name = "translation_diff_report.csv"
-    elif file_type == "failed":
-        if session.graph_result:
-            failed = session.graph_result.get("failed_rows", [])
-            if failed:
-                data = pd.DataFrame(failed).to_csv(index=False).encode("utf-8")
-            else:
-                data = None
-        else:
-            data = None
-        name = "review_failed_rows.csv"
-    elif file_type == "logs":
-        data = "\n".join(session.logs).encode("utf-8") if session.logs else None
-        name = "execution_log.txt"
-    else:
-        raise HTTPException(status_code=400, detail=f"Unknown file type: {file_type}")
-
-    if not data:
+    source = _export_source(session, file_type)
+    if source is None:
         raise HTTPException(status_code=404, detail="No data available")
-
-    media_type = "text/plain" if file_type == "logs" else "text/csv"
+    name, columns, rows = source
+    extension, media_type = EXPORT_FORMATS[format]
+    name = Path(name).stem + extension
     return StreamingResponse(
-        io.BytesIO(data),
+        iter_export(format, columns, rows, title=file_type),
         media_type=media_type,
         headers={"Content-Disposition": f'attachment; filename="{name}"'},
     )
 
 
+# ── Sheets API Metrics ───────────────────────────────────────────────
+
+@router.get("/metrics/sheets")
+def api_sheets_metrics():
+    """Sheets API 스케줄러 메트릭 (호출/재시도 수, 쿼터 대기 시간)"""
+    return sheets_scheduler.metrics()
+
+
+@router.get("/metrics/jobs")
+def api_job_metrics():
+    """작업 스케줄러 현황 (대기열, 실행 중 phase, LLM 슬롯 사용/대기)"""
+    return job_scheduler.metrics()
+
+
+@router.get("/metrics/sessions")
+def api_session_metrics():
+    """세션 풀 메모리 현황 (예산, 세션별 추정 메모리, spill 여부)"""
+    return session_manager.stats()
+
+
 # ── Config (saved URL) ──────────────────────────────────────────────
 
 @router.get("/guide")
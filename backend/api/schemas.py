@@ -1,6 +1,6 @@
 """Pydantic 요청/응답 스키마"""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel
 
 
@@ -17,7 +17,7 @@ class ConnectResponse(BaseModel):
 class StartRequest(BaseModel):
     sheet_url: str
     sheet_name: str
-    mode: str = "A"
+    mode: Literal["A", "B", "C"] = "A"  # 전체 / 빈칸만 / 증분 (변경 행만)
     target_languages: list = ["en", "ja"]
     row_start: int = 0
     row_end: int = 0
@@ -25,6 +25,7 @@ class StartRequest(BaseModel):
 
 class StartResponse(BaseModel):
     session_id: str
+    queue_depth: int = 0  # 수락 시점 스케줄러 대기 작업 수
 
 
 class ApprovalRequest(BaseModel):
@@ -45,3 +46,11 @@ class SessionStateResponse(BaseModel):
     failed_rows: Optional[list] = None
     original_rows: Optional[list] = None  # [{key, korean}, ...] — 테이블 복원용
     total_rows: int = 0
+    # 상태 버전 (ETag와 동일) — since 기준값
+    version: int = 0
+    # 다음 페이지 커서 (limit 지정 시, 마지막 페이지면 None) — 로그/목록 전부 같은 offset으로 분할
+    next_cursor: Optional[str] = None
+    # since 응답: 목록에는 변경 행만 — changed[목록] = 행 id (목록과 같은 순서), removed[목록] = 삭제 행 id
+    delta: bool = False
+    changed: Optional[dict] = None
+    removed: Optional[dict] = None
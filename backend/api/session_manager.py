@@ -1,74 +1,476 @@
-"""서버 사이드 세션 관리 — Graph 인스턴스 + 상태"""
+"""서버 사이드 세션 관리 — Graph 인스턴스 + 상태 (워커별 캐시, 공유 상태는 세션 저장소)"""
 
 import logging
+import sys
+import time
 import uuid
-import asyncio
 import threading
 from typing import Optional
 from collections import OrderedDict
 
-from agents.graph import build_graph
+from agents.graph import get_graph
+from agents.llm import CancellationToken
+from backend.api.event_batcher import EventBatcher
+from backend.api.session_store import WORKER_ID, SessionStore, get_session_store
+from backend.api.state_delta import StateDeltaTracker
+from config.constants import (
+    MAX_SESSIONS,
+    SESSION_LEASE_TTL,
+    SESSION_MEMORY_BUDGET_MB,
+    SESSION_TTL_SECONDS,
+)
+from utils.job_scheduler import job_scheduler
+from utils.row_table import peek_row_table, release_row_table
 
 logger = logging.getLogger("devlocal.session")
 
+# 실행 중 단계 — 메모리 예산과 무관하게 spill/삭제 대상에서 제외
+RUNNING_STEPS = ("loading", "translating")
+
+# 세션 저장소에 공유하는 manifest 필드 — 나머지 상태는 체크포인트/RowTable/시트에서 복원
+_MANIFEST_FIELDS = (
+    "id",
+    "thread_id",
+    "row_table_id",
+    "ko_checkpoint_id",
+    "initial_state",
+    "sheet_url",
+    "cancelled_usage",
+    "backup_filename",
+    "speculative",
+    "committed_rows",
+)
+
+_SAMPLE_SIZE = 64
+
+
+def _approx_bytes(obj, seen: set) -> int:
+    """대략적인 객체 메모리 크기 — 긴 list는 표본 평균으로 외삽, 공유 객체는 1회만 계산"""
+    if obj is None or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, (str, bytes, int, float, bool)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _approx_bytes(k, seen) + _approx_bytes(v, seen) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        n = len(obj)
+        if n <= _SAMPLE_SIZE:
+            return sys.getsizeof(obj) + sum(_approx_bytes(v, seen) for v in obj)
+        step = n / _SAMPLE_SIZE
+        sample = sum(_approx_bytes(obj[int(i * step)], seen) for i in range(_SAMPLE_SIZE))
+        return sys.getsizeof(obj) + int(sample * n / _SAMPLE_SIZE)
+    if hasattr(obj, "memory_usage"):  # pandas DataFrame
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    return sys.getsizeof(obj)
+
 
 class Session:
     """단일 번역 세션"""
 
     def __init__(self):
         self.id = str(uuid.uuid4())
-        self.graph, self.checkpointer = build_graph()
+        # 컴파일 그래프 + 체크포인터는 프로세스 공용 (thread_id로 세션 구분)
+        self.graph, self.checkpointer = get_graph()
         self.thread_id = str(uuid.uuid4())
         self.config = {"configurable": {"thread_id": self.thread_id}}
-        self.current_step = "idle"
+        # 저장소에 기록된 뒤부터 단계 변경을 write-through (version = 저장소 기준 버전)
+        self._stored = False
+        self.version = 0
+        self._current_step = "idle"
+        self.sheet_url: str = ""
         self.spreadsheet = None
         self.worksheet = None
-        self.df = None
-        self.graph_result = None
+        # 로드 시점 시트 데이터 (utils.row_table 레지스트리 id — 불변 스냅샷)
+        self.row_table_id: Optional[str] = None
+        self._graph_result = None
+        # 단계 완료 시 한 번 만드는 표시/리포트 view (routes._step_view) — graph_result 교체 시 무효화
+        self.views: dict = {}
         self.logs: list = []
         self.initial_state: Optional[dict] = None
         self.ko_resume_value: str = "approved"
-        # Cancel 복구용 ko_review 캐시 (초기 phase 완료 후 저장)
-        self.cached_ko_review_results: list = []
-        self.cached_ko_tokens: tuple = (0, 0)
-        # SSE event queue (lazy init — async 컨텍스트에서 생성)
-        self.event_queue: Optional[asyncio.Queue] = None
+        # HITL 1 대기 중 사전 번역 (opt-in — .app_config.json speculative_translation)
+        self.speculative: bool = False
+        # ko_approval 인터럽트 체크포인트 id (Cancel 시 fork 기준점, prune에서 고정)
+        self.ko_checkpoint_id: Optional[str] = None
+        # 실패한 최종 커밋이 이미 시트에 반영한 행 (로드 시점 row_index — 재시도 시 제외)
+        self.committed_rows: list[int] = []
+        # 현재 백그라운드 실행의 취소 토큰 + 종료 신호 (set = 실행 중 아님)
+        self.cancel_token: Optional[CancellationToken] = None
+        self.run_done = threading.Event()
+        self.run_done.set()
+        # 취소된 실행에서 이미 소비한 LLM 사용량 누적 (비용 보고용)
+        self.cancelled_usage: dict = {}
         # Lock for thread-safe operations
         self.lock = threading.Lock()
-        # Event loop reference (set when SSE stream starts)
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-        # SSE generation counter — 이전 SSE 연결 무효화용
-        self._sse_generation: int = 0
+        # 노드 이벤트 → 세션 저장소 (청크 이벤트는 flush 창 단위로 합쳐 전송)
+        self.event_batcher = EventBatcher(self._publish_event)
+        # /state?since= 응답용 행 변경 버전 (워커별 — 관측하지 않은 버전 기준이면 전체 응답)
+        self.state_delta = StateDeltaTracker()
+        # 요청 처리 중 (최종 커밋/Cancel 재실행) — spill/삭제 금지
+        self.busy: bool = False
+        # 디스크로 내린 상태 (get() 시 자동 복원)
+        self.spilled: bool = False
+
+    def _publish_event(self, event_type: str, data: dict):
+        get_session_store().publish(self.id, event_type, data)
+
+    @property
+    def current_step(self) -> str:
+        return self._current_step
+
+    @current_step.setter
+    def current_step(self, step: str):
+        # 다른 워커가 같은 세션 요청을 받아도 현재 단계를 알 수 있도록 저장소에 반영
+        self._current_step = step
+        if self._stored:
+            self.save_manifest()
+
+    @property
+    def graph_result(self) -> Optional[dict]:
+        return self._graph_result
+
+    @graph_result.setter
+    def graph_result(self, result: Optional[dict]):
+        self._graph_result = result
+        self.views = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self.busy or self.current_step in RUNNING_STEPS
+
+    def memory_bytes(self) -> int:
+        """세션이 점유한 대략적인 메모리 (행 테이블 + state 결과 + 단계 view)"""
+        if self.spilled:
+            return 0
+        seen: set = set()
+        total = _approx_bytes(self.graph_result, seen)
+        total += _approx_bytes(self.logs, seen)
+        total += _approx_bytes(self.views, seen)
+        table = peek_row_table(self.row_table_id) if self.row_table_id else None
+        if table is not None:
+            total += table.nbytes
+        return total
+
+    # ── Manifest (세션 저장소 — 워커 간 공유, 재시작 후 재개) ──
+
+    def save_manifest(self):
+        """
+        세션 재구성에 필요한 최소 정보(thread/RowTable id, 시작 파라미터) + 현재 단계를
+        세션 저장소에 기록. 생성, 단계 변경, ko_approval 체크포인트 고정, Cancel(thread 교체) 시점에 갱신.
+        """
+        payload = {f: getattr(self, f, None) for f in _MANIFEST_FIELDS}
+        self.version = get_session_store().save(self.id, payload, self._current_step)
+        self._stored = True
+
+    def apply_manifest(self, manifest: dict, step: str, version: int):
+        """저장소의 manifest/단계를 세션에 반영 (write-through 없이)"""
+        for field in _MANIFEST_FIELDS:
+            if manifest.get(field) is not None:
+                setattr(self, field, manifest[field])
+        self.config = {"configurable": {"thread_id": self.thread_id}}
+        self._current_step = step
+        self.version = version
+        self._stored = True
+
+    @classmethod
+    def from_store(cls, session_id: str) -> Optional["Session"]:
+        """
+        세션 저장소에서 세션 재구성 (없으면 None). spilled 상태로 반환 —
+        state는 get()에서 체크포인트로부터 복원.
+        """
+        loaded = get_session_store().load(session_id)
+        if loaded is None:
+            return None
+        session = cls()
+        session.apply_manifest(*loaded)
+        session.spilled = True
+        return session
+
+    # ── Spill / Rehydrate ──
+
+    def spill(self):
+        """
+        HITL 대기 중인 세션을 메모리에서 내림.
+        graph_result/logs는 체크포인트(SQLite)에, RowTable은 레지스트리 디스크 보관본에 있으므로
+        버리기만 함 (백업/리포트는 다운로드 시 state와 RowTable에서 생성 — 세션에 보관하지 않음).
+        """
+        self.graph_result = None
+        self.logs = []
+        self.state_delta = StateDeltaTracker()
+        if self.row_table_id:
+            release_row_table(self.row_table_id, delete=False)
+        self.spilled = True
+
+    def rehydrate(self):
+        """spill된 세션 복원 — 체크포인트에서 state를 다시 읽음"""
+        values = self.graph.get_state(self.config).values
+        self.graph_result = values or None
+        self.logs = list(values.get("logs", [])) if values else []
+        self.spilled = False
+
+    def refresh(self, manifest: dict, step: str, version: int):
+        """다른 워커가 갱신한 세션을 다시 읽음 — manifest/단계 반영 후 체크포인트에서 state 복원"""
+        self.apply_manifest(manifest, step, version)
+        self.rehydrate()
+
+    def discard(self):
+        """세션 영구 삭제 — 대기/진행 중 실행 취소 + 체크포인트 thread, RowTable, 저장소 기록 정리"""
+        job_scheduler.cancel(self.id)
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+        self.checkpointer.delete_thread(self.thread_id)
+        release_row_table(self.row_table_id)
+        get_session_store().delete(self.id)
 
 
 class SessionManager:
-    """세션 풀 관리 (최대 10개, LRU 방식)"""
+    """
+    세션 풀 관리 — 측정 메모리 예산 기반, 워커별 캐시.
 
-    MAX_SESSIONS = 10
+    - 세션의 공유 상태(manifest/단계)는 세션 저장소에 있고, 캐시에 없거나 다른 워커가
+      갱신한(version 불일치) 세션은 get() 시 저장소 + 체크포인트에서 재구성
+    - phase 실행은 저장소 lease를 잡은 워커 1곳에서만 (heartbeat로 갱신, 다른 워커의
+      Cancel 요청도 heartbeat에서 전달)
+    - 예산 초과 시 실행 중이 아닌 LRU 세션부터 디스크로 spill (HITL 대기/완료/대기 상태)
+    - spill된 세션은 get() 시 투명하게 복원
+    - 세션 객체 수가 MAX_SESSIONS를 넘으면 실행 중이 아닌 LRU 세션을 캐시에서만 제거
+      (spill 후 객체 해제 — 저장소 기록은 유지)
+    - 영구 삭제는 delete() 또는 저장소 TTL 만료 (마지막 단계 변경 후 SESSION_TTL_SECONDS,
+      실행 lease 없는 세션 — create() 시 EXPIRE_CHECK_SECONDS 주기로 정리)
+    - 실행 중(loading/translating/요청 처리 중) 세션은 절대 spill/삭제하지 않음
+    """
+
+    MAX_SESSIONS = MAX_SESSIONS
+    MEMORY_BUDGET_BYTES = SESSION_MEMORY_BUDGET_MB * 1024 * 1024
+    # heartbeat 주기 (초) — 취소 요청 확인, lease는 TTL/3마다 갱신
+    HEARTBEAT_SECONDS = 1.0
+    SESSION_TTL_SECONDS = SESSION_TTL_SECONDS
+    # TTL 만료 세션 정리 주기 (초)
+    EXPIRE_CHECK_SECONDS = 600.0
 
     def __init__(self):
         self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._lock = threading.RLock()
+        # 이 워커가 lease를 잡고 실행 중인 세션
+        self._leased: dict[str, Session] = {}
+        self._heartbeat: Optional[threading.Thread] = None
+        self._last_expire: Optional[float] = None
+
+    @property
+    def store(self) -> SessionStore:
+        return get_session_store()
 
     def create(self) -> Session:
+        self.expire_stale()
         session = Session()
-        if len(self._sessions) >= self.MAX_SESSIONS:
-            evicted_id, _ = self._sessions.popitem(last=False)
-            logger.info("Session evicted (LRU): %s", evicted_id)
-        self._sessions[session.id] = session
-        logger.info("Session created: %s (total: %d)", session.id, len(self._sessions))
+        session.save_manifest()
+        with self._lock:
+            self._evict_excess()
+            self._sessions[session.id] = session
+            logger.info("Session created: %s (total: %d)", session.id, len(self._sessions))
+        self.rebalance()
         return session
 
-    def get(self, session_id: str) -> Optional[Session]:
-        session = self._sessions.get(session_id)
-        if session:
+    def get(self, session_id: str, pin: bool = False) -> Optional[Session]:
+        """
+        세션 조회 — 캐시에 없으면 저장소에서 재구성, 다른 워커가 갱신했으면 다시 읽음,
+        spill 상태면 복원. pin=True면 같은 lock 안에서 busy 표시 — 호출자가 처리 후
+        busy=False로 해제할 때까지 spill/삭제 대상에서 제외.
+        """
+        version = self.store.version(session_id)
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if version is None:
+                # 다른 워커에서 삭제됨 — 이 워커에서 실행 중이 아니면 캐시에서도 제거
+                if session is not None and session.run_done.is_set() and not session.busy:
+                    del self._sessions[session_id]
+                    release_row_table(session.row_table_id, delete=False)
+                    session = None
+                if session is None:
+                    return None
+            elif session is None:
+                session = Session.from_store(session_id)
+                if session is None:
+                    return None
+                self._evict_excess()
+                self._sessions[session_id] = session
+                logger.info("Session loaded from store: %s", session_id)
+            elif (
+                session.version != version
+                and session.run_done.is_set()
+                and not session.busy
+                and (loaded := self.store.load(session_id)) is not None
+            ):
+                session.refresh(*loaded)
+                logger.info("Session refreshed from store: %s (step=%s)",
+                            session_id, session.current_step)
             self._sessions.move_to_end(session_id)
+            if pin:
+                session.busy = True
+            rehydrated = session.spilled
+            if rehydrated:
+                session.rehydrate()
+                logger.info("Session rehydrated: %s", session_id)
+        if rehydrated:
+            self.rebalance(keep=session)
         return session
 
+    # ── 실행 lease (워커 간 중복 실행 방지 + Cancel 전달) ──
+
+    def claim(self, session: Session) -> bool:
+        """phase 실행 권한 획득 — 다른 워커가 실행 중이면 False"""
+        if not self.store.acquire_lease(session.id, WORKER_ID, SESSION_LEASE_TTL):
+            return False
+        with self._lock:
+            self._leased[session.id] = session
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(
+                    target=self._heartbeat_loop, name="session-heartbeat", daemon=True
+                )
+                self._heartbeat.start()
+        return True
+
+    def release(self, session: Session):
+        with self._lock:
+            self._leased.pop(session.id, None)
+        self.store.release_lease(session.id, WORKER_ID)
+
+    def _heartbeat_loop(self):
+        """lease 갱신 + 다른 워커가 보낸 Cancel 요청을 실행 중인 토큰에 전달"""
+        last_renew = 0.0
+        while True:
+            time.sleep(self.HEARTBEAT_SECONDS)
+            with self._lock:
+                leased = dict(self._leased)
+            if not leased:
+                continue
+            try:
+                now = time.monotonic()
+                if now - last_renew >= SESSION_LEASE_TTL / 3:
+                    self.store.renew_leases(list(leased), WORKER_ID, SESSION_LEASE_TTL)
+                    last_renew = now
+                for session_id in self.store.pop_cancel_requests(list(leased)):
+                    token = leased[session_id].cancel_token
+                    if token is not None:
+                        logger.info("Cancel requested by another worker: %s", session_id)
+                        token.cancel()
+            except Exception as e:
+                logger.warning("Session heartbeat failed: %s", e)
+
+    def wait_released(self, session_id: str, timeout: float) -> bool:
+        """다른 워커의 실행 lease가 풀릴 때까지 대기. 반환: 풀렸으면 True"""
+        deadline = time.monotonic() + timeout
+        while self.store.lease_owner(session_id) is not None:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+
     def delete(self, session_id: str):
-        removed = self._sessions.pop(session_id, None)
+        with self._lock:
+            removed = self._sessions.pop(session_id, None)
         if removed:
+            removed.discard()
             logger.info("Session deleted: %s", session_id)
 
+    def expire_stale(self):
+        """저장소 TTL이 지난 세션 영구 삭제 (EXPIRE_CHECK_SECONDS 주기, 모든 워커 공통 기준)"""
+        now = time.monotonic()
+        with self._lock:
+            if self._last_expire is not None and now - self._last_expire < self.EXPIRE_CHECK_SECONDS:
+                return
+            self._last_expire = now
+        for session_id in self.store.expired(self.SESSION_TTL_SECONDS):
+            with self._lock:
+                session = self._sessions.get(session_id)
+                if session is not None and (session.is_running or not session.run_done.is_set()):
+                    continue
+                self._sessions.pop(session_id, None)
+            if session is None:
+                session = Session.from_store(session_id)
+                if session is None:
+                    continue
+            try:
+                session.discard()
+            except Exception as e:
+                logger.warning("Session expiry failed: %s (%s)", session_id, e)
+                continue
+            logger.info("Session expired (TTL): %s", session_id)
+
+    def rebalance(self, keep: Optional[Session] = None):
+        """메모리 예산 초과 시 실행 중이 아닌 LRU 세션을 spill (keep은 제외)"""
+        with self._lock:
+            usage = {s.id: s.memory_bytes() for s in self._sessions.values()}
+            total = sum(usage.values())
+            if total <= self.MEMORY_BUDGET_BYTES:
+                return
+            for session in list(self._sessions.values()):
+                if total <= self.MEMORY_BUDGET_BYTES:
+                    break
+                if session is keep or session.spilled or session.is_running:
+                    continue
+                if usage[session.id] == 0:
+                    continue
+                try:
+                    session.spill()
+                except Exception as e:
+                    logger.warning("Session spill failed: %s (%s)", session.id, e)
+                    continue
+                total -= usage[session.id]
+                logger.info(
+                    "Session spilled: %s (%.1f MB, step=%s)",
+                    session.id, usage[session.id] / 1024 / 1024, session.current_step,
+                )
+            if total > self.MEMORY_BUDGET_BYTES:
+                logger.warning(
+                    "Session memory over budget: %.1f MB (running sessions are kept)",
+                    total / 1024 / 1024,
+                )
+
+    def _evict_excess(self):
+        """
+        캐시 세션 객체 수 상한 초과 시 실행 중이 아닌 LRU 세션을 이 워커 캐시에서만 내림
+        (lock 보유 상태에서 호출). 저장소 기록/체크포인트/RowTable 파일은 그대로 —
+        다음 get()에서 저장소로부터 재구성되므로 다른 워커/브라우저가 쓰는 세션도 안전.
+        """
+        while len(self._sessions) >= self.MAX_SESSIONS:
+            victim = next(
+                (
+                    s for s in self._sessions.values()
+                    if not s.is_running and s.run_done.is_set()
+                ),
+                None,
+            )
+            if victim is None:
+                logger.warning("All %d sessions are running — not evicting", len(self._sessions))
+                return
+            del self._sessions[victim.id]
+            if not victim.spilled:
+                victim.spill()
+            logger.info("Session dropped from cache (LRU): %s", victim.id)
+
+    def stats(self) -> dict:
+        """세션 풀 메모리 현황"""
+        with self._lock:
+            sessions = [
+                {
+                    "session_id": s.id,
+                    "step": s.current_step,
+                    "spilled": s.spilled,
+                    "running": s.is_running,
+                    "memory_bytes": s.memory_bytes(),
+                }
+                for s in self._sessions.values()
+            ]
+        return {
+            "budget_bytes": self.MEMORY_BUDGET_BYTES,
+            "resident_bytes": sum(s["memory_bytes"] for s in sessions),
+            "sessions": sessions,
+        }
+
 
 # Singleton
 session_manager = SessionManager()
@@ -0,0 +1,524 @@
+"""세션 저장소 — 워커/인스턴스 간 공유 (세션 manifest, 실행 lease, 취소 요청, SSE 이벤트 로그)"""
+
+import gzip
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Optional
+
+from config.constants import SSE_BLOB_MIN_BYTES, SSE_REPLAY_EVENTS
+
+# 프로세스 식별자 — 실행 lease 소유자
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# 세션별 발행 N건마다 해당 세션 링 버퍼 정리
+_TRIM_EVERY = 100
+
+# 아직 어느 연결도 읽지 않은 직전 이벤트와 합치는 이벤트 (상태성 이벤트 — 최신값만 의미 있음)
+COALESCED_EVENTS = frozenset({"queue", "node_update", "commit_progress"})
+
+
+def _coalesce(event: str, pending: dict, data: dict) -> Optional[dict]:
+    """미전달 직전 이벤트 + 새 이벤트 → 합친 data (합칠 수 없으면 None)"""
+    if event in ("queue", "commit_progress"):
+        return data
+    if event == "node_update" and pending.get("step") == data.get("step"):
+        # 최신 노드/단계로 덮어쓰고, 노드가 보낸 새 로그는 순서대로 누적
+        return {**data, "logs": (pending.get("logs") or []) + (data.get("logs") or [])}
+    return None
+
+
+class SessionStore(ABC):
+    """
+    세션 공유 저장소 인터페이스.
+
+    세션 객체 자체는 워커별 캐시이고, 워커 간에 공유해야 하는 것만 저장소에 둔다:
+    - manifest (thread/RowTable id, 시작 파라미터) + 현재 단계 + version
+    - 실행 lease: phase를 실행 중인 워커 (다른 워커는 중복 실행하지 않음)
+    - 취소 요청 플래그: 다른 워커가 실행 중인 phase에 Cancel 전달
+    - SSE 이벤트 로그 + 소비 커서/연결 세대: 어느 워커에서 실행되든 어느 워커의
+      SSE 연결로든 이벤트 전달. 세션별 최근 이벤트를 링 버퍼로 보관해
+      Last-Event-ID 재연결 시 놓친 이벤트만 재전송 (replay floor 이하는 재전송 불가)
+
+    체크포인트/RowTable은 각자의 디스크 저장소(SQLite, gzip JSON)로 이미 공유됨.
+    """
+
+    # ── 세션 manifest ──
+
+    @abstractmethod
+    def save(self, session_id: str, manifest: dict, step: str) -> int:
+        """manifest + 단계 저장. 반환: 새 version"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[tuple[dict, str, int]]:
+        """(manifest, step, version). 없으면 None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def version(self, session_id: str) -> Optional[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def expired(self, ttl: float) -> list[str]:
+        """마지막 저장 후 ttl초가 지났고 유효한 lease가 없는 세션 id"""
+        raise NotImplementedError
+
+    # ── 실행 lease ──
+
+    @abstractmethod
+    def acquire_lease(self, session_id: str, owner: str, ttl: float) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def renew_leases(self, session_ids: list[str], owner: str, ttl: float):
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_lease(self, session_id: str, owner: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def lease_owner(self, session_id: str) -> Optional[str]:
+        """만료되지 않은 lease 소유 워커 (없으면 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def request_cancel(self, session_id: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def pop_cancel_requests(self, session_ids: list[str]) -> list[str]:
+        """취소 요청된 세션 id 반환 + 플래그 해제"""
+        raise NotImplementedError
+
+    # ── SSE 이벤트 ──
+
+    @abstractmethod
+    def publish(self, session_id: str, event: str, data: dict) -> int:
+        """
+        이벤트 발행 → seq. 직렬화 결과가 SSE_BLOB_MIN_BYTES 이상이면 gzip blob으로 저장하고
+        이벤트 data는 참조 {"blob": id, "bytes": 원본 크기}로 대체 (blob은 이벤트와 함께 정리).
+        COALESCED_EVENTS는 세션의 마지막 이벤트가 같은 종류이고 아직 읽히지 않았으면
+        (seq > 소비 커서) 그 이벤트에 합침 — 클라이언트가 오래 떠나 있어도 상태성 이벤트가 쌓이지 않음
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_blob(self, session_id: str, blob_id: str) -> Optional[bytes]:
+        """이벤트 blob (gzip 압축 JSON) — 없으면 (정리됨) None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_events(
+        self, session_id: str, after: int, limit: int = 500, claim: bool = False
+    ) -> list[tuple[int, str, str]]:
+        """
+        after 이후 (seq, event, data_json) 목록.
+        claim이면 같은 트랜잭션에서 소비 커서를 마지막 seq까지 전진 — 읽은 이벤트는 이후 합치기 대상에서 제외
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def sse_state(self, session_id: str) -> tuple[int, int]:
+        """(소비 커서, 연결 세대)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_cursor(self, session_id: str, seq: int):
+        """소비 커서 전진 (MAX)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def replay_floor(self, session_id: str) -> int:
+        """정리/폐기된 이벤트의 최대 seq — Last-Event-ID가 이보다 작으면 놓친 이벤트 일부가 없음"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def latest_seq(self, session_id: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_stream(self, session_id: str, drop_pending: bool = False) -> int:
+        """
+        새 SSE 연결 — 세대 증가로 기존 연결 종료.
+        drop_pending이면 지금까지의 이벤트를 폐기 (소비/재전송 모두 불가 — Cancel 시).
+        """
+        raise NotImplementedError
+
+    # ── 같은 프로세스 내 즉시 알림 (다른 워커는 폴링) ──
+
+    @abstractmethod
+    def subscribe(self, session_id: str, callback: Callable[[], None]) -> Callable[[], None]:
+        raise NotImplementedError
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    manifest TEXT NOT NULL,
+    step TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    lease_owner TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    sse_cursor INTEGER NOT NULL DEFAULT 0,
+    sse_generation INTEGER NOT NULL DEFAULT 0,
+    sse_floor INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_session ON events (session_id, seq);
+CREATE TABLE IF NOT EXISTS blobs (
+    blob_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_session ON blobs (session_id, seq);
+"""
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    SQLite(WAL) 구현 — 같은 파일을 여는 모든 uvicorn 워커가 공유 (단일 호스트/공유 볼륨).
+    같은 프로세스의 SSE 연결은 publish 시 즉시 깨우고, 다른 워커의 연결은 폴링으로 수신.
+    """
+
+    def __init__(self, db_path: str):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(sessions)")}
+        if "sse_floor" not in columns:
+            self.conn.execute(
+                "ALTER TABLE sessions ADD COLUMN sse_floor INTEGER NOT NULL DEFAULT 0"
+            )
+        self.lock = threading.Lock()
+        self._subscribers: dict[str, set] = {}
+        # 세션별 (이 프로세스의) 발행 수 — 세션마다 _TRIM_EVERY건마다 자기 링 버퍼 정리
+        self._publish_counts: dict[str, int] = {}
+
+    # ── 세션 manifest ──
+
+    def save(self, session_id: str, manifest: dict, step: str) -> int:
+        payload = json.dumps(manifest, ensure_ascii=False)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO sessions (session_id, manifest, step, updated_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(session_id) DO UPDATE SET "
+                "manifest=excluded.manifest, step=excluded.step, "
+                "version=version+1, updated_at=excluded.updated_at",
+                (session_id, payload, step, time.time()),
+            )
+            return self.conn.execute(
+                "SELECT version FROM sessions WHERE session_id=?", (session_id,)
+            ).fetchone()[0]
+
+    def load(self, session_id: str) -> Optional[tuple[dict, str, int]]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT manifest, step, version FROM sessions WHERE session_id=?",
+                (session_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+
+    def version(self, session_id: str) -> Optional[int]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT version FROM sessions WHERE session_id=?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, session_id: str):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM sessions WHERE session_id=?", (session_id,))
+            self.conn.execute("DELETE FROM events WHERE session_id=?", (session_id,))
+            self.conn.execute("DELETE FROM blobs WHERE session_id=?", (session_id,))
+            self._publish_counts.pop(session_id, None)
+
+    def expired(self, ttl: float) -> list[str]:
+        now = time.time()
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT session_id FROM sessions WHERE updated_at<? "
+                "AND (lease_owner IS NULL OR lease_until<?)",
+                (now - ttl, now),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    # ── 실행 lease ──
+
+    def acquire_lease(self, session_id: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self.lock, self.conn:
+            cur = self.conn.execute(
+                "UPDATE sessions SET lease_owner=?, lease_until=?, cancel_requested=0 "
+                "WHERE session_id=? AND (lease_owner IS NULL OR lease_until<?)",
+                (owner, now + ttl, session_id, now),
+            )
+            return cur.rowcount == 1
+
+    def renew_leases(self, session_ids: list[str], owner: str, ttl: float):
+        if not session_ids:
+            return
+        until = time.time() + ttl
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE sessions SET lease_until=? WHERE session_id=? AND lease_owner=?",
+                [(until, sid, owner) for sid in session_ids],
+            )
+
+    def release_lease(self, session_id: str, owner: str):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE sessions SET lease_owner=NULL, lease_until=0, cancel_requested=0 "
+                "WHERE session_id=? AND lease_owner=?",
+                (session_id, owner),
+            )
+
+    def lease_owner(self, session_id: str) -> Optional[str]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT lease_owner FROM sessions WHERE session_id=? AND lease_until>=?",
+                (session_id, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def request_cancel(self, session_id: str):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE sessions SET cancel_requested=1 WHERE session_id=?", (session_id,)
+            )
+
+    def pop_cancel_requests(self, session_ids: list[str]) -> list[str]:
+        if not session_ids:
+            return []
+        marks = ",".join("?" * len(session_ids))
+        with self.lock, self.conn:
+            rows = self.conn.execute(
+                f"SELECT session_id FROM sessions WHERE cancel_requested=1 "
+                f"AND session_id IN ({marks})",
+                session_ids,
+            ).fetchall()
+            requested = [r[0] for r in rows]
+            self.conn.executemany(
+                "UPDATE sessions SET cancel_requested=0 WHERE session_id=?",
+                [(sid,) for sid in requested],
+            )
+        return requested
+
+    # ── SSE 이벤트 ──
+
+    def publish(self, session_id: str, event: str, data: dict) -> int:
+        payload = json.dumps(data, ensure_ascii=False)
+        blob = None
+        if len(payload) >= SSE_BLOB_MIN_BYTES:
+            raw = payload.encode("utf-8")
+            blob = (uuid.uuid4().hex, gzip.compress(raw, compresslevel=6))
+            payload = json.dumps({"blob": blob[0], "bytes": len(raw)})
+        with self.lock, self.conn:
+            seq = None
+            if blob is None and event in COALESCED_EVENTS:
+                seq = self._coalesce_pending(session_id, event, data)
+            if seq is None:
+                seq = self.conn.execute(
+                    "INSERT INTO events (session_id, event, data) VALUES (?, ?, ?)",
+                    (session_id, event, payload),
+                ).lastrowid
+                if blob is not None:
+                    self.conn.execute(
+                        "INSERT INTO blobs (blob_id, session_id, seq, data) VALUES (?, ?, ?, ?)",
+                        (blob[0], session_id, seq, blob[1]),
+                    )
+                count = self._publish_counts.get(session_id, 0) + 1
+                self._publish_counts[session_id] = count
+                if count % _TRIM_EVERY == 0:
+                    self._trim(session_id)
+            callbacks = list(self._subscribers.get(session_id, ()))
+        for cb in callbacks:
+            cb()
+        return seq
+
+    def _coalesce_pending(self, session_id: str, event: str, data: dict) -> Optional[int]:
+        """세션 마지막 이벤트가 같은 종류 + 미소비면 합쳐서 갱신 → 그 seq (lock/트랜잭션 안에서 호출)"""
+        row = self.conn.execute(
+            "SELECT seq, event, data FROM events WHERE session_id=? ORDER BY seq DESC LIMIT 1",
+            (session_id,),
+        ).fetchone()
+        if row is None or row[1] != event:
+            return None
+        cursor = self.conn.execute(
+            "SELECT sse_cursor FROM sessions WHERE session_id=?", (session_id,)
+        ).fetchone()
+        if cursor is None or row[0] <= cursor[0]:
+            return None
+        merged = _coalesce(event, json.loads(row[2]), data)
+        if merged is None:
+            return None
+        self.conn.execute(
+            "UPDATE events SET data=? WHERE seq=?",
+            (json.dumps(merged, ensure_ascii=False), row[0]),
+        )
+        return row[0]
+
+    def _trim(self, session_id: str):
+        """세션 링 버퍼 — 최근 SSE_REPLAY_EVENTS개만 남기고 정리 (lock/트랜잭션 안에서 호출)"""
+        row = self.conn.execute(
+            "SELECT seq FROM events WHERE session_id=? ORDER BY seq DESC LIMIT 1 OFFSET ?",
+            (session_id, SSE_REPLAY_EVENTS),
+        ).fetchone()
+        if row is None:
+            return
+        self.conn.execute(
+            "DELETE FROM events WHERE session_id=? AND seq<=?", (session_id, row[0])
+        )
+        self.conn.execute(
+            "DELETE FROM blobs WHERE session_id=? AND seq<=?", (session_id, row[0])
+        )
+        self.conn.execute(
+            "UPDATE sessions SET sse_floor=MAX(sse_floor, ?) WHERE session_id=?",
+            (row[0], session_id),
+        )
+
+    def read_blob(self, session_id: str, blob_id: str) -> Optional[bytes]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM blobs WHERE blob_id=? AND session_id=?", (blob_id, session_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def read_events(
+        self, session_id: str, after: int, limit: int = 500, claim: bool = False
+    ) -> list[tuple[int, str, str]]:
+        with self.lock, self.conn:
+            rows = self.conn.execute(
+                "SELECT seq, event, data FROM events WHERE session_id=? AND seq>? "
+                "ORDER BY seq LIMIT ?",
+                (session_id, after, limit),
+            ).fetchall()
+            if claim and rows:
+                self.conn.execute(
+                    "UPDATE sessions SET sse_cursor=MAX(sse_cursor, ?) WHERE session_id=?",
+                    (rows[-1][0], session_id),
+                )
+        return rows
+
+    def sse_state(self, session_id: str) -> tuple[int, int]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT sse_cursor, sse_generation FROM sessions WHERE session_id=?",
+                (session_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else (0, -1)
+
+    def set_cursor(self, session_id: str, seq: int):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE sessions SET sse_cursor=MAX(sse_cursor, ?) WHERE session_id=?",
+                (seq, session_id),
+            )
+
+    def replay_floor(self, session_id: str) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT sse_floor FROM sessions WHERE session_id=?", (session_id,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def latest_seq(self, session_id: str) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT MAX(seq) FROM events WHERE session_id=?", (session_id,)
+            ).fetchone()
+        return row[0] or 0
+
+    def open_stream(self, session_id: str, drop_pending: bool = False) -> int:
+        with self.lock, self.conn:
+            if drop_pending:
+                latest = self.conn.execute(
+                    "SELECT MAX(seq) FROM events WHERE session_id=?", (session_id,)
+                ).fetchone()[0]
+                if latest is not None:
+                    self.conn.execute("DELETE FROM events WHERE session_id=?", (session_id,))
+                    self.conn.execute("DELETE FROM blobs WHERE session_id=?", (session_id,))
+                    self.conn.execute(
+                        "UPDATE sessions SET sse_cursor=MAX(sse_cursor, ?), "
+                        "sse_floor=MAX(sse_floor, ?) WHERE session_id=?",
+                        (latest, latest, session_id),
+                    )
+            self.conn.execute(
+                "UPDATE sessions SET sse_generation=sse_generation+1 WHERE session_id=?",
+                (session_id,),
+            )
+            row = self.conn.execute(
+                "SELECT sse_generation FROM sessions WHERE session_id=?", (session_id,)
+            ).fetchone()
+            callbacks = list(self._subscribers.get(session_id, ()))
+        # 기존 연결이 같은 프로세스에 있으면 즉시 깨워 종료시킴
+        for cb in callbacks:
+            cb()
+        return row[0] if row else 0
+
+    def subscribe(self, session_id: str, callback: Callable[[], None]) -> Callable[[], None]:
+        with self.lock:
+            self._subscribers.setdefault(session_id, set()).add(callback)
+
+        def unsubscribe():
+            with self.lock:
+                subs = self._subscribers.get(session_id)
+                if subs is not None:
+                    subs.discard(callback)
+                    if not subs:
+                        del self._subscribers[session_id]
+
+        return unsubscribe
+
+
+# ── 백엔드 선택 ─────────────────────────────────────────────────────
+
+_BACKENDS = {
+    "sqlite": lambda: SqliteSessionStore(_default_db_path()),
+}
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def _default_db_path() -> str:
+    from backend.config import get_session_store_path
+
+    return get_session_store_path()
+
+
+def get_session_store() -> SessionStore:
+    """프로세스 공용 세션 저장소 (SESSION_STORE_BACKEND로 선택, lazy init)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            from backend.config import get_session_store_backend
+
+            backend = get_session_store_backend()
+            if backend not in _BACKENDS:
+                raise ValueError(f"Unknown session store backend: {backend}")
+            _store = _BACKENDS[backend]()
+        return _store
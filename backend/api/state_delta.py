@@ -0,0 +1,96 @@
+"""세션 상태 delta 추적 — /state?since=<version> 응답용 행 단위 변경 버전 기록 (워커별, 메모리)"""
+
+import json
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+# 목록별 행 식별자 — 테이블 순서 목록은 위치, 번역/검수 결과는 (row_index, lang)
+_ROW_ID: dict[str, Callable] = {
+    "original_rows": lambda i, row: i,
+    "ko_review_results": lambda i, row: i,
+    "review_results": lambda i, row: (row.get("row_index"), row.get("lang")),
+    "failed_rows": lambda i, row: (row.get("row_index"), row.get("lang")),
+    "logs": lambda i, row: i,
+}
+
+# delta 기준으로 받아줄 최근 관측 버전 수
+_OBSERVED_MAX = 64
+
+
+def _digest(row) -> int:
+    return hash(json.dumps(row, sort_keys=True, ensure_ascii=False, default=str))
+
+
+class StateDeltaTracker:
+    """
+    세션 상태 목록의 행별 마지막 변경 버전 기록.
+
+    - observe(): 새 상태 버전을 처음 응답할 때 1회 — 행 digest 비교로 변경/삭제 버전 갱신
+    - changes(): since 이후 변경 행만 추림. since가 이 워커가 관측한 버전이 아니면 None
+      (관측 사이의 중간 상태를 알 수 없으므로 전체 응답으로 대체)
+    - 현재 단계에 해당 없는 목록(None)은 기록 유지 — 같은 행으로 돌아오면 (Cancel) 변경 없음
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version: Optional[int] = None
+        self._observed: deque = deque(maxlen=_OBSERVED_MAX)
+        # 목록 → {행 id: (digest, 변경 버전)} / {행 id: 삭제 버전}
+        self._rows: dict[str, dict] = {}
+        self._removed: dict[str, dict] = {}
+
+    def observe(self, version: int, lists: dict[str, Optional[list]]):
+        with self._lock:
+            if self.version == version:
+                return
+            for name, rows in lists.items():
+                if rows is None:
+                    continue
+                row_id = _ROW_ID[name]
+                known = self._rows.setdefault(name, {})
+                removed = self._removed.setdefault(name, {})
+                seen = set()
+                for i, row in enumerate(rows):
+                    rid = row_id(i, row)
+                    seen.add(rid)
+                    digest = _digest(row)
+                    prev = known.get(rid)
+                    if prev is None or prev[0] != digest:
+                        known[rid] = (digest, version)
+                        removed.pop(rid, None)
+                for rid in [rid for rid in known if rid not in seen]:
+                    del known[rid]
+                    removed[rid] = version
+            self.version = version
+            self._observed.append(version)
+
+    def changes(
+        self, since: int, lists: dict[str, Optional[list]]
+    ) -> Optional[tuple[dict, dict, dict]]:
+        """since 이후 변경 → (변경 행만 남긴 목록, 목록별 변경 행 id, 목록별 삭제 행 id). 추적 범위 밖이면 None"""
+        with self._lock:
+            if since not in self._observed:
+                return None
+            changed_lists: dict[str, Optional[list]] = {}
+            changed_ids: dict[str, list] = {}
+            removed_ids: dict[str, list] = {}
+            for name, rows in lists.items():
+                if rows is None:
+                    changed_lists[name] = None
+                    continue
+                row_id = _ROW_ID[name]
+                known = self._rows.get(name, {})
+                kept, ids = [], []
+                for i, row in enumerate(rows):
+                    rid = row_id(i, row)
+                    entry = known.get(rid)
+                    if entry is None or entry[1] > since:
+                        kept.append(row)
+                        ids.append(rid)
+                changed_lists[name] = kept
+                changed_ids[name] = ids
+                gone = [rid for rid, v in self._removed.get(name, {}).items() if v > since]
+                if gone:
+                    removed_ids[name] = gone
+            return changed_lists, changed_ids, removed_ids
@@ -25,3 +25,32 @@ def get_gcp_credentials() -> dict:
                 return json.load(f)
     raw = os.environ.get("GCP_SERVICE_ACCOUNT_JSON", "{}")
     return json.loads(raw)
+
+
+def get_checkpoint_db_path() -> str:
+    """LangGraph 체크포인트 SQLite 경로 (상대경로는 프로젝트 루트 기준)"""
+    path = Path(os.environ.get("CHECKPOINT_DB_PATH", ".checkpoints/checkpoints.sqlite"))
+    if not path.is_absolute():
+        path = _PROJECT_ROOT / path
+    return str(path)
+
+
+def get_row_store_dir() -> str:
+    """RowTable 스냅샷 저장 디렉토리 (상대경로는 프로젝트 루트 기준)"""
+    path = Path(os.environ.get("ROW_STORE_DIR", ".checkpoints/rows"))
+    if not path.is_absolute():
+        path = _PROJECT_ROOT / path
+    return str(path)
+
+
+def get_session_store_backend() -> str:
+    """세션 공유 저장소 구현 (기본: sqlite — 같은 호스트의 워커 간 공유)"""
+    return os.environ.get("SESSION_STORE_BACKEND", "sqlite")
+
+
+def get_session_store_path() -> str:
+    """세션 저장소 SQLite 경로 (상대경로는 프로젝트 루트 기준)"""
+    path = Path(os.environ.get("SESSION_STORE_PATH", ".checkpoints/sessions.sqlite"))
+    if not path.is_absolute():
+        path = _PROJECT_ROOT / path
+    return str(path)
@@ -22,6 +22,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from backend.api.compression import CompressionMiddleware
 from backend.api.routes import router
 
 app = FastAPI(title="DevLocal API", version="2.0.0")
@@ -36,6 +37,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (br/gzip 협상) — SSE 스트림 제외, 큰 SSE 이벤트는 사전 압축 blob으로 분리
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(router, prefix="/api")
 
 # ── 정적 파일 서빙 (프로덕션: React 빌드 결과물) ──
@@ -16,6 +16,9 @@ class Status:
 # Tool_Status 컬럼명
 TOOL_STATUS_COLUMN = "Tool_Status"
 
+# 행 지문 컬럼명 (숨김 컬럼 — 커밋 시 Key+Korean+Shared Comments 해시 기록)
+TOOL_FINGERPRINT_COLUMN = "Tool_Fingerprint"
+
 # 정규식 태그 검증 패턴 목록
 TAG_PATTERNS = [
     r'\{[^}]+\}',           # 변수 태그: {player_name}, {0}, {1}
@@ -51,6 +54,49 @@ CHUNK_SIZE = 25
 # Reviewer 최대 재시도 횟수
 MAX_RETRY_COUNT = 3
 
+# Google Sheets API 쿼터 (서비스 계정 = 사용자 1명 기준, 분당 요청 수)
+SHEETS_READ_QUOTA_PER_MIN = 60
+SHEETS_WRITE_QUOTA_PER_MIN = 60
+# Sheets API 재시도 예산 — 성공 호출마다 적립, 재시도마다 1 소모
+SHEETS_RETRY_BUDGET_MAX = 20
+SHEETS_RETRY_BUDGET_RATIO = 0.2
+# 스프레드시트 메타데이터 캐시 TTL (초) — /connect → /start 재사용
+SHEET_METADATA_TTL = 300
+# 최종 커밋 batchUpdate 1회당 최대 셀 수 (행 단위로 묶어 나눔 — 행 안의 셀은 같은 요청)
+COMMIT_BATCH_CELLS = 2000
+
+# API 세션 메모리 예산 (MB) — 초과 시 HITL 대기 중인 유휴 세션부터 디스크로 내림
+SESSION_MEMORY_BUDGET_MB = 512
+# 워커 캐시의 세션 객체 최대 수 (spill된 세션 포함) — 초과 시 실행 중이 아닌 LRU 세션을 캐시에서 제거 (저장소 기록 유지)
+MAX_SESSIONS = 50
+# 세션 보관 기간 (초) — 마지막 단계 변경 후 이 시간이 지난 (실행 중이 아닌) 세션은 저장소/체크포인트/RowTable까지
+# 영구 삭제. 워커 캐시 상한과 달리 모든 워커 공통 기준 (버려진 세션 정리용)
+SESSION_TTL_SECONDS = 24 * 60 * 60
+# 실행 lease TTL (초) — phase를 실행 중인 워커가 주기적으로 갱신, 워커가 죽으면 만료 후 다른 워커가 인수
+SESSION_LEASE_TTL = 30
+# 다른 워커에서 발행된 SSE 이벤트 폴링 주기 (초) — 같은 워커의 이벤트는 즉시 전달
+SSE_POLL_SECONDS = 0.25
+# SSE 청크 이벤트 배치 — flush 창 (초) / 창 안에서도 이 행 수에 도달하면 즉시 전송
+SSE_FLUSH_SECONDS = 0.1
+SSE_BATCH_MAX_ROWS = 200
+# 세션별 SSE 재전송 버퍼 (이벤트 수) — Last-Event-ID 재연결 시 이 범위 안에서 놓친 이벤트만 재전송
+SSE_REPLAY_EVENTS = 2000
+# 이 크기 (직렬화 바이트) 이상인 SSE 이벤트는 gzip blob으로 저장하고 참조만 전송 (/api/events/{id}/blobs/{blob})
+SSE_BLOB_MIN_BYTES = 64 * 1024
+# /state 페이지 크기 상한 (limit) — 로그/목록 행 수
+STATE_PAGE_MAX_ROWS = 5000
+
+# 파이프라인 작업 스케줄러 — 동시 실행 phase 수 / 대기열 상한 (초과 시 /start 거절)
+JOB_MAX_RUNNING = 16
+JOB_MAX_QUEUED = 32
+# 프로세스 전체 LLM 동시 호출 수 — 청크 단위로 우선순위 + 세션별 공정 분배
+LLM_MAX_CONCURRENCY = 4
+# 작업 우선순위 분류 기준 (예상 LLM 청크 수) — 이하면 interactive, 이상이면 bulk
+JOB_INTERACTIVE_MAX_CHUNKS = 4
+JOB_BULK_MIN_CHUNKS = 40
+# 대기 시간 에이징 (초) — 이만큼 기다릴 때마다 우선순위 1단계 상승 (bulk 기아 방지)
+JOB_AGING_SECONDS = 60
+
 # LLM 모델 설정
 LLM_MODEL = "xai/grok-4-1-fast-reasoning"
 LLM_PRICING = {
@@ -3,7 +3,7 @@ import { useAppStore } from "./store/useAppStore";
 import { useSSE } from "./hooks/useSSE";
 import { useSheetQueue } from "./hooks/useSheetQueue";
 import { useNavigationGuard } from "./hooks/useNavigationGuard";
-import { getSessionState } from "./api/client";
+import { getSessionState, resumeSession } from "./api/client";
 import type { AppStep } from "./types";
 import Header from "./components/Header";
 import SettingsModal from "./components/SettingsModal";
@@ -122,6 +122,8 @@ export default function App() {
     }, 5000);
 
     getSessionState(savedId)
+      // 서버 재시작으로 메모리에 세션이 없으면 디스크(manifest + 체크포인트)에서 재개
+      .catch(() => resumeSession(savedId).then(() => getSessionState(savedId)))
       .then((state) => {
         clearTimeout(timeout);
         const s = useAppStore.getState();
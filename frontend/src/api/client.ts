@@ -51,11 +51,8 @@ export function approveKo(sessionId: string, data: ApprovalRequest) {
 
 /* ── HITL 2: Final Approval ── */
 export function approveFinal(sessionId: string, data: ApprovalRequest) {
-  return request<{
-    status: string;
-    updates_count?: number;
-    translations_applied?: boolean;
-  }>(`/approve-final/${sessionId}`, {
+  // 반영은 백그라운드 — 진행/결과는 SSE commit_progress → done 이벤트로 수신
+  return request<{ status: string }>(`/approve-final/${sessionId}`, {
     method: "POST",
     body: JSON.stringify(data),
   });
@@ -68,14 +65,28 @@ export function cancelTranslation(sessionId: string) {
   });
 }
 
+/* ── Resume (서버 재시작 후 재개) ── */
+export function resumeSession(sessionId: string) {
+  return request<{ status: string; resumed: boolean; journaled_chunks?: number }>(
+    `/resume/${sessionId}`,
+    { method: "POST" },
+  );
+}
+
 /* ── Session State ── */
 export function getSessionState(sessionId: string) {
   return request<SessionStateResponse>(`/state/${sessionId}`);
 }
 
+/* ── 큰 SSE 이벤트 본문 (압축 blob) ── */
+export function getEventBlob(sessionId: string, blobId: string) {
+  return request<unknown>(`/events/${sessionId}/blobs/${blobId}`);
+}
+
 /* ── Downloads ── */
-export function getDownloadUrl(sessionId: string, fileType: string) {
-  return `${BASE}/download/${sessionId}/${fileType}`;
+export function getDownloadUrl(sessionId: string, fileType: string, format: "csv" | "xlsx" = "csv") {
+  const query = format === "csv" ? "" : `?format=${format}`;
+  return `${BASE}/download/${sessionId}/${fileType}${query}`;
 }
 
 /* ── Guide ── */
@@ -102,6 +102,22 @@ export default function Footer({
                 New
               </span>
             </label>
+            <label className="relative flex cursor-pointer rounded-lg px-4 py-2 text-sm font-semibold text-slate-500 hover:text-text-main transition-all duration-200 has-[:checked]:bg-white has-[:checked]:text-primary has-[:checked]:shadow-sm">
+              <input
+                type="radio"
+                name="translation_scope"
+                checked={mode === "C"}
+                disabled={!isIdle}
+                onChange={() => setMode("C")}
+                className="sr-only"
+              />
+              <span className="flex items-center gap-2">
+                <span className="material-symbols-outlined text-[18px]" aria-hidden="true">
+                  published_with_changes
+                </span>
+                Changed
+              </span>
+            </label>
           </div>
 
           <div className="h-8 w-px bg-slate-200" />
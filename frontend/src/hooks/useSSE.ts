@@ -1,19 +1,32 @@
 import { useEffect, useRef } from "react";
 import { useAppStore } from "../store/useAppStore";
-import { getSessionState } from "../api/client";
+import { getEventBlob, getSessionState } from "../api/client";
 import type {
   AppStep,
   NodeUpdateData,
+  QueueData,
+  CommitProgressData,
+  DoneData,
+  ErrorData,
   KoReviewReadyData,
   FinalReviewReadyData,
   KoReviewChunkData,
   TranslationChunkData,
   ReviewChunkData,
+  OriginalRow,
 } from "../types";
 
 // LLM pricing (config/constants.py와 동일)
 const LLM_PRICING = { input: 0.2 / 1_000_000, output: 0.5 / 1_000_000, cached_input: 0.05 / 1_000_000 };
 
+/** 큰 이벤트 — 서버가 본문 대신 보내는 압축 blob 참조 */
+function isBlobRef(data: unknown): data is { blob: string; bytes: number } {
+  return (
+    typeof data === "object" && data !== null &&
+    typeof (data as { blob?: unknown }).blob === "string" && "bytes" in data
+  );
+}
+
 // 재연결 설정
 const MAX_RECONNECT = 5;
 const BASE_DELAY_MS = 1000;
@@ -24,6 +37,8 @@ const MAX_DELAY_MS = 16000;
  * App.tsx 레벨에서 호출하여 화면 전환에도 연결이 유지되도록 함
  *
  * 재연결: 네트워크 끊김 시 exponential backoff로 최대 5회 재시도
+ *   마지막으로 받은 이벤트 id를 보내 놓친 이벤트만 재전송받음 (서버 재전송 버퍼 범위를
+ *   벗어나면 resync 이벤트 → /state 전체 동기화)
  * 앱 에러: 서버가 보낸 error 이벤트는 재연결하지 않음
  */
 export function useSSE() {
@@ -32,60 +47,92 @@ export function useSSE() {
   const reconnectCountRef = useRef(0);
   const reconnectTimerRef = useRef<ReturnType<typeof setTimeout> | undefined>(undefined);
   const closedIntentionallyRef = useRef(false);
+  // 마지막으로 처리한 이벤트 seq — 수동 재연결 시 서버에 전달 (세션 변경 시 초기화)
+  const lastEventIdRef = useRef<string | null>(null);
 
   useEffect(() => {
     if (!sessionId) return;
 
     closedIntentionallyRef.current = false;
     reconnectCountRef.current = 0;
+    lastEventIdRef.current = null;
+
+    /** /state 전체 동기화 — 놓친 이벤트를 재전송받을 수 없을 때만 */
+    function syncState() {
+      if (!sessionId) return;
+      const store = useAppStore.getState;
+      getSessionState(sessionId)
+        .then((state) => {
+          const s = store();
+          const cur = s.currentStep;
+          // 테이블 복원용 original_rows
+          if (state.original_rows && s.originalRows.length === 0) {
+            s.setOriginalRows(state.original_rows);
+          }
+          // 백엔드가 이미 다음 단계로 진행했으면 프론트도 전환
+          if (state.current_step === "ko_review" && cur !== "ko_review" && state.ko_review_results) {
+            s.setKoReviewResults(state.ko_review_results);
+            s.setTotalRows(state.total_rows ?? 0);
+            s.setCurrentStep("ko_review");
+          } else if (state.current_step === "final_review" && cur !== "final_review" && state.review_results) {
+            s.setReviewResults(state.review_results);
+            if (state.failed_rows) s.setFailedRows(state.failed_rows);
+            if (state.cost_summary) s.setCostSummary(state.cost_summary);
+            s.setCurrentStep("final_review");
+          } else if (state.current_step === "done" && cur !== "done") {
+            s.setCurrentStep("done");
+          } else if (state.current_step !== cur) {
+            s.setCurrentStep(state.current_step as AppStep);
+          }
+        })
+        .catch(() => {
+          // 동기화 실패 — SSE 이벤트로 자연스럽게 보완
+        });
+    }
 
     function connect() {
-      const es = new EventSource(`/api/stream/${sessionId}`);
+      const lastId = lastEventIdRef.current;
+      const query = lastId ? `?last_event_id=${encodeURIComponent(lastId)}` : "";
+      const es = new EventSource(`/api/stream/${sessionId}${query}`);
       esRef.current = es;
       const store = useAppStore.getState;
 
+      // 이벤트 처리 순서 보장 — blob 참조 이벤트는 본문을 받아온 뒤 처리 (뒤 이벤트는 대기)
+      let chain: Promise<void> = Promise.resolve();
+
+      /** 이벤트 리스너 등록 — 처리한 이벤트 id 기록 + 큰 이벤트(blob 참조)는 본문 조회 후 전달 */
+      function listen<T>(type: string, handler: (data: T) => void) {
+        es.addEventListener(type, (e) => {
+          const me = e as MessageEvent;
+          if (me.lastEventId) lastEventIdRef.current = me.lastEventId;
+          const parsed = JSON.parse(me.data);
+          chain = chain
+            .then(() => (isBlobRef(parsed) ? getEventBlob(sessionId!, parsed.blob) : parsed))
+            .then((data) => handler(data as T))
+            .catch(() => {
+              // blob 만료 등 — /state 전체 동기화로 보완
+              syncState();
+            });
+        });
+      }
+
       es.onopen = () => {
         const wasReconnect = reconnectCountRef.current > 0;
         reconnectCountRef.current = 0;
         store().setSseStatus("connected");
 
-        // 재연결 시 끊김 동안 놓친 상태 전환 동기화
-        if (wasReconnect && sessionId) {
-          getSessionState(sessionId)
-            .then((state) => {
-              const s = store();
-              const cur = s.currentStep;
-              // 테이블 복원용 original_rows
-              if (state.original_rows && s.originalRows.length === 0) {
-                s.setOriginalRows(state.original_rows);
-              }
-              // 백엔드가 이미 다음 단계로 진행했으면 프론트도 전환
-              if (state.current_step === "ko_review" && cur !== "ko_review" && state.ko_review_results) {
-                s.setKoReviewResults(state.ko_review_results);
-                s.setTotalRows(state.total_rows ?? 0);
-                s.setCurrentStep("ko_review");
-              } else if (state.current_step === "final_review" && cur !== "final_review" && state.review_results) {
-                s.setReviewResults(state.review_results);
-                if (state.failed_rows) s.setFailedRows(state.failed_rows);
-                if (state.cost_summary) s.setCostSummary(state.cost_summary);
-                s.setCurrentStep("final_review");
-              } else if (state.current_step === "done" && cur !== "done") {
-                s.setCurrentStep("done");
-              } else if (state.current_step !== cur) {
-                s.setCurrentStep(state.current_step as AppStep);
-              }
-            })
-            .catch(() => {
-              // 동기화 실패 — SSE 이벤트로 자연스럽게 보완
-            });
-        }
+        // id 없이 재연결한 경우에만 전체 동기화 — id가 있으면 서버가 놓친 이벤트를 재전송
+        if (wasReconnect && !lastId) syncState();
       };
 
+      /* ── 재전송 버퍼 범위 밖 → 전체 동기화 ── */
+      listen("resync", () => syncState());
+
       /* ── 노드 수준 업데이트 ── */
-      es.addEventListener("node_update", (e) => {
-        const data: NodeUpdateData = JSON.parse(e.data);
+      listen<NodeUpdateData>("node_update", (data) => {
         const s = store();
-        s.setLogs(data.logs);
+        // 노드는 새 로그만 보냄 — 누적은 클라이언트에서
+        if (data.logs?.length) s.appendLogs(data.logs);
 
         if (data.step === "loading") {
           // Loading phase — 고정 진행률
@@ -117,15 +164,26 @@ export function useSSE() {
         }
       });
 
+      /* ── 작업 스케줄러 대기 순번 (position 0 = 실행 시작) ── */
+      listen<QueueData>("queue", (data) => {
+        const s = store();
+        if (data.position > 0) {
+          s.setProgress(
+            s.progressPercent,
+            `Waiting in queue... (#${data.position} of ${data.depth})`,
+          );
+        } else {
+          s.setProgress(s.progressPercent, "Starting...");
+        }
+      });
+
       /* ── 원본 데이터 수신 (Loading 화면 테이블용) ── */
-      es.addEventListener("original_data", (e) => {
-        const data = JSON.parse(e.data);
+      listen<{ rows: OriginalRow[] }>("original_data", (data) => {
         store().setOriginalRows(data.rows);
       });
 
       /* ── 한국어 검수 — 청크별 부분 결과 ── */
-      es.addEventListener("ko_review_chunk", (e) => {
-        const data: KoReviewChunkData = JSON.parse(e.data);
+      listen<KoReviewChunkData>("ko_review_chunk", (data) => {
         const s = store();
         s.appendPartialKoResults(data.chunk_results);
         s.setChunkProgress(data.progress);
@@ -139,8 +197,7 @@ export function useSSE() {
       });
 
       /* ── 번역 — 청크별 부분 결과 (전체의 0% → 60%) ── */
-      es.addEventListener("translation_chunk", (e) => {
-        const data: TranslationChunkData = JSON.parse(e.data);
+      listen<TranslationChunkData>("translation_chunk", (data) => {
         const s = store();
         s.appendPartialTranslations(data.chunk_results);
         s.setChunkProgress(data.progress);
@@ -154,8 +211,7 @@ export function useSSE() {
       });
 
       /* ── 검수 — 청크별 부분 결과 (전체의 60% → 95%) ── */
-      es.addEventListener("review_chunk", (e) => {
-        const data: ReviewChunkData = JSON.parse(e.data);
+      listen<ReviewChunkData>("review_chunk", (data) => {
         const s = store();
         s.appendPartialReviews(data.chunk_results);
         s.setChunkProgress(data.progress);
@@ -170,8 +226,7 @@ export function useSSE() {
       });
 
       /* ── 한국어 검수 완료 → 항상 리뷰 화면 표시 (0건이어도 컨펌 필요) ── */
-      es.addEventListener("ko_review_ready", (e) => {
-        const data: KoReviewReadyData = JSON.parse(e.data);
+      listen<KoReviewReadyData>("ko_review_ready", (data) => {
         const s = store();
         s.setKoReviewResults(data.results);
         s.setTotalRows(data.count);
@@ -180,8 +235,7 @@ export function useSSE() {
       });
 
       /* ── 번역 검수 완료 → 600ms dwell 후 화면 전환 ── */
-      es.addEventListener("final_review_ready", (e) => {
-        const data: FinalReviewReadyData = JSON.parse(e.data);
+      listen<FinalReviewReadyData>("final_review_ready", (data) => {
         const s = store();
         s.setReviewResults(data.review_results);
         s.setFailedRows(data.failed_rows);
@@ -205,13 +259,32 @@ export function useSSE() {
         setTimeout(() => s.setCurrentStep("final_review"), 600);
       });
 
+      /* ── 최종 승인 커밋 진행 (백업 → 셀 쓰기, 배치마다 누적 셀 수) ── */
+      listen<CommitProgressData>("commit_progress", (data) => {
+        if (data.stage === "backup") {
+          store().setProgress(0, "Backup saved");
+        } else if (data.stage === "writing" && data.total > 0) {
+          store().setProgress(
+            Math.round((data.done / data.total) * 100),
+            `${data.done}/${data.total} cells written`,
+          );
+        }
+      });
+
       /* ── 완료 — 의도적 종료 ── */
-      es.addEventListener("done", () => {
+      listen<DoneData>("done", (data) => {
         // Stale "done" 이벤트 무시 (구 세션에서 늦게 도착한 경우)
         if (useAppStore.getState().sessionId !== sessionId) return;
         closedIntentionallyRef.current = true;
-        store().setCurrentStep("done");
-        store().setSseStatus("disconnected");
+        const s = store();
+        if (data.translations_applied !== undefined) {
+          // 최종 승인 커밋 결과
+          s.setTranslationsApplied(data.translations_applied);
+          s.setCellsUpdated(data.updates_count ?? 0);
+          s.setIsWritingToSheet(false);
+        }
+        s.setCurrentStep("done");
+        s.setSseStatus("disconnected");
         es.close();
       });
 
@@ -219,13 +292,23 @@ export function useSSE() {
       es.addEventListener("error", (e) => {
         if (e instanceof MessageEvent) {
           try {
-            const data = JSON.parse(e.data);
+            const data: ErrorData = JSON.parse(e.data);
             store().addLog(`[ERROR] ${data.message}`);
+            if (data.partial_write && data.commit) {
+              store().addLog(
+                `[WARN] Partial write: ${data.commit.cells} cells already written to the sheet — approve again to write the rest`
+              );
+            }
           } catch {
             // non-JSON error event
           }
           closedIntentionallyRef.current = true;
           store().setSseStatus("disconnected");
+          // 커밋 실패 — DoneScreen에서 에러 상태 표시
+          if (store().isWritingToSheet) {
+            store().setTranslationsApplied(false);
+            store().setIsWritingToSheet(false);
+          }
           es.close();
           // All Sheets 모드: 에러 발생해도 큐 진행 (다음 시트로 이동)
           if (useAppStore.getState().allSheetsMode) {
@@ -7,6 +7,8 @@ export default function DoneScreen() {
   const sessionId = useAppStore((s) => s.sessionId);
   const translationsApplied = useAppStore((s) => s.translationsApplied);
   const isWritingToSheet = useAppStore((s) => s.isWritingToSheet);
+  // 커밋 진행 라벨 (SSE commit_progress)
+  const progressLabel = useAppStore((s) => s.progressLabel);
   const costSummary = useAppStore((s) => s.costSummary);
   const totalRows = useAppStore((s) => s.totalRows);
   const cellsUpdated = useAppStore((s) => s.cellsUpdated);
@@ -59,7 +61,7 @@ export default function DoneScreen() {
                     {isWritingToSheet ? (
                       <span className="inline-flex items-center gap-1.5">
                         <span className="material-symbols-outlined text-xs animate-spin360">progress_activity</span>
-                        Writing...
+                        {progressLabel || "Writing..."}
                       </span>
                     ) : translationsApplied ? "Pushed" : "Ready to Push"}
                   </span>
@@ -35,8 +35,8 @@ export default function TranslationWorkspace() {
   const setSelectedLang = useAppStore((s) => s.setSelectedLang);
   const costSummary = useAppStore((s) => s.costSummary);
   const setTranslationsApplied = useAppStore((s) => s.setTranslationsApplied);
-  const setCellsUpdated = useAppStore((s) => s.setCellsUpdated);
   const setIsWritingToSheet = useAppStore((s) => s.setIsWritingToSheet);
+  const setProgress = useAppStore((s) => s.setProgress);
   const resetTranslationState = useAppStore((s) => s.resetTranslationState);
   const reset = useAppStore((s) => s.reset);
 
@@ -246,19 +246,16 @@ export default function TranslationWorkspace() {
     setSubmitError(null);
 
     if (decision === "approved") {
-      // Optimistic UI: 즉시 DoneScreen으로 전환, 시트 쓰기는 백그라운드
+      // Optimistic UI: 즉시 DoneScreen으로 전환, 시트 쓰기는 백그라운드 작업 —
+      // 결과는 SSE done 이벤트 (useSSE)가 반영, 여기서는 요청 거절만 처리
       setIsWritingToSheet(true);
+      setProgress(0, "");
       setCurrentStep("done");
-      approveFinal(sessionId, { decision })
-        .then((res) => {
-          setTranslationsApplied(res.translations_applied ?? false);
-          setCellsUpdated(res.updates_count ?? 0);
-        })
-        .catch(() => {
-          // DoneScreen에서 에러 상태 표시 (isWritingToSheet 유지하지 않음)
-          setTranslationsApplied(false);
-        })
-        .finally(() => setIsWritingToSheet(false));
+      approveFinal(sessionId, { decision }).catch(() => {
+        // DoneScreen에서 에러 상태 표시 (isWritingToSheet 유지하지 않음)
+        setTranslationsApplied(false);
+        setIsWritingToSheet(false);
+      });
     } else {
       // Rejected — 시트 쓰기 없으므로 빠름, 동기 처리
       setSubmitting(true);
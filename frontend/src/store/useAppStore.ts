@@ -8,6 +8,7 @@ import type {
   OriginalRow,
   TranslationChunkItem,
   ChunkProgress,
+  TranslationMode,
 } from "../types";
 
 interface AppState {
@@ -16,7 +17,7 @@ interface AppState {
   sheetNames: string[];
   botEmail: string;
   selectedSheet: string;
-  mode: "A" | "B";
+  mode: TranslationMode;
   rowLimit: number;
 
   /* ── Project ── */
@@ -82,7 +83,7 @@ interface AppState {
   setBotEmail: (email: string) => void;
   setSelectedSheet: (name: string) => void;
   setProjectName: (name: string) => void;
-  setMode: (mode: "A" | "B") => void;
+  setMode: (mode: TranslationMode) => void;
   setRowLimit: (limit: number) => void;
   setSessionId: (id: string | null) => void;
   setCurrentStep: (step: AppStep) => void;
@@ -103,6 +104,7 @@ interface AppState {
   setCellsUpdated: (n: number) => void;
   addLog: (log: string) => void;
   setLogs: (logs: string[]) => void;
+  appendLogs: (logs: string[]) => void;
   setProgress: (percent: number, label: string) => void;
   setSseStatus: (status: "connected" | "reconnecting" | "disconnected") => void;
   setTranslationsApplied: (applied: boolean) => void;
@@ -213,6 +215,7 @@ export const useAppStore = create<AppState>((set) => ({
   setCellsUpdated: (n) => set({ cellsUpdated: n }),
   addLog: (log) => set((s) => ({ logs: [...s.logs, log] })),
   setLogs: (logs) => set({ logs }),
+  appendLogs: (logs) => set((s) => ({ logs: [...s.logs, ...logs] })),
   setProgress: (percent, label) =>
     set({ progressPercent: percent, progressLabel: label }),
   setSseStatus: (status) => set({ sseStatus: status }),
@@ -18,10 +18,13 @@ export interface ConnectResponse {
   project_name?: string;
 }
 
+/** 번역 범위 — A: 전체, B: 빈칸만, C: 증분 (지난 실행 이후 변경된 행만) */
+export type TranslationMode = "A" | "B" | "C";
+
 export interface StartRequest {
   sheet_url: string;
   sheet_name: string;
-  mode: string;
+  mode: TranslationMode;
   target_languages: string[];
   row_start: number;
   row_end: number;
@@ -29,6 +32,7 @@ export interface StartRequest {
 
 export interface StartResponse {
   session_id: string;
+  queue_depth?: number;
 }
 
 export interface ApprovalRequest {
@@ -49,6 +53,14 @@ export interface SessionStateResponse {
   failed_rows?: FailedRow[] | null;
   original_rows?: OriginalRow[] | null;
   total_rows?: number;
+  // 상태 버전 (ETag) — ?since= 기준값
+  version?: number;
+  // ?limit= 페이지 분할 시 다음 커서
+  next_cursor?: string | null;
+  // ?since= 응답: 목록에는 변경 행만 (changed/removed = 목록별 행 id)
+  delta?: boolean;
+  changed?: Record<string, unknown[]> | null;
+  removed?: Record<string, unknown[]> | null;
 }
 
 /* ── Domain Types ── */
@@ -92,6 +104,7 @@ export type SSEEventType =
   | "node_update"
   | "ko_review_ready"
   | "final_review_ready"
+  | "commit_progress"
   | "done"
   | "error"
   | "ping";
@@ -102,6 +115,31 @@ export interface NodeUpdateData {
   logs: string[];
 }
 
+export interface QueueData {
+  position: number; // 0 = 실행 시작, 1부터 대기 순번
+  depth: number;
+}
+
+export interface CommitProgressData {
+  stage: "backup" | "writing";
+  done: number; // writing: 시트에 반영된 셀 수 (배치마다 누적)
+  total: number;
+}
+
+/** done 이벤트 — 최종 승인 커밋 결과 (그 외 단계의 done은 빈 객체) */
+export interface DoneData {
+  status?: string;
+  updates_count?: number;
+  translations_applied?: boolean;
+}
+
+/** error 이벤트 — 최종 커밋 실패 시 partial_write/commit 포함 */
+export interface ErrorData {
+  message: string;
+  partial_write?: boolean; // true: 일부 행이 이미 시트에 반영됨 (재승인 시 나머지만 반영)
+  commit?: { cells: number; batches: number; batches_total: number } | null;
+}
+
 export interface KoReviewReadyData {
   results: KoReviewItem[];
   count: number;
@@ -160,6 +198,7 @@ export interface AppConfig {
   saved_url?: string;
   saved_sheet?: string;
   backup_folder?: string;
+  speculative_translation?: boolean; // KR 승인 대기 중 미수정 행 사전 번역 (opt-in)
   bot_email?: string;
   glossary?: Record<string, Record<string, string>>;
   custom_prompts?: Record<string, string>;
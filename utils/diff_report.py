@@ -1,9 +1,53 @@
-"""Diff 리포트 CSV 생성 — 한국어 교정 / 번역 변경 리포트"""
+"""Diff 리포트 생성 — 한국어 교정 / 번역 변경 리포트 (행 정렬 컬럼 배열 기반 벡터 연산)"""
 
 import io
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
+KO_REPORT_COLUMNS = ("Key", "기존 한국어", "교정 한국어")
+TRANSLATION_REPORT_COLUMNS = ("Key", "언어", "기존 번역", "새 번역", "변경 사유/내역")
+
+
+def _objects(values: Sequence) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def ko_diff_frame(keys: Sequence, originals: Sequence, revised: Sequence) -> pd.DataFrame:
+    """
+    한국어 교정 Diff — 같은 행 순서로 정렬된 컬럼 배열을 한 번에 비교, 변경된 행만.
+
+    keys/originals/revised: 행 i의 Key / 로드 시점 한국어 / 교정 한국어
+    """
+    original = _objects(originals)
+    changed = original != _objects(revised)
+    return pd.DataFrame({
+        KO_REPORT_COLUMNS[0]: _objects(keys)[changed],
+        KO_REPORT_COLUMNS[1]: original[changed],
+        KO_REPORT_COLUMNS[2]: _objects(revised)[changed],
+    })
+
+
+def translation_diff_frame(
+    keys: Sequence, langs: Sequence, old: Sequence, new: Sequence, reasons: Sequence
+) -> pd.DataFrame:
+    """번역 변경 Diff — 결과 행 순서로 정렬된 컬럼 배열 (기존 번역은 호출자가 RowTable에서 정렬해 전달)"""
+    return pd.DataFrame({
+        name: _objects(values)
+        for name, values in zip(TRANSLATION_REPORT_COLUMNS, (keys, langs, old, new, reasons))
+    })
+
+
+def _to_csv(df: pd.DataFrame) -> bytes:
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8-sig")
+    return buf.getvalue()
+
 
 def generate_ko_diff_report(
     original_rows: list[dict],
@@ -17,25 +61,15 @@ def generate_ko_diff_report(
 
     변경된 행만 포함. 반환: (DataFrame, csv_bytes)
     """
-    original_map = {r["Key"]: r.get("Korean(ko)", "") for r in original_rows}
-
-    diff_records = []
-    for row in revised_rows:
-        key = row.get("Key", "")
-        revised = row.get("Korean(ko)", "")
-        original = original_map.get(key, "")
-
-        if original != revised:
-            diff_records.append({
-                "Key": key,
-                "기존 한국어": original,
-                "교정 한국어": revised,
-            })
-
-    df = pd.DataFrame(diff_records)
-    buf = io.BytesIO()
-    df.to_csv(buf, index=False, encoding="utf-8-sig")
-    return df, buf.getvalue()
+    original = pd.DataFrame(original_rows, columns=["Key", "Korean(ko)"])
+    original_map = original.drop_duplicates("Key", keep="last").set_index("Key")["Korean(ko)"]
+    revised = pd.DataFrame(revised_rows, columns=["Key", "Korean(ko)"]).fillna("")
+    df = ko_diff_frame(
+        revised["Key"].to_numpy(dtype=object),
+        revised["Key"].map(original_map).fillna("").to_numpy(dtype=object),
+        revised["Korean(ko)"].to_numpy(dtype=object),
+    )
+    return df, _to_csv(df)
 
 
 def generate_translation_diff_report(
@@ -51,25 +85,16 @@ def generate_translation_diff_report(
     반환: (DataFrame, csv_bytes)
     """
     # old_trans와 new_trans를 Key+lang으로 매칭
-    old_map = {(r["Key"], r["lang"]): r.get("old", "") for r in old_trans}
-
-    diff_records = []
-    for row in new_trans:
-        key = row.get("Key", "")
-        lang = row.get("lang", "")
-        new_val = row.get("new", "")
-        reason = row.get("reason", "")
-        old_val = old_map.get((key, lang), "")
-
-        diff_records.append({
-            "Key": key,
-            "언어": lang,
-            "기존 번역": old_val,
-            "새 번역": new_val,
-            "변경 사유/내역": reason,
-        })
-
-    df = pd.DataFrame(diff_records)
-    buf = io.BytesIO()
-    df.to_csv(buf, index=False, encoding="utf-8-sig")
-    return df, buf.getvalue()
+    old = pd.DataFrame(old_trans, columns=["Key", "lang", "old"]).drop_duplicates(
+        ["Key", "lang"], keep="last"
+    )
+    new = pd.DataFrame(new_trans, columns=["Key", "lang", "new", "reason"])
+    merged = new.merge(old, on=["Key", "lang"], how="left").fillna("")
+    df = translation_diff_frame(
+        merged["Key"].to_numpy(dtype=object),
+        merged["lang"].to_numpy(dtype=object),
+        merged["old"].to_numpy(dtype=object),
+        merged["new"].to_numpy(dtype=object),
+        merged["reason"].to_numpy(dtype=object),
+    )
+    return df, _to_csv(df)
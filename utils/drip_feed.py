@@ -1,6 +1,4 @@
-"""SSE 드립피드 유틸 — 150ms 간격 항목별 전송으로 부드러운 테이블 채워짐 효과"""
-
-import time
+"""SSE 청크 결과 전송 유틸 — 청크 결과를 진행률과 함께 한 번에 emit (프레임 묶음은 SSE 계층 배처 담당)"""
 
 
 def drip_feed_emit(
@@ -10,10 +8,11 @@ def drip_feed_emit(
     progress_base: int,
     total: int,
     lang: str = "",
-    delay: float = 0.15,
 ) -> None:
     """
-    items를 한 건씩 delay 간격으로 SSE emit.
+    청크 결과 items를 진행률과 함께 SSE emit.
+    워커 스레드는 대기하지 않음 — 연속된 청크 이벤트는 backend.api.event_batcher가
+    flush 창(기본 100ms)마다 한 프레임으로 합쳐 전송.
 
     Args:
         emitter: SSE emit callback (event_name, data_dict)
@@ -22,24 +21,19 @@ def drip_feed_emit(
         progress_base: 이 배치 시작 시점의 누적 완료 수
         total: 전체 예상 항목 수
         lang: 언어 코드 (translation_chunk용, 선택)
-        delay: 항목 간 지연 시간 (초, 기본 0.15)
     """
-    for i, item in enumerate(items):
-        done = progress_base + i + 1
-
-        data = {
-            "chunk_results": [item],
-            "progress": {
-                "done": done,
-                "total": total,
-            },
-        }
+    if not items:
+        return
 
-        if lang:
-            data["lang"] = lang
+    data = {
+        "chunk_results": list(items),
+        "progress": {
+            "done": progress_base + len(items),
+            "total": total,
+        },
+    }
 
-        emitter(event_name, data)
+    if lang:
+        data["lang"] = lang
 
-        # 마지막 항목에는 딜레이 불필요
-        if i < len(items) - 1:
-            time.sleep(delay)
+    emitter(event_name, data)
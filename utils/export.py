@@ -0,0 +1,97 @@
+"""내보내기 — 행 iterator → CSV/XLSX 청크 스트림 (파일 전체를 메모리에 만들지 않음)"""
+
+import csv
+import io
+import math
+import tempfile
+from typing import Iterable, Iterator, Sequence
+
+try:  # 선택 의존성 — 없으면 CSV만 지원
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:
+    Workbook = None
+
+# 형식 → (확장자, media type)
+EXPORT_FORMATS = {
+    "csv": (".csv", "text/csv; charset=utf-8"),
+    "xlsx": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+XLSX_AVAILABLE = Workbook is not None
+
+# CSV 청크당 행 수 / XLSX 파일 읽기 단위
+EXPORT_CHUNK_ROWS = 1000
+_FILE_CHUNK_BYTES = 64 * 1024
+
+
+def _cell(value):
+    """None/NaN → 빈 칸 (pandas to_csv와 동일)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return value
+
+
+def iter_csv(
+    columns: Sequence[str], rows: Iterable[Sequence], chunk_rows: int = EXPORT_CHUNK_ROWS
+) -> Iterator[bytes]:
+    """UTF-8-SIG CSV — 헤더 + chunk_rows 행마다 한 청크 (엑셀에서 한글이 깨지지 않도록 BOM 포함)"""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(columns)
+    pending = 0
+    prefix = "\ufeff"
+    for row in rows:
+        writer.writerow([_cell(v) for v in row])
+        pending += 1
+        if pending >= chunk_rows:
+            yield (prefix + buf.getvalue()).encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+            pending = 0
+            prefix = ""
+    if pending or prefix:
+        yield (prefix + buf.getvalue()).encode("utf-8")
+
+
+def iter_xlsx(
+    columns: Sequence[str], rows: Iterable[Sequence], title: str = "Sheet1"
+) -> Iterator[bytes]:
+    """
+    XLSX — openpyxl write-only 워크북 (행을 메모리에 쌓지 않음)을 임시 파일에 저장한 뒤
+    청크로 읽어 전송. zip 구조상 저장 완료 전에는 보낼 수 없어 첫 청크까지 지연이 있음.
+    """
+    if Workbook is None:
+        raise RuntimeError("XLSX export requires openpyxl")
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=title[:31] or "Sheet1")
+    ws.append(list(columns))
+    for row in rows:
+        ws.append([
+            ILLEGAL_CHARACTERS_RE.sub("", v) if isinstance(v, str) else _cell(v)
+            for v in row
+        ])
+    with tempfile.TemporaryFile() as f:
+        wb.save(f)
+        f.seek(0)
+        while chunk := f.read(_FILE_CHUNK_BYTES):
+            yield chunk
+
+
+def iter_export(
+    fmt: str, columns: Sequence[str], rows: Iterable[Sequence], title: str = "Sheet1"
+) -> Iterator[bytes]:
+    if fmt == "xlsx":
+        return iter_xlsx(columns, rows, title)
+    return iter_csv(columns, rows)
+
+
+def iter_lines(lines: Iterable[str], chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[bytes]:
+    """텍스트 로그 — 줄 단위 청크"""
+    batch = []
+    for i, line in enumerate(lines):
+        batch.append(line if i == 0 else "\n" + line)
+        if len(batch) >= chunk_rows:
+            yield "".join(batch).encode("utf-8")
+            batch = []
+    if batch:
+        yield "".join(batch).encode("utf-8")
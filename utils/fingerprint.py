@@ -0,0 +1,43 @@
+"""행 콘텐츠 지문 — 증분 실행(모드 C)용 변경 감지"""
+
+import hashlib
+
+import pandas as pd
+
+from config.constants import REQUIRED_COLUMNS, TOOL_FINGERPRINT_COLUMN
+
+_FIELDS = (
+    REQUIRED_COLUMNS["key"],
+    REQUIRED_COLUMNS["korean"],
+    REQUIRED_COLUMNS["shared_comments"],
+)
+# 숫자로 해석되지 않게 붙이는 접두사 — 순수 hex는 get_all_records가 numericise
+# ("12e4567890123456" → inf, "0123..." → 선행 0 소실)해 매번 변경으로 판정됨
+_PREFIX = "fp:"
+
+
+def row_fingerprint(row: dict) -> str:
+    """Key + Korean + Shared Comments 해시 ("fp:" + 16자 hex)."""
+    payload = "\x1f".join(str(row.get(f, "") or "") for f in _FIELDS)
+    return _PREFIX + hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def select_changed_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    증분 실행 대상 행만 반환 — 한국어가 있고, 저장된 지문이 없거나 현재 내용과 다른 행.
+    접두사 없는 이전 형식 지문은 일치하지 않으므로 한 번 재처리된 뒤 새 형식으로 갱신됨.
+    인덱스(시트 행 위치)는 그대로 보존.
+    """
+    if df.empty:
+        return df
+    korean = df[REQUIRED_COLUMNS["korean"]].astype(str).str.strip()
+    stored = (
+        df[TOOL_FINGERPRINT_COLUMN].astype(str)
+        if TOOL_FINGERPRINT_COLUMN in df.columns
+        else pd.Series("", index=df.index)
+    )
+    current = pd.Series(
+        [row_fingerprint(r) for r in df[list(_FIELDS)].to_dict("records")],
+        index=df.index,
+    )
+    return df[(korean != "") & (stored != current)]
@@ -0,0 +1,323 @@
+"""파이프라인 작업 스케줄러 — 우선순위 + 세션별 공정 분배 (phase 작업 큐 + LLM 호출 슬롯)"""
+
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Callable, Optional
+
+from config.constants import (
+    JOB_AGING_SECONDS,
+    JOB_BULK_MIN_CHUNKS,
+    JOB_INTERACTIVE_MAX_CHUNKS,
+    JOB_MAX_QUEUED,
+    JOB_MAX_RUNNING,
+    LLM_MAX_CONCURRENCY,
+)
+
+logger = logging.getLogger("devlocal.jobs")
+
+
+class Priority(IntEnum):
+    """작업 우선순위 (값이 낮을수록 먼저)"""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+def classify_priority(chunks: int) -> Priority:
+    """예상 LLM 청크 수 → 우선순위 (작은 시트일수록 먼저)"""
+    if chunks <= JOB_INTERACTIVE_MAX_CHUNKS:
+        return Priority.INTERACTIVE
+    if chunks >= JOB_BULK_MIN_CHUNKS:
+        return Priority.BULK
+    return Priority.NORMAL
+
+
+class QueueFull(Exception):
+    """대기열 상한 초과 — 새 작업 거절 (admission control)"""
+
+    def __init__(self, depth: int):
+        super().__init__(f"Job queue is full ({depth} waiting)")
+        self.depth = depth
+
+
+class _Job:
+    __slots__ = ("seq", "session_id", "priority", "fn", "args", "on_queue", "since", "position")
+
+    def __init__(self, seq, session_id, priority, fn, args, on_queue):
+        self.seq = seq
+        self.session_id = session_id
+        self.priority = priority
+        self.fn = fn
+        self.args = args
+        self.on_queue = on_queue
+        self.since = time.monotonic()
+        self.position: Optional[int] = None
+
+
+class _SlotRequest:
+    __slots__ = ("seq", "session_id", "priority", "since")
+
+    def __init__(self, seq, session_id, priority):
+        self.seq = seq
+        self.session_id = session_id
+        self.priority = priority
+        self.since = time.monotonic()
+
+
+class JobScheduler:
+    """
+    모든 파이프라인 phase(그래프 실행)가 거치는 프로세스 공용 스케줄러.
+
+    - 작업 큐: 동시 실행 phase 수 상한, 대기 작업은 (에이징된 우선순위, 세션의 실행 중
+      작업 수, 제출 순) 순으로 시작. 대기 순번이 바뀌면 on_queue(position, depth) 호출
+    - LLM 슬롯: 실제 병목인 LLM 동시 호출 수를 청크(호출 1회) 단위로 분배 —
+      큰 시트가 실행 중이어도 다음 슬롯은 작은 시트/적게 쓰는 세션에 먼저 돌아감
+    - 에이징: 대기 시간 aging_seconds마다 우선순위 1단계 상승 (bulk 기아 방지)
+    - admission control: 대기 작업이 max_queued 이상이면 admit()이 QueueFull
+    """
+
+    def __init__(
+        self,
+        max_running: int = JOB_MAX_RUNNING,
+        max_queued: int = JOB_MAX_QUEUED,
+        llm_slots: int = LLM_MAX_CONCURRENCY,
+        aging_seconds: float = JOB_AGING_SECONDS,
+    ):
+        self._max_running = max_running
+        self._max_queued = max_queued
+        self._llm_slots = llm_slots
+        self._aging = aging_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_running, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._seq = itertools.count()
+        self._local = threading.local()
+
+        self._queue: list[_Job] = []
+        self._running: dict[str, int] = {}
+        self._running_total = 0
+
+        self._llm_free = llm_slots
+        self._llm_waiters: list[_SlotRequest] = []
+        self._llm_inflight: dict[str, int] = {}
+
+        self._metrics = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "queue_wait_seconds": 0.0,
+            "llm_calls": 0,
+            "llm_wait_seconds": 0.0,
+        }
+
+    # ── 작업 큐 ──
+
+    def queue_depth(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def admit(self) -> int:
+        """새 작업 수락 여부 확인. 반환: 현재 대기 작업 수 (가득 차면 QueueFull)"""
+        with self._lock:
+            depth = len(self._queue)
+            if depth >= self._max_queued:
+                self._metrics["rejected"] += 1
+                raise QueueFull(depth)
+            return depth
+
+    def submit(
+        self,
+        session_id: str,
+        fn: Callable,
+        *args,
+        priority: Priority = Priority.NORMAL,
+        on_queue: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        phase 작업 제출. 슬롯이 있으면 즉시, 없으면 우선순위 순으로 대기 후 실행.
+        on_queue(position, depth): 대기 순번(1부터) 변경 시 호출, 실행 시작 시 position=0.
+        """
+        job = _Job(next(self._seq), session_id, Priority(priority), fn, args, on_queue)
+        with self._lock:
+            self._queue.append(job)
+            self._metrics["submitted"] += 1
+        logger.info("Job submitted: session=%s, priority=%s", session_id, job.priority.name)
+        self._dispatch()
+
+    def cancel(self, session_id: str) -> int:
+        """세션의 대기 중(미시작) 작업 제거. 반환: 제거된 작업 수 (실행 중 작업은 토큰으로 취소)"""
+        with self._lock:
+            dropped = [j for j in self._queue if j.session_id == session_id]
+            for job in dropped:
+                self._queue.remove(job)
+        if dropped:
+            logger.info("Queued jobs dropped: session=%s (%d)", session_id, len(dropped))
+            self._dispatch()
+        return len(dropped)
+
+    def _aged(self, priority: int, since: float, now: float) -> int:
+        return max(0, int(priority) - int((now - since) / self._aging))
+
+    def _job_order(self, now: float):
+        return lambda j: (
+            self._aged(j.priority, j.since, now),
+            self._running.get(j.session_id, 0),
+            j.seq,
+        )
+
+    def _dispatch(self):
+        """실행 슬롯이 비는 만큼 대기 작업 시작 + 대기 순번 통지"""
+        started = []
+        with self._lock:
+            now = time.monotonic()
+            while self._queue and self._running_total < self._max_running:
+                job = min(self._queue, key=self._job_order(now))
+                self._queue.remove(job)
+                self._running_total += 1
+                self._running[job.session_id] = self._running.get(job.session_id, 0) + 1
+                self._metrics["queue_wait_seconds"] += now - job.since
+                started.append(job)
+            waiting = sorted(self._queue, key=self._job_order(now))
+            depth = len(waiting)
+
+        for job in started:
+            self._pool.submit(self._run, job)
+        for job in started:
+            self._notify(job, 0, depth)
+        for position, job in enumerate(waiting, start=1):
+            if job.position != position:
+                self._notify(job, position, depth)
+
+    @staticmethod
+    def _notify(job: _Job, position: int, depth: int):
+        job.position = position
+        if job.on_queue is None:
+            return
+        try:
+            job.on_queue(position, depth)
+        except Exception as e:
+            logger.warning("Queue notify failed (session=%s): %s", job.session_id, e)
+
+    def _run(self, job: _Job):
+        self._local.job = job
+        failed = False
+        try:
+            job.fn(*job.args)
+        except Exception as e:
+            failed = True
+            logger.error("Job failed (session=%s): %s", job.session_id, e, exc_info=True)
+        finally:
+            self._local.job = None
+            with self._lock:
+                self._running_total -= 1
+                remaining = self._running.get(job.session_id, 1) - 1
+                if remaining > 0:
+                    self._running[job.session_id] = remaining
+                else:
+                    self._running.pop(job.session_id, None)
+                self._metrics["failed" if failed else "completed"] += 1
+            self._dispatch()
+
+    # ── LLM 슬롯 ──
+
+    def _next_waiter(self, now: float) -> Optional[_SlotRequest]:
+        if not self._llm_waiters:
+            return None
+        return min(
+            self._llm_waiters,
+            key=lambda r: (
+                self._aged(r.priority, r.since, now),
+                self._llm_inflight.get(r.session_id, 0),
+                r.seq,
+            ),
+        )
+
+    def _wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    @contextmanager
+    def llm_slot(self, cancel_token=None):
+        """
+        LLM 호출 1회분 슬롯 확보. 스케줄러 작업 밖(Streamlit 등)에서는 제한 없이 통과.
+        대기 중 취소되면 cancel_token.raise_if_cancelled()로 즉시 중단.
+        """
+        job: Optional[_Job] = getattr(self._local, "job", None)
+        if job is None:
+            yield
+            return
+
+        request = _SlotRequest(next(self._seq), job.session_id, job.priority)
+        registered = cancel_token.add_callback(self._wake) if cancel_token is not None else False
+        try:
+            with self._cond:
+                self._llm_waiters.append(request)
+                try:
+                    while not (
+                        self._llm_free > 0
+                        and self._next_waiter(time.monotonic()) is request
+                    ):
+                        if cancel_token is not None:
+                            cancel_token.raise_if_cancelled()
+                        # 에이징 반영을 위해 주기적으로 재평가
+                        self._cond.wait(timeout=self._aging)
+                finally:
+                    self._llm_waiters.remove(request)
+                    self._cond.notify_all()
+                self._llm_free -= 1
+                self._llm_inflight[job.session_id] = self._llm_inflight.get(job.session_id, 0) + 1
+                self._metrics["llm_calls"] += 1
+                self._metrics["llm_wait_seconds"] += time.monotonic() - request.since
+        finally:
+            if registered:
+                cancel_token.remove_callback(self._wake)
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._llm_free += 1
+                remaining = self._llm_inflight.get(job.session_id, 1) - 1
+                if remaining > 0:
+                    self._llm_inflight[job.session_id] = remaining
+                else:
+                    self._llm_inflight.pop(job.session_id, None)
+                self._cond.notify_all()
+
+    # ── 메트릭 ──
+
+    def metrics(self) -> dict:
+        """현재 대기열/실행/LLM 슬롯 현황 + 누적 카운터"""
+        with self._lock:
+            now = time.monotonic()
+            snapshot = dict(self._metrics)
+            snapshot["queue_wait_seconds"] = round(snapshot["queue_wait_seconds"], 3)
+            snapshot["llm_wait_seconds"] = round(snapshot["llm_wait_seconds"], 3)
+            snapshot.update({
+                "running": self._running_total,
+                "max_running": self._max_running,
+                "queued": [
+                    {
+                        "session_id": j.session_id,
+                        "priority": j.priority.name,
+                        "waiting_seconds": round(now - j.since, 1),
+                    }
+                    for j in sorted(self._queue, key=self._job_order(now))
+                ],
+                "max_queued": self._max_queued,
+                "llm_in_use": self._llm_slots - self._llm_free,
+                "llm_slots": self._llm_slots,
+                "llm_waiting": len(self._llm_waiters),
+            })
+        return snapshot
+
+
+# Singleton
+job_scheduler = JobScheduler()
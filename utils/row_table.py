@@ -0,0 +1,204 @@
+"""행 저장소 — 불변 컬럼 지향 RowTable + id 레지스트리 (state에는 id만 보관)"""
+
+import gzip
+import json
+import os
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.constants import REQUIRED_COLUMNS, SUPPORTED_LANGUAGES
+
+
+class RowTable:
+    """
+    로드 시점 시트 데이터의 불변 스냅샷 (컬럼별 tuple 저장).
+
+    행은 _row_index(= 시트 행 - 2)로 참조. 노드/라우트는 dict 복사본 대신
+    row_index와 컬럼명으로 값을 조회하고, 필요한 순간에만 dict 뷰를 만든다.
+    """
+
+    __slots__ = ("_columns", "_data", "_row_indices", "_pos", "_nbytes")
+
+    def __init__(self, columns: dict[str, list], row_indices: list[int]):
+        self._columns = tuple(columns)
+        self._data = {name: tuple(values) for name, values in columns.items()}
+        self._row_indices = tuple(int(ri) for ri in row_indices)
+        self._pos = {ri: i for i, ri in enumerate(self._row_indices)}
+        self._nbytes: Optional[int] = None
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "RowTable":
+        """DataFrame → RowTable (인덱스 = row_index)"""
+        return cls(
+            {col: df[col].tolist() for col in df.columns},
+            df.index.tolist(),
+        )
+
+    def __len__(self) -> int:
+        return len(self._row_indices)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._columns
+
+    @property
+    def row_indices(self) -> tuple[int, ...]:
+        return self._row_indices
+
+    @property
+    def nbytes(self) -> int:
+        """대략적인 메모리 사용량 (셀 문자열 + 컬럼 tuple + 인덱스 맵, 최초 1회 계산)"""
+        if self._nbytes is None:
+            total = sys.getsizeof(self._pos) + sys.getsizeof(self._row_indices)
+            for values in self._data.values():
+                total += sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+            self._nbytes = total
+        return self._nbytes
+
+    def __contains__(self, row_index) -> bool:
+        return row_index in self._pos
+
+    def column(self, name: str) -> tuple:
+        """컬럼 전체 값 (없으면 빈 문자열 tuple)"""
+        return self._data.get(name) or ("",) * len(self)
+
+    def value(self, row_index: int, column: str, default: str = ""):
+        pos = self._pos.get(row_index)
+        values = self._data.get(column)
+        if pos is None or values is None:
+            return default
+        return values[pos]
+
+    def row(self, row_index: int) -> dict:
+        """단일 행 dict 뷰 (_row_index 포함). 없는 행이면 빈 dict."""
+        pos = self._pos.get(row_index)
+        if pos is None:
+            return {}
+        view = {name: self._data[name][pos] for name in self._columns}
+        view["_row_index"] = row_index
+        return view
+
+    def positions(self, row_indices: Iterable) -> np.ndarray:
+        """row_index 목록 → 컬럼 배열 위치 (없는 행은 -1) — 결과 목록을 컬럼과 정렬할 때"""
+        pos = self._pos
+        return np.fromiter(
+            (pos.get(ri, -1) for ri in row_indices), dtype=np.int64
+        )
+
+    def array(self, name: str) -> np.ndarray:
+        """컬럼 값 object 배열 (없는 컬럼이면 빈 문자열) — 벡터 비교/인덱싱용"""
+        values = np.empty(len(self), dtype=object)
+        values[:] = self.column(name)
+        return values
+
+    def iter_rows(self, *columns: str) -> Iterator[tuple]:
+        """(row_index, col1, col2, ...) 순회 — dict 생성 없이 필요한 컬럼만"""
+        return zip(self._row_indices, *(self.column(c) for c in columns))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """로드 시점 DataFrame 재구성 (백업/커밋 검증용)"""
+        return pd.DataFrame(
+            {name: list(self._data[name]) for name in self._columns},
+            index=list(self._row_indices),
+            columns=list(self._columns),
+        )
+
+    # ── 직렬화 (디스크 보관) ──
+
+    def to_payload(self) -> dict:
+        return {
+            "columns": list(self._columns),
+            "data": {name: list(values) for name, values in self._data.items()},
+            "row_indices": list(self._row_indices),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "RowTable":
+        data = payload["data"]
+        return cls(
+            {name: data[name] for name in payload["columns"]},
+            payload["row_indices"],
+        )
+
+
+def with_row_context(results: list[dict], table: RowTable) -> list[dict]:
+    """
+    review 결과에 원문/기존 번역을 붙인 표시용 사본.
+    state에는 row_index만 저장하고, SSE/API 응답 시점에만 보강한다.
+    """
+    ko_col = REQUIRED_COLUMNS["korean"]
+    enriched = []
+    for r in results:
+        ri = r.get("row_index")
+        enriched.append({
+            **r,
+            "original_ko": table.value(ri, ko_col),
+            "old_translation": table.value(ri, SUPPORTED_LANGUAGES.get(r.get("lang", ""), "")),
+        })
+    return enriched
+
+
+# ── 레지스트리 ──────────────────────────────────────────────────────
+# 메모리 캐시 + 디스크(gzip JSON) 보관 — 프로세스 재시작 후 체크포인트에서
+# 재개해도 row_table_id로 같은 스냅샷을 다시 찾을 수 있다.
+
+_tables: dict[str, RowTable] = {}
+_tables_lock = threading.Lock()
+
+
+def _table_path(table_id: str) -> Path:
+    from backend.config import get_row_store_dir
+
+    return Path(get_row_store_dir()) / f"{table_id}.json.gz"
+
+
+def register_row_table(table: RowTable) -> str:
+    """RowTable 등록 + 디스크 저장. 반환: row_table_id"""
+    table_id = uuid.uuid4().hex
+    path = _table_path(table_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(table.to_payload(), f, ensure_ascii=False)
+    os.replace(tmp, path)
+    with _tables_lock:
+        _tables[table_id] = table
+    return table_id
+
+
+def get_row_table(table_id: str) -> RowTable:
+    """row_table_id → RowTable (메모리 미스 시 디스크에서 로드)"""
+    with _tables_lock:
+        table = _tables.get(table_id)
+    if table is not None:
+        return table
+
+    path = _table_path(table_id)
+    if not table_id or not path.exists():
+        raise ValueError(f"Row table not found: {table_id}")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        table = RowTable.from_payload(json.load(f))
+    with _tables_lock:
+        return _tables.setdefault(table_id, table)
+
+
+def peek_row_table(table_id: str) -> Optional[RowTable]:
+    """메모리에 올라와 있는 경우에만 반환 (디스크 로드 없음 — 메모리 측정용)"""
+    with _tables_lock:
+        return _tables.get(table_id)
+
+
+def release_row_table(table_id: str, delete: bool = True):
+    """메모리에서 해제 (delete=True면 디스크 파일도 삭제)"""
+    if not table_id:
+        return
+    with _tables_lock:
+        _tables.pop(table_id, None)
+    if delete:
+        _table_path(table_id).unlink(missing_ok=True)
@@ -1,46 +1,31 @@
-"""Google Sheets 유틸리티 — gspread Batch Read/Write + Exponential Backoff"""
+"""Google Sheets 유틸리티 — gspread Batch Read/Write (SheetsScheduler 경유)"""
 
 import io
 import logging
 import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable, Optional
 
 import gspread
 import pandas as pd
 from google.oauth2.service_account import Credentials
 
 from backend.config import get_gcp_credentials
-from config.constants import FORBIDDEN_SHEETS, REQUIRED_COLUMNS, TOOL_STATUS_COLUMN
+from config.constants import (
+    COMMIT_BATCH_CELLS,
+    FORBIDDEN_SHEETS,
+    REQUIRED_COLUMNS,
+    SHEET_METADATA_TTL,
+    TOOL_FINGERPRINT_COLUMN,
+    TOOL_STATUS_COLUMN,
+)
+from utils.sheets_scheduler import sheets_scheduler
 
 logger = logging.getLogger("devlocal.sheets")
 
-# ── Retry 설정 ────────────────────────────────────────────────────────
-
-MAX_RETRIES = 5
-BASE_DELAY = 1  # seconds
-
-
-def _retry_with_backoff(fn, *args, **kwargs):
-    """Exponential backoff wrapper for gspread API calls."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            return fn(*args, **kwargs)
-        except gspread.exceptions.APIError as e:
-            status = e.response.status_code if hasattr(e, "response") else 0
-            if status == 429 or status >= 500:
-                delay = BASE_DELAY * (2 ** attempt)
-                logger.warning(
-                    "API rate limit/error (attempt %d/%d), retrying in %ds: %s",
-                    attempt + 1, MAX_RETRIES, delay, e,
-                )
-                time.sleep(delay)
-            else:
-                raise
-    return fn(*args, **kwargs)  # final attempt without catch
-
-
 # ── 인증 및 연결 ──────────────────────────────────────────────────────
 
 _SCOPES = [
@@ -56,10 +41,79 @@ def _get_client() -> gspread.Client:
     return gspread.authorize(credentials)
 
 
-def connect_to_sheet(url: str) -> gspread.Spreadsheet:
-    """스프레드시트 URL로 연결."""
+# ── 메타데이터 캐시 ───────────────────────────────────────────────────
+# spreadsheet ID → {"fetched_at", "spreadsheet", "title", "worksheets", "sheets"}
+# /connect에서 채운 항목을 /start가 재사용 (open_by_url + worksheet() 재조회 생략)
+
+_metadata_cache: dict[str, dict] = {}
+_metadata_lock = threading.Lock()
+
+
+def _get_cached(spreadsheet_id: str) -> Optional[dict]:
+    with _metadata_lock:
+        entry = _metadata_cache.get(spreadsheet_id)
+        if entry and time.monotonic() - entry["fetched_at"] < SHEET_METADATA_TTL:
+            return entry
+        return None
+
+
+def _cache_metadata(spreadsheet: gspread.Spreadsheet) -> dict:
+    """worksheets()로 시트 목록/ID/그리드 크기를 1회 조회하여 캐시."""
+    worksheets = sheets_scheduler.read(spreadsheet.worksheets)
+    entry = {
+        "fetched_at": time.monotonic(),
+        "spreadsheet": spreadsheet,
+        "title": spreadsheet.title,
+        "worksheets": {ws.title: ws for ws in worksheets},
+        "sheets": [
+            {
+                "title": ws.title,
+                "sheet_id": ws.id,
+                "rows": ws.row_count,
+                "cols": ws.col_count,
+            }
+            for ws in worksheets
+        ],
+    }
+    with _metadata_lock:
+        _metadata_cache[spreadsheet.id] = entry
+    return entry
+
+
+def _metadata_for(spreadsheet: gspread.Spreadsheet) -> dict:
+    return _get_cached(spreadsheet.id) or _cache_metadata(spreadsheet)
+
+
+def invalidate_sheet_metadata(spreadsheet_id: Optional[str] = None) -> None:
+    """메타데이터 캐시 무효화. ID 생략 시 전체 삭제."""
+    with _metadata_lock:
+        if spreadsheet_id is None:
+            _metadata_cache.clear()
+        else:
+            _metadata_cache.pop(spreadsheet_id, None)
+
+
+def get_sheet_metadata(spreadsheet: gspread.Spreadsheet) -> dict:
+    """캐시된 메타데이터 반환: {"title", "sheets": [{title, sheet_id, rows, cols}]}"""
+    entry = _metadata_for(spreadsheet)
+    return {"title": entry["title"], "sheets": list(entry["sheets"])}
+
+
+def connect_to_sheet(url: str, refresh: bool = False) -> gspread.Spreadsheet:
+    """
+    스프레드시트 URL로 연결.
+    TTL 내 재호출은 캐시된 Spreadsheet 재사용, refresh=True면 캐시 무시 후 재조회.
+    """
+    spreadsheet_id = gspread.utils.extract_id_from_url(url)
+    if refresh:
+        invalidate_sheet_metadata(spreadsheet_id)
+    cached = _get_cached(spreadsheet_id)
+    if cached:
+        return cached["spreadsheet"]
     client = _get_client()
-    return _retry_with_backoff(client.open_by_url, url)
+    spreadsheet = sheets_scheduler.read(client.open_by_url, url)
+    _cache_metadata(spreadsheet)
+    return spreadsheet
 
 
 def get_bot_email() -> str:
@@ -70,50 +124,94 @@ def get_bot_email() -> str:
 
 def extract_project_name(spreadsheet: gspread.Spreadsheet) -> str:
     """스프레드시트 제목에서 프로젝트명 추출."""
-    return spreadsheet.title
+    return _metadata_for(spreadsheet)["title"]
 
 
 def get_worksheet_names(spreadsheet: gspread.Spreadsheet) -> list[str]:
     """시트 이름 목록 반환 (FORBIDDEN_SHEETS 제외)."""
-    worksheets = _retry_with_backoff(spreadsheet.worksheets)
     return [
-        ws.title
-        for ws in worksheets
-        if ws.title not in FORBIDDEN_SHEETS
+        s["title"]
+        for s in _metadata_for(spreadsheet)["sheets"]
+        if s["title"] not in FORBIDDEN_SHEETS
     ]
 
 
+def get_worksheet(spreadsheet: gspread.Spreadsheet, name: str) -> gspread.Worksheet:
+    """이름으로 Worksheet 반환 — 캐시 미스 시 메타데이터 1회 재조회."""
+    ws = _metadata_for(spreadsheet)["worksheets"].get(name)
+    if ws is None:
+        ws = _cache_metadata(spreadsheet)["worksheets"].get(name)
+    if ws is None:
+        raise gspread.exceptions.WorksheetNotFound(name)
+    return ws
+
+
 # ── 데이터 로드 ──────────────────────────────────────────────────────
 
 def load_sheet_data(worksheet: gspread.Worksheet) -> pd.DataFrame:
     """시트 전체를 1회 벌크 로드 → DataFrame 변환."""
-    records = _retry_with_backoff(worksheet.get_all_records)
+    records = sheets_scheduler.read(worksheet.get_all_records)
     df = pd.DataFrame(records)
     # 빈 문자열 → NaN 변환하지 않음 (원본 보존)
     return df
 
 
+def _append_header_column(worksheet: gspread.Worksheet, df: pd.DataFrame, name: str) -> int:
+    """시트+DataFrame 끝에 헤더 컬럼 추가 (그리드 부족 시 열 확장). 반환: 1-based 컬럼 번호."""
+    df[name] = ""
+    col_idx = len(df.columns)
+    if col_idx > worksheet.col_count:
+        sheets_scheduler.write(worksheet.add_cols, col_idx - worksheet.col_count)
+        invalidate_sheet_metadata(worksheet.spreadsheet.id)
+    sheets_scheduler.write(worksheet.update_cell, 1, col_idx, name)
+    logger.info("%s 컬럼 추가 (col %d)", name, col_idx)
+    return col_idx
+
+
 def ensure_tool_status_column(
     worksheet: gspread.Worksheet, df: pd.DataFrame
 ) -> pd.DataFrame:
     """Tool_Status 컬럼 없으면 시트+DataFrame 양쪽에 추가."""
     if TOOL_STATUS_COLUMN not in df.columns:
-        df[TOOL_STATUS_COLUMN] = ""
-        # 시트에도 헤더 추가
-        col_idx = len(df.columns)
-        _retry_with_backoff(
-            worksheet.update_cell, 1, col_idx, TOOL_STATUS_COLUMN
+        _append_header_column(worksheet, df, TOOL_STATUS_COLUMN)
+    return df
+
+
+def ensure_fingerprint_column(
+    worksheet: gspread.Worksheet, df: pd.DataFrame
+) -> pd.DataFrame:
+    """Tool_Fingerprint 컬럼 없으면 시트+DataFrame 양쪽에 추가 후 시트에서 숨김."""
+    if TOOL_FINGERPRINT_COLUMN not in df.columns:
+        col_idx = _append_header_column(worksheet, df, TOOL_FINGERPRINT_COLUMN)
+        sheets_scheduler.write(
+            worksheet.spreadsheet.batch_update,
+            {"requests": [{
+                "updateDimensionProperties": {
+                    "range": {
+                        "sheetId": worksheet.id,
+                        "dimension": "COLUMNS",
+                        "startIndex": col_idx - 1,
+                        "endIndex": col_idx,
+                    },
+                    "properties": {"hiddenByUser": True},
+                    "fields": "hiddenByUser",
+                }
+            }]},
         )
-        logger.info("Tool_Status 컬럼 추가 (col %d)", col_idx)
     return df
 
 
 # ── 백업 ─────────────────────────────────────────────────────────────
 
+def backup_filename(sheet_name: str) -> str:
+    """백업 파일명 — backup_<시트>_<시각>.csv"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"backup_{sheet_name}_{timestamp}.csv"
+
+
 def create_backup_csv(df: pd.DataFrame, sheet_name: str) -> tuple[str, bytes]:
     """DataFrame → (파일명, CSV bytes) 반환. UTF-8-SIG 인코딩."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"backup_{sheet_name}_{timestamp}.csv"
+    filename = backup_filename(sheet_name)
     buf = io.BytesIO()
     df.to_csv(buf, index=False, encoding="utf-8-sig")
     return filename, buf.getvalue()
@@ -124,9 +222,7 @@ def save_backup_to_folder(
 ) -> str:
     """백업 CSV를 로컬 폴더에 저장. 반환: 파일 경로."""
     Path(folder).mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"backup_{sheet_name}_{timestamp}.csv"
-    filepath = os.path.join(folder, filename)
+    filepath = os.path.join(folder, backup_filename(sheet_name))
     df.to_csv(filepath, index=False, encoding="utf-8-sig")
     logger.info("백업 저장: %s", filepath)
     return filepath
@@ -164,7 +260,7 @@ def batch_update_sheet(
         cells.append(gspread.Cell(sheet_row, col_idx, u["value"]))
 
     if cells:
-        _retry_with_backoff(worksheet.update_cells, cells)
+        sheets_scheduler.write(worksheet.update_cells, cells)
         logger.info("Batch update: %d cells", len(cells))
 
 
@@ -227,8 +323,287 @@ def batch_format_cells(
         })
 
     if requests:
-        _retry_with_backoff(
+        sheets_scheduler.write(
             worksheet.spreadsheet.batch_update,
             {"requests": requests},
         )
         logger.info("Batch format: %d cells", len(requests))
+
+
+# ── 커밋 전 낙관적 동시성 검증 ───────────────────────────────────────
+
+_TOOL_COLUMNS = (TOOL_STATUS_COLUMN, TOOL_FINGERPRINT_COLUMN)
+
+
+def _col_letter(col_idx: int) -> str:
+    """1-based 컬럼 번호 → A1 열 문자"""
+    return gspread.utils.rowcol_to_a1(1, col_idx).rstrip("0123456789")
+
+
+# 대상 셀 검증 시 batchGet 1회당 범위 수 (요청 URL 길이 제한)
+_VERIFY_RANGES_PER_READ = 200
+
+
+def _cell_text(value) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _sheet_text(value) -> str:
+    """
+    시트 셀 값(FORMATTED_VALUE 문자열) → 로드 시점 DataFrame과 같은 표현.
+    load_sheet_data의 get_all_records가 숫자 문자열을 숫자로 바꾸므로 ("007" → 7) 동일하게 변환
+    """
+    return _cell_text(gspread.utils.numericise(_cell_text(value)))
+
+
+def _range_value(value_range, row: int, col: int = 0) -> str:
+    """ValueRange의 (row, col) 셀 값 — 끝의 빈 행/셀은 API가 생략함"""
+    if row < len(value_range) and col < len(value_range[row]):
+        return _sheet_text(value_range[row][col])
+    return ""
+
+
+def _row_runs(rows) -> list[tuple[int, int]]:
+    """정렬된 행 번호 → 연속 구간 [(first, last), ...]"""
+    runs: list[tuple[int, int]] = []
+    for r in sorted(rows):
+        if runs and r == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], r)
+        else:
+            runs.append((r, r))
+    return runs
+
+
+def verify_updates_before_commit(
+    worksheet: gspread.Worksheet,
+    updates: list[dict],
+    df: pd.DataFrame,
+    committed_rows: Iterable[int] = (),
+) -> tuple[list[dict], dict]:
+    """
+    로드 이후 사람이 시트를 수정했는지 커밋 직전에 확인 (전체 재로드 없음).
+
+    1. 헤더 행 + Key 컬럼만 ranged read (1회) → 로드 시점 Key와 위치 비교.
+       행이 이동했으면 현재 시트에서 유일한 Key 위치로 재매핑, 사라졌거나
+       중복이면 해당 행 스킵. 커밋이 쓰는 컬럼(+ Key/Korean)의 헤더가 바뀌었으면
+       컬럼 위치를 신뢰할 수 없으므로 중단 (로드 시점에 없던 컬럼은 commit_updates처럼 무시).
+    2. 대상 행의 연속 구간만 ranged read (batchGet) → 로드 시점 값과 다르면
+       (원문 수정 또는 사람이 번역 입력) 해당 행 업데이트 스킵.
+       시트 값은 로드 때와 같은 숫자 변환을 거쳐 비교 ("007"/"1.0"을 수정으로 오판하지 않음).
+
+    df: 로드 시점 DataFrame (인덱스 = row_index)
+    committed_rows: 같은 승인의 이전 시도에서 이미 반영된 행 (로드 시점 row_index,
+        PartialCommitError.committed_rows) — 검증/커밋 대상에서 빼고 already_committed로 집계
+        (로드 시점 값과 달라진 이유가 사람의 수정이 아니므로 skipped_rows에 넣지 않음)
+    반환: (검증/재매핑된 updates — loaded_row_index에 로드 시점 row_index, report)
+    """
+    report = {"checked_rows": 0, "moved_rows": 0, "skipped_rows": [], "already_committed": 0}
+    committed = set(committed_rows)
+    if committed:
+        report["already_committed"] = len({u["row_index"] for u in updates} & committed)
+        updates = [u for u in updates if u["row_index"] not in committed]
+    if not updates:
+        return updates, report
+
+    columns = list(df.columns)
+    key_col = REQUIRED_COLUMNS["key"]
+    ko_col = REQUIRED_COLUMNS["korean"]
+    key_letter = _col_letter(columns.index(key_col) + 1)
+
+    header_range, key_range = sheets_scheduler.read(
+        worksheet.batch_get, ["1:1", f"{key_letter}2:{key_letter}"]
+    )
+    header = [_cell_text(h) for h in (header_range[0] if header_range else [])]
+    written_cols = {u["column_name"] for u in updates if u["column_name"] in columns}
+    for name in written_cols | {key_col, ko_col}:
+        idx = columns.index(name)
+        if idx >= len(header) or header[idx] != name:
+            raise ValueError(
+                f"시트 구조가 로드 이후 변경되었습니다 (컬럼 '{name}'). 다시 불러온 뒤 진행하세요."
+            )
+
+    current_keys = [_range_value(key_range, i) for i in range(len(key_range))]
+    loaded_keys = {
+        ri: _cell_text(df.at[ri, key_col]) if ri in df.index else ""
+        for ri in {u["row_index"] for u in updates}
+    }
+    key_positions: dict[str, list[int]] = {}
+    for pos, k in enumerate(current_keys):
+        key_positions.setdefault(k, []).append(pos)
+
+    # 1. Key 기준 위치 검증 / 재매핑
+    row_map: dict[int, int] = {}  # 로드 시점 row_index → 현재 row_index
+    skipped: dict[int, str] = {}
+    for ri, loaded_key in loaded_keys.items():
+        if ri < len(current_keys) and current_keys[ri] == loaded_key:
+            row_map[ri] = ri
+            continue
+        positions = key_positions.get(loaded_key, [])
+        if loaded_key and len(positions) == 1:
+            row_map[ri] = positions[0]
+            report["moved_rows"] += 1
+        else:
+            skipped[ri] = loaded_key
+    report["checked_rows"] = len(row_map) + len(skipped)
+
+    # 2. 대상 셀 ranged read — 대상 행의 연속 구간 × (검증 컬럼 첫~끝 열), batchGet 묶음 단위
+    check_cols = sorted(
+        {c for c in written_cols if c not in _TOOL_COLUMNS} | {ko_col},
+        key=columns.index,
+    )
+    if row_map:
+        col_first = columns.index(check_cols[0])
+        col_span = f"{_col_letter(col_first + 1)}{{}}:{_col_letter(columns.index(check_cols[-1]) + 1)}{{}}"
+        runs = _row_runs(row_map.values())
+        current: dict[int, tuple] = {}  # 현재 row_index → (구간 ValueRange, 구간 내 offset)
+        for start in range(0, len(runs), _VERIFY_RANGES_PER_READ):
+            batch = runs[start:start + _VERIFY_RANGES_PER_READ]
+            ranges = [col_span.format(a + 2, b + 2) for a, b in batch]
+            for (a, b), value_range in zip(batch, sheets_scheduler.read(worksheet.batch_get, ranges)):
+                for r in range(a, b + 1):
+                    current[r] = (value_range, r - a)
+        for ri, cur in list(row_map.items()):
+            value_range, offset = current[cur]
+            for c in check_cols:
+                sheet_value = _range_value(value_range, offset, columns.index(c) - col_first)
+                if sheet_value != _cell_text(df.at[ri, c]):
+                    skipped[ri] = loaded_keys[ri]
+                    del row_map[ri]
+                    break
+
+    verified = [
+        {**u, "row_index": row_map[u["row_index"]], "loaded_row_index": u["row_index"]}
+        for u in updates
+        if u["row_index"] in row_map
+    ]
+    report["skipped_rows"] = sorted(set(skipped.values()))
+    if skipped or report["moved_rows"]:
+        logger.warning(
+            "Pre-commit check: %d rows moved, %d rows skipped (edited since load)",
+            report["moved_rows"], len(skipped),
+        )
+    return verified, report
+
+
+# ── Combined Commit (값 + 서식, 행 단위 batchUpdate) ─────────────────
+
+class PartialCommitError(Exception):
+    """
+    행 단위 배치 중 일부만 반영된 뒤 실패.
+    report: 반영된 배치까지의 집계, committed_rows: 반영된 행 (로드 시점 row_index) —
+    재시도 시 verify_updates_before_commit(committed_rows=...)로 전달
+    """
+
+    def __init__(self, cause: Exception, report: dict, committed_rows: list[int]):
+        super().__init__(
+            f"시트에 일부만 반영된 상태로 실패했습니다 ({report['cells']}셀, "
+            f"{report['batches']}/{report['batches_total']} 배치 반영): {cause}"
+        )
+        self.report = report
+        self.committed_rows = committed_rows
+
+
+def commit_updates(
+    worksheet: gspread.Worksheet,
+    updates: list[dict],
+    df: pd.DataFrame,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    batch_cells: int = COMMIT_BATCH_CELLS,
+) -> dict:
+    """
+    값 업데이트와 배경색 서식을 행 단위로 묶은 spreadsheets.batchUpdate로 반영.
+
+    셀마다 updateCells 요청 1개 (userEnteredValue + backgroundColor)를 만들고,
+    batch_cells개 이하가 되도록 행 단위로 나눠 순서대로 전송. batchUpdate 1회는
+    전체 적용 또는 전체 거부이고 한 행의 셀은 같은 요청에 들어가므로, 중간에 실패해도
+    값만 쓰이고 서식/Tool_Status가 누락된 반쪽 행은 남지 않음. 다만 커밋 전체가 원자적이지는
+    않음 — 앞선 배치가 반영된 뒤 실패하면 PartialCommitError (반영된 행 목록 포함)를 던짐.
+
+    같은 셀에 대한 중복 업데이트는 마지막 값이 우선 (update_cells와 동일).
+    on_progress(written, total): 배치 전송 성공마다 누적 셀 수.
+    반환: {"committed": bool, "cells": int, "formatted": int, "skipped": int,
+           "batches": int, "batches_total": int}
+    """
+    report = {
+        "committed": False, "cells": 0, "formatted": 0, "skipped": 0,
+        "batches": 0, "batches_total": 0,
+    }
+    if not updates:
+        report["committed"] = True
+        return report
+
+    columns = list(df.columns)
+    sheet_id = worksheet.id
+
+    # sheet_row → {col: (value, color)} — 마지막 업데이트 우선
+    rows: dict[int, dict[int, tuple[str, Optional[dict]]]] = {}
+    # sheet_row → 로드 시점 row_index (재매핑 전 — 부분 반영 시 재시도 제외용)
+    sources: dict[int, int] = {}
+    for u in updates:
+        col_name = u["column_name"]
+        if col_name not in columns:
+            report["skipped"] += 1
+            continue
+        sheet_row = u["row_index"] + 1  # 0-based (헤더 제외, API는 0-based)
+        col_idx = columns.index(col_name)
+        color = _COLOR_MAP.get(u.get("change_type", ""))
+        rows.setdefault(sheet_row, {})[col_idx] = (u["value"], color)
+        sources[sheet_row] = u.get("loaded_row_index", u["row_index"])
+
+    batches: list[list[dict]] = [[]]
+    batch_rows: list[list[int]] = [[]]
+    for sheet_row, cells in rows.items():
+        if batches[-1] and len(batches[-1]) + len(cells) > batch_cells:
+            batches.append([])
+            batch_rows.append([])
+        batch_rows[-1].append(sources[sheet_row])
+        for col_idx, (value, color) in cells.items():
+            cell_data = {"userEnteredValue": {"stringValue": str(value)}}
+            fields = "userEnteredValue"
+            if color:
+                cell_data["userEnteredFormat"] = {"backgroundColor": color}
+                fields += ",userEnteredFormat.backgroundColor"
+                report["formatted"] += 1
+
+            batches[-1].append({
+                "updateCells": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": sheet_row,
+                        "endRowIndex": sheet_row + 1,
+                        "startColumnIndex": col_idx,
+                        "endColumnIndex": col_idx + 1,
+                    },
+                    "rows": [{"values": [cell_data]}],
+                    "fields": fields,
+                }
+            })
+
+    total = sum(len(b) for b in batches)
+    report["batches_total"] = sum(1 for b in batches if b)
+    committed_rows: list[int] = []
+    for requests, source_rows in zip(batches, batch_rows):
+        if not requests:
+            continue
+        try:
+            sheets_scheduler.write(
+                worksheet.spreadsheet.batch_update,
+                {"requests": requests},
+            )
+        except Exception as e:
+            if not committed_rows:
+                raise
+            logger.error("Commit failed after %d/%d batches (%d cells written)",
+                         report["batches"], report["batches_total"], report["cells"])
+            raise PartialCommitError(e, report, committed_rows) from e
+        committed_rows.extend(source_rows)
+        report["cells"] += len(requests)
+        report["batches"] += 1
+        if on_progress is not None:
+            on_progress(report["cells"], total)
+    report["committed"] = True
+    logger.info(
+        "Commit: %d cells (%d formatted) in %d batchUpdate(s)",
+        report["cells"], report["formatted"], report["batches"],
+    )
+    return report
@@ -0,0 +1,178 @@
+"""Google Sheets API 스케줄러 — 프로세스 공용 read/write 쿼터 버킷 + Jitter Backoff"""
+
+import logging
+import random
+import threading
+import time
+
+import gspread
+
+from config.constants import (
+    SHEETS_READ_QUOTA_PER_MIN,
+    SHEETS_RETRY_BUDGET_MAX,
+    SHEETS_RETRY_BUDGET_RATIO,
+    SHEETS_WRITE_QUOTA_PER_MIN,
+)
+
+logger = logging.getLogger("devlocal.sheets")
+
+MAX_RETRIES = 5
+BASE_DELAY = 1  # seconds
+MAX_DELAY = 32  # seconds
+
+
+class RetryBudgetExceeded(Exception):
+    """재시도 예산 소진 — 429/5xx가 누적되어 즉시 실패 처리"""
+
+
+class _TokenBucket:
+    """분당 쿼터 기반 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0  # tokens/sec
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """토큰 1개 확보까지 대기. 반환: 대기한 시간 (초)"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def drain(self):
+        """429 수신 시 버킷 비움 — 다른 스레드도 다음 refill까지 대기"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, 0.0)
+
+
+class SheetsScheduler:
+    """
+    모든 Sheets API 호출이 거치는 프로세스 공용 스케줄러.
+
+    - read/write 분리 토큰 버킷 (분당 쿼터 사전 준수)
+    - 429/5xx 시 full-jitter exponential backoff (세션 간 lockstep 재시도 방지)
+    - 재시도 예산: 성공마다 RATIO만큼 적립, 재시도마다 1 소모. 소진 시 즉시 실패
+    - 메트릭: 호출/재시도 수, 쿼터 대기 + backoff 누적 시간
+    """
+
+    def __init__(
+        self,
+        read_per_min: int = SHEETS_READ_QUOTA_PER_MIN,
+        write_per_min: int = SHEETS_WRITE_QUOTA_PER_MIN,
+        budget_max: float = SHEETS_RETRY_BUDGET_MAX,
+        budget_ratio: float = SHEETS_RETRY_BUDGET_RATIO,
+    ):
+        self._buckets = {
+            "read": _TokenBucket(read_per_min),
+            "write": _TokenBucket(write_per_min),
+        }
+        self._budget_max = float(budget_max)
+        self._budget_ratio = budget_ratio
+        self._budget = float(budget_max)
+        self._lock = threading.Lock()
+        self._metrics = {
+            kind: {
+                "calls": 0,
+                "retries": 0,
+                "failures": 0,
+                "quota_wait_seconds": 0.0,
+                "backoff_seconds": 0.0,
+            }
+            for kind in self._buckets
+        }
+        self._budget_exhausted = 0
+
+    # ── 공개 API ──
+
+    def read(self, fn, *args, **kwargs):
+        return self.call("read", fn, *args, **kwargs)
+
+    def write(self, fn, *args, **kwargs):
+        return self.call("write", fn, *args, **kwargs)
+
+    def call(self, kind: str, fn, *args, **kwargs):
+        """kind 버킷의 토큰을 확보한 뒤 fn 실행, 429/5xx는 jitter backoff로 재시도."""
+        bucket = self._buckets[kind]
+        stats = self._metrics[kind]
+
+        for attempt in range(MAX_RETRIES + 1):
+            waited = bucket.acquire()
+            with self._lock:
+                stats["calls"] += 1
+                stats["quota_wait_seconds"] += waited
+            try:
+                result = fn(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = e.response.status_code if hasattr(e, "response") else 0
+                if not (status == 429 or status >= 500) or attempt == MAX_RETRIES:
+                    with self._lock:
+                        stats["failures"] += 1
+                    raise
+                if status == 429:
+                    bucket.drain()
+                if not self._spend_retry():
+                    with self._lock:
+                        stats["failures"] += 1
+                    raise RetryBudgetExceeded(
+                        f"Sheets API retry budget exhausted ({kind}): {e}"
+                    ) from e
+
+                delay = random.uniform(0, min(MAX_DELAY, BASE_DELAY * (2 ** attempt)))
+                logger.warning(
+                    "Sheets %s %d (attempt %d/%d), retrying in %.2fs: %s",
+                    kind, status, attempt + 1, MAX_RETRIES, delay, e,
+                )
+                with self._lock:
+                    stats["retries"] += 1
+                    stats["backoff_seconds"] += delay
+                time.sleep(delay)
+            else:
+                self._earn_retry()
+                return result
+
+    def metrics(self) -> dict:
+        """누적 메트릭 스냅샷 (throttled_seconds = 쿼터 대기 + backoff)"""
+        with self._lock:
+            snapshot = {kind: dict(stats) for kind, stats in self._metrics.items()}
+            for stats in snapshot.values():
+                stats["throttled_seconds"] = round(
+                    stats["quota_wait_seconds"] + stats["backoff_seconds"], 3
+                )
+                stats["quota_wait_seconds"] = round(stats["quota_wait_seconds"], 3)
+                stats["backoff_seconds"] = round(stats["backoff_seconds"], 3)
+            snapshot["retry_budget"] = round(self._budget, 2)
+            snapshot["retry_budget_exhausted"] = self._budget_exhausted
+        return snapshot
+
+    # ── 재시도 예산 ──
+
+    def _spend_retry(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                self._budget_exhausted += 1
+                return False
+            self._budget -= 1
+            return True
+
+    def _earn_retry(self):
+        with self._lock:
+            self._budget = min(self._budget_max, self._budget + self._budget_ratio)
+
+
+# Singleton
+sheets_scheduler = SheetsScheduler()